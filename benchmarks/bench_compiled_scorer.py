@@ -0,0 +1,69 @@
+"""
+=====================================
+Benchmark of the single-row fast path
+=====================================
+
+Compare the latency of scoring a single sample with
+``CompiledScorer.score_one``, which snapshots the fitted parameters and skips
+input validation, with that of ``anomaly_score``, which validates the input on
+each call.
+
+Usage::
+
+    python benchmarks/bench_compiled_scorer.py
+"""
+
+import time
+
+import numpy as np
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import (
+    GMM, HBOS, MiniBatchKMeans, PCA, SparseStructureLearning
+)
+
+
+def percentiles(func, x, n_calls=10000):
+    elapsed = np.empty(n_calls)
+
+    for i in range(n_calls):
+        t0         = time.perf_counter()
+        func(x)
+        elapsed[i] = time.perf_counter() - t0
+
+    return 1e+06 * np.percentile(elapsed, [50., 99.])
+
+
+def bench(det, X):
+    det.fit(X)
+
+    scorer = det.compile()
+    x      = X[0]
+
+    return (
+        percentiles(scorer.score_one, x),
+        percentiles(lambda x: det.anomaly_score(x.reshape(1, -1)), x)
+    )
+
+
+if __name__ == '__main__':
+    X, _ = make_blobs(n_features=10, n_samples=1000, random_state=0)
+    dets = [
+        GMM(random_state=0),
+        HBOS(novelty=True),
+        MiniBatchKMeans(random_state=0),
+        PCA(n_components=2),
+        SparseStructureLearning()
+    ]
+
+    print(
+        f'{"detector":>24} {"p50 [us]":>9} {"p99 [us]":>9} '
+        f'{"p50 base [us]":>14} {"p99 base [us]":>14}'
+    )
+
+    for det in dets:
+        (p50, p99), (p50_base, p99_base) = bench(det, X)
+
+        print(
+            f'{det.__class__.__name__:>24} {p50:>9.1f} {p99:>9.1f} '
+            f'{p50_base:>14.1f} {p99_base:>14.1f}'
+        )
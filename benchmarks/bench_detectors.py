@@ -0,0 +1,183 @@
+"""
+==================================
+Benchmark of the outlier detectors
+==================================
+
+Time ``fit``, ``anomaly_score``, ``predict`` and
+``featurewise_anomaly_score`` of all the outlier detectors, and record the
+peak memory, on a grid of synthetic data sets of various sizes and on the
+bundled data sets.
+
+The suites follow the conventions of airspeed velocity (asv), so that they
+can be run with::
+
+    asv run
+
+They can also be run without asv by the standalone runner, which emits the
+results as JSON::
+
+    python benchmarks/run_benchmarks.py --output results.json
+"""
+
+from kenchi.datasets import (
+    load_pendigits, load_pima, load_wdbc, load_wilt, make_blobs
+)
+from kenchi.outlier_detection import (
+    Cascade, FastABOD, FeatureBagging, GMM, HBOS, IForest, KDE, KNN, LOF,
+    MiniBatchKMeans, OCSVM, OneTimeSampling, PCA, ScoreEnsemble,
+    SparseStructureLearning, SparseStructureLearningCV
+)
+from sklearn.model_selection import train_test_split
+
+DETECTORS  = {
+    'Cascade':                   (Cascade, {
+        'first': HBOS(novelty=True), 'second': KNN(novelty=True)
+    }),
+    'FastABOD':                  (FastABOD, {'novelty': True}),
+    'FeatureBagging':            (
+        FeatureBagging, {'novelty': True, 'random_state': 0}
+    ),
+    'GMM':                       (GMM, {'random_state': 0}),
+    'HBOS':                      (HBOS, {'novelty': True}),
+    'IForest':                   (IForest, {'random_state': 0}),
+    'KDE':                       (KDE, {}),
+    'KNN':                       (KNN, {'novelty': True}),
+    'LOF':                       (LOF, {'novelty': True}),
+    'MiniBatchKMeans':           (MiniBatchKMeans, {'random_state': 0}),
+    'OCSVM':                     (OCSVM, {}),
+    'OneTimeSampling':           (
+        OneTimeSampling, {'novelty': True, 'random_state': 0}
+    ),
+    'PCA':                       (PCA, {}),
+    'ScoreEnsemble':             (ScoreEnsemble, {'detectors': [
+        ('HBOS', HBOS(novelty=True)), ('IForest', IForest(random_state=0)),
+        ('KNN', KNN(novelty=True)), ('PCA', PCA())
+    ]}),
+    'SparseStructureLearning':   (SparseStructureLearning, {}),
+    'SparseStructureLearningCV': (SparseStructureLearningCV, {})
+}
+
+DATASETS   = {
+    'pendigits': (load_pendigits, {'random_state': 0}),
+    'pima':      (load_pima, {}),
+    'wdbc':      (load_wdbc, {'random_state': 0}),
+    'wilt':      (load_wilt, {})
+}
+
+N_SAMPLES  = [1000, 10000]
+N_FEATURES = [10, 100]
+
+
+def make_detector(name):
+    """Construct an outlier detector which can score new data."""
+
+    cls, params = DETECTORS[name]
+
+    return cls(**params)
+
+
+class _BlobsMixin:
+    """Synthetic data sets, whose training and test sets are both of size
+    ``n_samples``.
+    """
+
+    params      = [sorted(DETECTORS), N_SAMPLES, N_FEATURES]
+    param_names = ['detector', 'n_samples', 'n_features']
+
+    def load(self, n_samples, n_features):
+        X, _ = make_blobs(
+            n_features=n_features, n_samples=2 * n_samples, random_state=0
+        )
+
+        return train_test_split(X, random_state=0, test_size=0.5)
+
+
+class _DatasetMixin:
+    """Bundled data sets, which are split into halves."""
+
+    params      = [sorted(DETECTORS), sorted(DATASETS)]
+    param_names = ['detector', 'dataset']
+
+    def load(self, dataset):
+        load, params = DATASETS[dataset]
+        X, _         = load(return_X_y=True, **params)
+
+        return train_test_split(X, random_state=0, test_size=0.5)
+
+
+class _BaseSuite:
+    timeout = 600.
+
+    def setup(self, detector, *args):
+        self.X_train, self.X_test = self.load(*args)
+        self.det                  = make_detector(detector)
+
+
+class _FitSuite(_BaseSuite):
+    def time_fit(self, *args):
+        self.det.fit(self.X_train)
+
+    def peakmem_fit(self, *args):
+        self.det.fit(self.X_train)
+
+
+class _ScoreSuite(_BaseSuite):
+    def setup(self, detector, *args):
+        super().setup(detector, *args)
+
+        self.det.fit(self.X_train)
+
+    def time_anomaly_score(self, *args):
+        self.det.anomaly_score(self.X_test)
+
+    def time_predict(self, *args):
+        self.det.predict(self.X_test)
+
+    def peakmem_anomaly_score(self, *args):
+        self.det.anomaly_score(self.X_test)
+
+
+class _FeaturewiseScoreSuite(_BaseSuite):
+    def setup(self, detector, *args):
+        super().setup(detector, *args)
+
+        # asv skips the benchmark if setup raises NotImplementedError
+        if not hasattr(self.det, 'featurewise_anomaly_score'):
+            raise NotImplementedError(
+                f'{detector} does not support featurewise_anomaly_score'
+            )
+
+        self.det.fit(self.X_train)
+
+    def time_featurewise_anomaly_score(self, *args):
+        self.det.featurewise_anomaly_score(self.X_test)
+
+
+class BlobsFit(_BlobsMixin, _FitSuite):
+    pass
+
+
+class BlobsScore(_BlobsMixin, _ScoreSuite):
+    pass
+
+
+class BlobsFeaturewiseScore(_BlobsMixin, _FeaturewiseScoreSuite):
+    pass
+
+
+class DatasetFit(_DatasetMixin, _FitSuite):
+    pass
+
+
+class DatasetScore(_DatasetMixin, _ScoreSuite):
+    pass
+
+
+class DatasetFeaturewiseScore(_DatasetMixin, _FeaturewiseScoreSuite):
+    pass
+
+
+SUITES     = [
+    BlobsFit, BlobsScore, BlobsFeaturewiseScore,
+    DatasetFit, DatasetScore, DatasetFeaturewiseScore
+]
@@ -0,0 +1,67 @@
+"""
+=============================
+Benchmark of the import time
+=============================
+
+Measure the time to execute import statements of kenchi in fresh
+interpreters, and report which of the slow dependencies are imported. The
+subpackages and the detectors of kenchi are loaded lazily, so that only the
+dependencies of what is used are imported.
+
+Usage::
+
+    python benchmarks/bench_import_time.py
+"""
+
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import kenchi',
+    'from kenchi.outlier_detection import HBOS',
+    'from kenchi.outlier_detection import HBOS; HBOS().fit([[0.], [1.]])',
+    'from kenchi.datasets import make_blobs',
+    'from kenchi.outlier_detection import *'
+]
+MODULES    = [
+    'scipy.stats', 'sklearn.cluster', 'sklearn.datasets', 'sklearn.ensemble',
+    'sklearn.mixture', 'sklearn.svm'
+]
+SCRIPT     = '''
+import sys
+import time
+
+t0      = time.perf_counter()
+
+exec({statement!r})
+
+elapsed = time.perf_counter() - t0
+modules = [name for name in {modules!r} if name in sys.modules]
+
+print(elapsed, ','.join(modules))
+'''
+
+
+def bench(statement, n_runs=5):
+    elapsed     = []
+
+    for _ in range(n_runs):
+        output  = subprocess.check_output([
+            sys.executable, '-c',
+            SCRIPT.format(statement=statement, modules=MODULES)
+        ], stderr=subprocess.DEVNULL).decode().split()
+
+        elapsed.append(float(output[0]))
+
+    modules     = output[1] if len(output) > 1 else ''
+
+    return min(elapsed), modules
+
+
+if __name__ == '__main__':
+    print(f'{"time [ms]":>10}  {"statement":<70} imported')
+
+    for statement in STATEMENTS:
+        elapsed, modules = bench(statement)
+
+        print(f'{1e+03 * elapsed:>10.1f}  {statement:<70} {modules}')
@@ -0,0 +1,70 @@
+"""
+=========================================
+Benchmark of the mass-volume curve engine
+=========================================
+
+Compare the computation of the mass-volume curve in
+``NegativeMVAUCScorer._mv_curve``, which sorts the scores of the uniform
+samples once and finds the volume for each offset by binary search, with the
+naive computation, which scans all the scores of the uniform samples for each
+offset.
+
+Usage::
+
+    python benchmarks/bench_mv_curve.py
+"""
+
+import time
+
+import numpy as np
+from kenchi.metrics import NegativeMVAUCScorer
+
+
+def mv_curve_naive(
+    scorer, score_samples, score_uniform_samples, data_volume
+):
+    mass    = np.linspace(0., 1., scorer.n_offsets)
+    offsets = np.percentile(score_samples, 100. * (1. - mass))
+    volume  = np.array([
+        np.mean(score_uniform_samples >= offset) * data_volume
+        for offset in offsets
+    ])
+
+    return mass, volume, offsets
+
+
+def bench(n_samples, random_state=0):
+    rnd                   = np.random.RandomState(random_state)
+    score_samples         = rnd.normal(size=n_samples)
+    score_uniform_samples = rnd.normal(size=n_samples)
+    scorer                = NegativeMVAUCScorer(
+        n_offsets         = n_samples,
+        n_uniform_samples = n_samples
+    )
+
+    t0                    = time.perf_counter()
+    _, volume, _          = scorer._mv_curve(
+        score_samples, score_uniform_samples, 1.
+    )
+    t1                    = time.perf_counter()
+
+    if n_samples <= 10 ** 4:
+        _, volume_naive, _ = mv_curve_naive(
+            scorer, score_samples, score_uniform_samples, 1.
+        )
+        t2                = time.perf_counter()
+
+        np.testing.assert_allclose(volume, volume_naive)
+
+        return t1 - t0, t2 - t1
+
+    return t1 - t0, np.nan
+
+
+if __name__ == '__main__':
+    print(f'{"n":>10} {"searchsorted [s]":>18} {"naive [s]":>12}')
+
+    for n_samples in [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]:
+        elapsed, elapsed_naive = bench(n_samples)
+
+        print(f'{n_samples:>10} {elapsed:>18.4f} {elapsed_naive:>12.4f}')
@@ -0,0 +1,216 @@
+"""
+=========================================
+Standalone runner of the benchmark suites
+=========================================
+
+Run the asv-compatible suites in ``bench_detectors.py`` without asv, and emit
+the elapsed time and the peak memory traced by ``tracemalloc`` of each
+benchmark as JSON, which can be compared between commits.
+
+Usage::
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --filter 'HBOS|KNN' --quick
+    python benchmarks/run_benchmarks.py --compare base.json --output head.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+import scipy
+import sklearn
+
+import kenchi
+from bench_detectors import SUITES
+
+PREFIXES = ('time_', 'peakmem_')
+
+
+def iter_benchmarks(suites, quick=False):
+    """Yield the name, the suite, the method name and the parameters of each
+    benchmark. If ``quick`` is True, only the first value of each numeric
+    parameter is used.
+    """
+
+    for suite in suites:
+        params      = [
+            values[:1] if quick and isinstance(values[0], int) else values
+            for values in suite.params
+        ]
+        methods     = sorted({
+            name[name.index('_') + 1:] for name in dir(suite)
+            if name.startswith(PREFIXES)
+        })
+
+        for args in itertools.product(*params):
+            arg_str = ', '.join(
+                f'{name}={value!r}'
+                for name, value in zip(suite.param_names, args)
+            )
+
+            for method in methods:
+                yield f'{suite.__name__}.{method}({arg_str})', suite, \
+                    method, args
+
+
+def measure(suite, method, args, repeat):
+    """Run a benchmark, and return the minimum elapsed time over ``repeat``
+    calls and the peak memory traced by ``tracemalloc`` in a separate call.
+    """
+
+    bench   = suite()
+
+    bench.setup(*args)
+
+    func    = getattr(bench, f'time_{method}', None) \
+        or getattr(bench, f'peakmem_{method}')
+    elapsed = []
+
+    for _ in range(repeat):
+        t0  = time.perf_counter()
+        func(*args)
+        elapsed.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+
+    try:
+        func(*args)
+
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'time': min(elapsed), 'peak_memory': peak_memory}
+
+
+def get_environment():
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit':   commit,
+        'kenchi':   kenchi.__version__,
+        'machine':  platform.machine(),
+        'numpy':    np.__version__,
+        'python':   platform.python_version(),
+        'scipy':    scipy.__version__,
+        'sklearn':  sklearn.__version__
+    }
+
+
+def compare(results, base, threshold):
+    """Print the ratios of the elapsed times to those of the base results,
+    and return the names of the benchmarks which got slower than the
+    threshold.
+    """
+
+    regressions = []
+
+    print(f'{"ratio":>7} {"time [s]":>10} {"base [s]":>10}  benchmark')
+
+    for name, result in sorted(results.items()):
+        if 'time' not in result or 'time' not in base.get(name, {}):
+            continue
+
+        ratio   = result['time'] / base[name]['time']
+
+        print(
+            f'{ratio:>7.2f} {result["time"]:>10.4f} '
+            f'{base[name]["time"]:>10.4f}  {name}'
+        )
+
+        if ratio > threshold:
+            regressions.append(name)
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Run the benchmark suites of the outlier detectors.'
+    )
+
+    parser.add_argument(
+        '--output', help='path of the JSON file to write the results to'
+    )
+    parser.add_argument(
+        '--filter', default='',
+        help='regular expression which selects the benchmarks to run'
+    )
+    parser.add_argument(
+        '--quick', action='store_true',
+        help='only use the smallest synthetic data set'
+    )
+    parser.add_argument(
+        '--repeat', default=3, type=int,
+        help='number of the timed calls of each benchmark'
+    )
+    parser.add_argument(
+        '--compare', help='path of the JSON file of the base results'
+    )
+    parser.add_argument(
+        '--threshold', default=1.5, type=float,
+        help='ratio of the elapsed times regarded as a regression'
+    )
+
+    args    = parser.parse_args(argv)
+    pattern = re.compile(args.filter)
+    results = {}
+
+    warnings.simplefilter('ignore')
+
+    for name, suite, method, params in iter_benchmarks(SUITES, args.quick):
+        if not pattern.search(name):
+            continue
+
+        try:
+            result    = measure(suite, method, params, args.repeat)
+        except NotImplementedError:
+            continue
+        except Exception as e:
+            results[name] = {'error': repr(e)}
+
+            print(f'{"failed":>27}  {name}', file=sys.stderr)
+
+            continue
+
+        results[name] = result
+        memory        = result['peak_memory'] / 2 ** 20
+
+        print(
+            f'{result["time"]:>10.4f} s {memory:>9.1f} MiB  {name}',
+            file=sys.stderr
+        )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(
+                {'environment': get_environment(), 'results': results},
+                f, indent=2, sort_keys=True
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)['results']
+
+        if compare(results, base, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,9 +9,15 @@ except NameError:
     __KENCHI_SETUP__ = False
 
 if not __KENCHI_SETUP__:
-    from . import datasets # noqa
-    from . import metrics # noqa
-    from . import outlier_detection # noqa
-    from . import pipeline # noqa
-    from . import plotting # noqa
-    from . import utils # noqa
+    from .utils import lazy_load
+
+    # submodules are imported on first access, so that e.g. a worker which
+    # only scores with HBOS does not import scikit-learn's datasets, SVMs
+    # or ensembles
+    __all__          = [
+        'cli', 'datasets', 'instrumentation', 'metrics', 'normalization',
+        'outlier_detection', 'persistence', 'pipeline', 'plotting',
+        'serving', 'sketch', 'utils'
+    ]
+
+    lazy_load(globals(), submodules=__all__)
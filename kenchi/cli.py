@@ -0,0 +1,439 @@
+"""
+Command line interface of kenchi, which fits outlier detectors and scores
+files larger than memory in chunks.
+
+Usage::
+
+    kenchi fit SparseStructureLearning train.npy model.pkl
+    kenchi score model.pkl test.csv --output scores.csv --n-jobs 4
+    cat test.csv | kenchi score model.pkl - > scores.csv
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from multiprocessing import Pool
+
+import numpy as np
+
+from .outlier_detection import DETECTORS
+
+__all__ = ['iter_chunks', 'load_model', 'main']
+
+OUTPUTS = ('anomaly_score', 'decision_function', 'predict')
+FORMATS = {
+    'anomaly_score':     '%.17g',
+    'decision_function': '%.17g',
+    'predict':           '%d'
+}
+
+# meta-detectors are constructed from detectors, which cannot be given by
+# --param
+FITTABLE  = sorted(set(DETECTORS) - {'Cascade', 'ScoreEnsemble'})
+
+# detector loaded once by each worker process
+_detector = None
+
+
+def load_model(path):
+    """Load an outlier detector or a pipeline persisted by ``to_pickle`` or
+    ``to_directory``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file or the directory in which the model is stored.
+
+    Returns
+    -------
+    model : object
+        Loaded outlier detector or pipeline.
+    """
+
+    if os.path.isdir(path):
+        from .persistence import load
+
+        return load(path)
+
+    from sklearn.externals.joblib import load
+
+    return load(path)
+
+
+def _parse_lines(lines, delimiter, lineno=1):
+    """Parse lines of CSV, the first of which is the ``lineno``-th line of
+    the file, and raise ValueError if they are ragged or not numeric.
+    """
+
+    # much faster than np.loadtxt, which parses each value in Python
+    rows          = [
+        (i, line.split(delimiter))
+        for i, line in enumerate(lines, lineno) if line.strip()
+    ]
+
+    if not rows:
+        return np.empty((0, 0))
+
+    _, first      = rows[0]
+
+    for i, row in rows:
+        if len(row) != len(first):
+            raise ValueError(
+                f'line {i} has {len(row)} values but {len(first)} values '
+                f'were expected'
+            )
+
+    try:
+        return np.array([row for _, row in rows], dtype=np.float64)
+    except ValueError as e:
+        raise ValueError(
+            f'lines {rows[0][0]}-{rows[-1][0]} are not numeric: {e}'
+        ) from None
+
+
+def iter_chunks(filename, chunk_size=10000, delimiter=',', skip_header=0):
+    """Iterate over the rows of a file in chunks, so that the file is never
+    required to be resident in memory as a whole.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the ``.npy`` file, which is memory-mapped, or of the CSV
+        file. If '-', CSV is read from the standard input.
+
+    chunk_size : int, default 10000
+        Number of the rows in each chunk.
+
+    delimiter : str, default ','
+        Delimiter of the CSV file. If None, any whitespace is a delimiter.
+
+    skip_header : int, default 0
+        Number of the lines skipped at the beginning of the CSV file.
+
+    Yields
+    ------
+    X : array-like of shape (n_samples_chunk, n_features)
+        Chunk of the data.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> import numpy as np
+    >>> from kenchi.cli import iter_chunks
+    >>> X = np.arange(10.).reshape(5, 2)
+    >>> with tempfile.TemporaryDirectory() as dirname:
+    ...     filename = os.path.join(dirname, 'X.npy')
+    ...     np.save(filename, X)
+    ...     [len(chunk) for chunk in iter_chunks(filename, chunk_size=2)]
+    [2, 2, 1]
+    """
+
+    if filename.endswith('.npy'):
+        X = np.load(filename, mmap_mode='r')
+
+        for start in range(0, len(X), chunk_size):
+            yield X[start:start + chunk_size]
+
+        return
+
+    f     = sys.stdin if filename == '-' else open(filename)
+
+    try:
+        for _ in itertools.islice(f, skip_header):
+            pass
+
+        lineno     = skip_header + 1
+        n_features = None
+
+        while True:
+            lines      = list(itertools.islice(f, chunk_size))
+
+            if not lines:
+                break
+
+            X          = _parse_lines(lines, delimiter, lineno)
+
+            if not len(X):
+                lineno += len(lines)
+
+                continue
+
+            if n_features is None:
+                _, n_features = X.shape
+            elif X.shape[1] != n_features:
+                raise ValueError(
+                    f'lines from {lineno} have {X.shape[1]} values but '
+                    f'{n_features} values were expected'
+                )
+
+            lineno    += len(lines)
+
+            yield X
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+class _Chunks:
+    """Re-iterable collection of the chunks of a file."""
+
+    def __init__(self, filename, **kwargs):
+        self.filename = filename
+        self.kwargs   = kwargs
+
+    def __iter__(self):
+        return iter_chunks(self.filename, **self.kwargs)
+
+
+def _check_model(model):
+    """Raise ValueError if the model cannot score new data."""
+
+    det = model.steps[-1][1] if hasattr(model, 'steps') else model
+
+    if getattr(det, 'novelty', True) is False:
+        raise ValueError(
+            f'{det.__class__.__name__} was fitted with novelty=False, and '
+            f'cannot score new data; refit it with novelty=True'
+        )
+
+
+def _init_worker(model):
+    global _detector
+
+    _detector = load_model(model) if isinstance(model, str) else model
+
+
+def _score_chunk(X, outputs):
+    result = _detector.score_batch(X, outputs=outputs)
+
+    return len(X), np.column_stack([result[name] for name in outputs])
+
+
+def _score_chunks(model, chunks, outputs, n_jobs):
+    """Score the chunks in a pool of worker processes, and yield the results
+    in the order of the chunks. At most ``2 * n_jobs`` chunks are in flight,
+    so that the memory does not grow with the size of the input.
+    """
+
+    if n_jobs == 1:
+        _init_worker(model)
+
+        for X in chunks:
+            yield _score_chunk(X, outputs)
+
+        return
+
+    with Pool(n_jobs, initializer=_init_worker, initargs=(model, )) as pool:
+        pending = deque()
+
+        for X in chunks:
+            pending.append(pool.apply_async(_score_chunk, (X, outputs)))
+
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+
+
+def score(args):
+    """Score the input in chunks, and write the outputs incrementally."""
+
+    chunks    = iter_chunks(
+        args.input,
+        chunk_size  = args.chunk_size,
+        delimiter   = args.delimiter,
+        skip_header = args.skip_header
+    )
+    model     = load_model(args.model)
+
+    _check_model(model)
+
+    fmt       = [FORMATS[name] for name in args.outputs]
+    f         = sys.stdout if args.output == '-' else open(args.output, 'w')
+    n_samples = 0
+    t0        = time.perf_counter()
+
+    try:
+        f.write(','.join(args.outputs) + '\n')
+
+        # each worker process loads the model by itself, so that the
+        # memory-mapped arrays of a directory are shared between them
+        for n_chunk_samples, result in _score_chunks(
+            model if args.n_jobs == 1 else args.model, chunks, args.outputs,
+            args.n_jobs
+        ):
+            np.savetxt(f, result, delimiter=',', fmt=fmt)
+
+            n_samples += n_chunk_samples
+
+            if args.verbose:
+                _report(n_samples, time.perf_counter() - t0)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+    _report(n_samples, time.perf_counter() - t0)
+
+    return 0
+
+
+def _parse_param(param):
+    name, _, value = param.partition('=')
+
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def fit(args):
+    """Fit an outlier detector, and persist it. The detector is fitted in a
+    single pass over the chunks if it provides ``fit_chunks``.
+    """
+
+    from . import outlier_detection
+    from .sketch import KLLSketch
+
+    det    = getattr(outlier_detection, args.detector)()
+    params = dict(_parse_param(param) for param in args.param)
+
+    # the persisted detector is used to score new data
+    if 'novelty' in det.get_params():
+        params.setdefault('novelty', True)
+
+    det.set_params(**params)
+    chunks = _Chunks(
+        args.input,
+        chunk_size  = args.chunk_size,
+        delimiter   = args.delimiter,
+        skip_header = args.skip_header
+    )
+    sketch = KLLSketch(random_state=0) if args.sketch else None
+    t0     = time.perf_counter()
+
+    if args.input == '-' or not hasattr(det, 'fit_chunks'):
+        X  = np.concatenate(list(chunks))
+
+        det.fit(X, sketch=sketch)
+    else:
+        det.fit_chunks(chunks, sketch=sketch)
+
+    if args.format == 'directory':
+        det.to_directory(args.model)
+    else:
+        det.to_pickle(args.model)
+
+    n_samples = det.score_sketch_.n_samples_ if args.sketch \
+        else len(det.anomaly_score_)
+
+    _report(n_samples, time.perf_counter() - t0)
+
+    return 0
+
+
+def _report(n_samples, elapsed):
+    print(
+        f'{n_samples} samples in {elapsed:.3f} s '
+        f'({n_samples / max(elapsed, 1e-09):.0f} samples/s)',
+        file=sys.stderr
+    )
+
+
+def _add_input_arguments(parser):
+    parser.add_argument(
+        'input',
+        help='path of the .npy or CSV file, or - for CSV on the standard '
+        'input'
+    )
+    parser.add_argument(
+        '--chunk-size', default=10000, type=int,
+        help='number of the rows in each chunk'
+    )
+    parser.add_argument(
+        '--delimiter', default=',', help='delimiter of the CSV file'
+    )
+    parser.add_argument(
+        '--skip-header', default=0, type=int,
+        help='number of the lines skipped at the beginning of the CSV file'
+    )
+
+
+def main(argv=None):
+    parser      = argparse.ArgumentParser(
+        prog='kenchi', description='Fit outlier detectors and score data.'
+    )
+    subparsers  = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    score_parser = subparsers.add_parser(
+        'score', help='score data with a persisted model'
+    )
+
+    score_parser.add_argument(
+        'model',
+        help='path of the model persisted by to_pickle or to_directory'
+    )
+    _add_input_arguments(score_parser)
+    score_parser.add_argument(
+        '--output', default='-',
+        help='path of the CSV file to write the outputs to, or - for the '
+        'standard output'
+    )
+    score_parser.add_argument(
+        '--outputs', default=['anomaly_score', 'predict'], nargs='+',
+        choices=OUTPUTS, help='names of the outputs'
+    )
+    score_parser.add_argument(
+        '--n-jobs', default=1, type=int,
+        help='number of the worker processes'
+    )
+    score_parser.add_argument(
+        '--verbose', action='store_true',
+        help='report the throughput after each chunk'
+    )
+    score_parser.set_defaults(func=score)
+
+    fit_parser  = subparsers.add_parser(
+        'fit', help='fit an outlier detector and persist it'
+    )
+
+    fit_parser.add_argument(
+        'detector', choices=FITTABLE, metavar='detector',
+        help='name of the outlier detector, e.g., HBOS'
+    )
+    _add_input_arguments(fit_parser)
+    fit_parser.add_argument(
+        'model', help='path to persist the fitted model to'
+    )
+    fit_parser.add_argument(
+        '--param', default=[], action='append', metavar='NAME=VALUE',
+        help='parameter of the detector, whose value is parsed as JSON if '
+        'possible'
+    )
+    fit_parser.add_argument(
+        '--format', default='pickle', choices=['directory', 'pickle'],
+        help='format of the persisted model'
+    )
+    fit_parser.add_argument(
+        '--sketch', action='store_true',
+        help='summarize the anomaly scores of the training samples by a '
+        'quantile sketch instead of retaining them'
+    )
+    fit_parser.set_defaults(func=fit)
+
+    args        = parser.parse_args(argv)
+
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f'{parser.prog}: error: {e}\n')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,2 +1,19 @@
-from .base import *  # noqa
-from .samples_generator import *  # noqa
+from ..utils import lazy_load
+
+# loaders and generators are imported on first access, since they depend on
+# scikit-learn's datasets, which is slow to import
+LOADERS = {
+    'clear_data_home': 'base',
+    'get_data_home':   'base',
+    'load_pendigits':  'base',
+    'load_pima':       'base',
+    'load_wdbc':       'base',
+    'load_wilt':       'base',
+    'iter_blobs':      'samples_generator',
+    'make_blobs':      'samples_generator',
+    'save_blobs':      'samples_generator'
+}
+
+__all__ = sorted(LOADERS)
+
+lazy_load(globals(), submodules=set(LOADERS.values()), attributes=LOADERS)
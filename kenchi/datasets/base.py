@@ -1,17 +1,200 @@
 import os
+import tempfile
+from functools import lru_cache
+from hashlib import sha256
+from shutil import rmtree
 
 import numpy as np
-from sklearn.datasets import load_breast_cancer
 from sklearn.utils import check_random_state, Bunch
 
-__all__     = ['load_pendigits', 'load_pima', 'load_wdbc', 'load_wilt']
+__all__     = [
+    'clear_data_home', 'get_data_home', 'load_pendigits', 'load_pima',
+    'load_wdbc', 'load_wilt'
+]
 
 MODULE_PATH = os.path.dirname(__file__)
 NEG_LABEL   = -1
 POS_LABEL   = 1
 
 
-def load_pendigits(random_state=None, return_X_y=False, subset='kriegel11'):
+def get_data_home(data_home=None):
+    """Return the path of the kenchi data directory, in which the bundled
+    datasets are cached in a binary format. By default, it is
+    '~/kenchi_data', which can be overridden by the 'KENCHI_DATA' environment
+    variable. The directory is created if it does not exist and it can be
+    created.
+
+    Parameters
+    ----------
+    data_home : str, default None
+        Path of the data directory. If None, the default path is used.
+
+    Returns
+    -------
+    data_home : str
+        Path of the data directory.
+    """
+
+    if data_home is None:
+        data_home = os.environ.get(
+            'KENCHI_DATA', os.path.join('~', 'kenchi_data')
+        )
+
+    data_home     = os.path.expanduser(os.fspath(data_home))
+
+    try:
+        os.makedirs(data_home, exist_ok=True)
+    except OSError:
+        # the datasets are parsed without being cached
+        pass
+
+    return data_home
+
+
+def clear_data_home(data_home=None):
+    """Delete all the content of the data directory.
+
+    Parameters
+    ----------
+    data_home : str, default None
+        Path of the data directory. If None, the default path is used.
+    """
+
+    data_home = get_data_home(data_home)
+
+    if os.path.isdir(data_home):
+        rmtree(data_home)
+
+    _load_data.cache_clear()
+
+
+def _parse_pendigits(filename):
+    return np.loadtxt(filename, delimiter=',')
+
+
+def _parse_pima(filename):
+    return np.loadtxt(filename, delimiter=',', skiprows=1)
+
+
+def _parse_wilt(filename):
+    data       = np.loadtxt(filename, delimiter=',', dtype=object, skiprows=1)
+
+    # the class label is stored in the first column as a float, which is 1
+    # for the anomalous class 'w'
+    data[:, 0] = data[:, 0] == 'w'
+
+    return data.astype(float)
+
+
+PARSERS     = {
+    'pendigits_test':  _parse_pendigits,
+    'pendigits_train': _parse_pendigits,
+    'pima':            _parse_pima,
+    'wilt_test':       _parse_wilt,
+    'wilt_train':      _parse_wilt
+}
+
+
+def _checksum(filename):
+    """Compute the SHA-256 checksum of a file."""
+
+    with open(filename, 'rb') as f:
+        return sha256(f.read()).hexdigest()
+
+
+def _stat(filename):
+    """Get the size and the modification time of a file as strings."""
+
+    stat = os.stat(filename)
+
+    return [str(stat.st_size), str(stat.st_mtime_ns)]
+
+
+def _read_cache(filename, filename_checksum, source_checksum):
+    """Load the binary cache if the recorded checksum of the CSV file and
+    the recorded size and modification time of the cache match the current
+    ones, so that a stale, truncated or overwritten cache is never loaded.
+    Return None otherwise.
+    """
+
+    try:
+        with open(filename_checksum) as f:
+            record = f.read().split()
+
+        if record != [source_checksum] + _stat(filename):
+            return None
+
+        return np.asarray(np.load(filename, mmap_mode='r', allow_pickle=False))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(
+    data, data_home, filename, filename_checksum, source_checksum
+):
+    """Write the binary cache and its record, and ignore errors, e.g.,
+    when the data directory is not writable.
+    """
+
+    try:
+        # write to temporary files and rename them, so that concurrent
+        # processes never see a partially written cache
+        fd, tmp = tempfile.mkstemp(dir=data_home, suffix='.npy')
+
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, data, allow_pickle=False)
+
+        # renaming preserves the size and the modification time
+        record  = ' '.join([source_checksum] + _stat(tmp))
+
+        os.replace(tmp, filename)
+
+        fd, tmp = tempfile.mkstemp(dir=data_home)
+
+        with os.fdopen(fd, 'w') as f:
+            f.write(record)
+
+        os.replace(tmp, filename_checksum)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=8)
+def _load_data(name, data_home):
+    """Load the bundled data from the binary cache in the data directory.
+    The cache is (re)built from the gzipped CSV file if it does not exist or
+    its record does not match, and the CSV file is parsed without being
+    cached if the data directory is not writable. The returned array is
+    read-only, since it is shared between calls. The raw arrays are kept in
+    memory rather than the Bunch objects, since the loaders return writable
+    copies, whose subsets may depend on a RandomState instance.
+    """
+
+    source            = os.path.join(MODULE_PATH, 'data', f'{name}.csv.gz')
+    filename          = os.path.join(data_home, f'{name}.npy')
+    filename_checksum = os.path.join(data_home, f'{name}.sha256')
+    source_checksum   = _checksum(source)
+    data              = _read_cache(
+        filename, filename_checksum, source_checksum
+    )
+
+    if data is not None:
+        return data
+
+    data              = PARSERS[name](source)
+
+    data.setflags(write=False)
+
+    _write_cache(
+        data, data_home, filename, filename_checksum, source_checksum
+    )
+
+    return data
+
+
+def load_pendigits(
+    random_state=None, return_X_y=False, subset='kriegel11', data_home=None
+):
     """Load and return the pendigits dataset.
 
     Kriegel's structure (subset='kriegel11') :
@@ -56,6 +239,10 @@ def load_pendigits(random_state=None, return_X_y=False, subset='kriegel11'):
         Specify the structure. Valid options are
         ['goldstein12-global'|'goldstein12-local'|'kriegel11'].
 
+    data_home : str, default None
+        Path of the data directory in which the dataset is cached. If None,
+        the default path returned by ``get_data_home`` is used.
+
     Returns
     -------
     data : Bunch
@@ -89,10 +276,8 @@ def load_pendigits(random_state=None, return_X_y=False, subset='kriegel11'):
     (6724, 16)
     """
 
-    filename_train           = os.path.join(
-        MODULE_PATH, 'data', 'pendigits_train.csv.gz'
-    )
-    data_train               = np.loadtxt(filename_train, delimiter=',')
+    data_home                = get_data_home(data_home)
+    data_train               = _load_data('pendigits_train', data_home)
     X_train                  = data_train[:, :-1]
     y_train                  = data_train[:, -1]
 
@@ -128,10 +313,7 @@ def load_pendigits(random_state=None, return_X_y=False, subset='kriegel11'):
         s                    = np.union1d(idx_inlier, idx_outlier[:n_outliers])
 
     if subset == 'kriegel11':
-        filename_test        = os.path.join(
-            MODULE_PATH, 'data', 'pendigits_test.csv.gz'
-        )
-        data_test            = np.loadtxt(filename_test, delimiter=',')
+        data_test            = _load_data('pendigits_test', data_home)
         X_test               = data_test[:, :-1]
         y_test               = data_test[:, -1]
 
@@ -149,8 +331,7 @@ def load_pendigits(random_state=None, return_X_y=False, subset='kriegel11'):
             rnd.choice(idx_outlier, size=n_outliers, replace=False)
         )
 
-    y[~is_outlier]           = POS_LABEL
-    y[is_outlier]            = NEG_LABEL
+    y                        = np.where(is_outlier, NEG_LABEL, POS_LABEL)
 
     # Downsample outliers
     X                        = X[s]
@@ -166,7 +347,7 @@ def load_pendigits(random_state=None, return_X_y=False, subset='kriegel11'):
     return Bunch(data=X, target=y, feature_names=feature_names)
 
 
-def load_pima(return_X_y=False):
+def load_pima(return_X_y=False, data_home=None):
     """Load and return the Pima Indians diabetes dataset.
 
     =============== =======
@@ -182,6 +363,10 @@ def load_pima(return_X_y=False):
     return_X_y : bool, default False
         If True, return ``(data, target)`` instead of a Bunch object.
 
+    data_home : str, default None
+        Path of the data directory in which the dataset is cached. If None,
+        the default path returned by ``get_data_home`` is used.
+
     Returns
     -------
     data : Bunch
@@ -213,16 +398,10 @@ def load_pima(return_X_y=False):
     (768, 8)
     """
 
-    filename       = os.path.join(MODULE_PATH, 'data', 'pima.csv.gz')
-    data           = np.loadtxt(filename, delimiter=',', skiprows=1)
-    X              = data[:, :-1]
-    y              = data[:, -1]
-
-    is_outlier     = y == 1
-    y[~is_outlier] = POS_LABEL
-    y[is_outlier]  = NEG_LABEL
-
-    y              = y.astype(int)
+    data           = _load_data('pima', get_data_home(data_home))
+    X              = np.array(data[:, :-1])
+    is_outlier     = data[:, -1] == 1
+    y              = np.where(is_outlier, NEG_LABEL, POS_LABEL)
     feature_names  = np.array([
         'Pregnancies', 'Glucose', 'BloodPressure', 'SkinThickness',
         'Insulin', 'BMI', 'DiabetesPedigreeFunction', 'Age',
@@ -316,6 +495,8 @@ def load_wdbc(random_state=None, return_X_y=False, subset='kriegel11'):
     (569, 30)
     """
 
+    from sklearn.datasets import load_breast_cancer
+
     wdbc          = load_breast_cancer()
     X             = wdbc.data
     y             = wdbc.target
@@ -351,7 +532,7 @@ def load_wdbc(random_state=None, return_X_y=False, subset='kriegel11'):
     return Bunch(data=X, target=y, feature_names=feature_names)
 
 
-def load_wilt(return_X_y=False):
+def load_wilt(return_X_y=False, data_home=None):
     """Load and return the wilt dataset.
 
     =============== =========
@@ -367,6 +548,10 @@ def load_wilt(return_X_y=False):
     return_X_y : bool, default False
         If True, return ``(data, target)`` instead of a Bunch object.
 
+    data_home : str, default None
+        Path of the data directory in which the dataset is cached. If None,
+        the default path returned by ``get_data_home`` is used.
+
     Returns
     -------
     data : Bunch
@@ -390,29 +575,13 @@ def load_wilt(return_X_y=False):
     (4839, 5)
     """
 
-    filename_train = os.path.join(MODULE_PATH, 'data', 'wilt_train.csv.gz')
-    data_train     = np.loadtxt(
-        filename_train, delimiter=',', dtype=object, skiprows=1
-    )
-    X_train        = data_train[:, 1:]
-    y_train        = data_train[:, 0]
-
-    filename_test  = os.path.join(MODULE_PATH, 'data', 'wilt_test.csv.gz')
-    data_test      = np.loadtxt(
-        filename_test, delimiter=',', dtype=object, skiprows=1
-    )
-    X_test         = data_test[:, 1:]
-    y_test         = data_test[:, 0]
-
-    X              = np.concatenate([X_train, X_test])
-    y              = np.concatenate([y_train, y_test])
-
-    is_outlier     = y == 'w'
-    y[~is_outlier] = POS_LABEL
-    y[is_outlier]  = NEG_LABEL
-
-    X              = X.astype(float)
-    y              = y.astype(int)
+    data_home      = get_data_home(data_home)
+    data           = np.concatenate([
+        _load_data('wilt_train', data_home), _load_data('wilt_test', data_home)
+    ])
+    X              = data[:, 1:]
+    is_outlier     = data[:, 0] == 1
+    y              = np.where(is_outlier, NEG_LABEL, POS_LABEL)
     feature_names  = np.array([
         'GLCM_pan', 'Mean_Green', 'Mean_Red', 'Mean_NIR',
         'SD_pan'
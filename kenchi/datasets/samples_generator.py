@@ -1,11 +1,23 @@
+from inspect import signature
+
 import numpy as np
-from sklearn.datasets import make_blobs as _make_blobs
+from numpy.lib.format import open_memmap
 from sklearn.utils import check_random_state, shuffle as _shuffle
 
 from .base import NEG_LABEL, POS_LABEL
 from ..utils import check_contamination
 
-__all__ = ['make_blobs']
+__all__        = ['iter_blobs', 'make_blobs', 'save_blobs']
+
+ANOMALY_TYPES  = ('clustered', 'dependency', 'global', 'local')
+MAX_SEED       = np.iinfo(np.int32).max
+
+# ratio of the standard deviation of local anomalies to that of the cluster
+LOCAL_SCALE    = 5.
+
+# ratio of the standard deviation of the anomalous cluster to the mean
+# standard deviation of the clusters
+CLUSTERED_SCALE = 0.25
 
 
 def make_blobs(
@@ -69,6 +81,8 @@ def make_blobs(
     (10,)
     """
 
+    from sklearn.datasets import make_blobs as _make_blobs
+
     check_contamination(contamination)
 
     rnd              = check_random_state(random_state)
@@ -103,3 +117,286 @@ def make_blobs(
         X, y         = _shuffle(X, y, random_state=rnd)
 
     return X, y
+
+
+def iter_blobs(
+    centers=5, center_box=(-10., 10.), cluster_std=1., contamination=0.02,
+    n_features=25, n_samples=500, anomaly_type='global', chunk_size=10000,
+    dtype=np.float64, random_state=None, shuffle=True
+):
+    """Generate isotropic Gaussian blobs with outliers chunk by chunk, so that
+    data sets of arbitrary size can be generated in constant memory.
+
+    Each chunk is generated by its own pseudo random number generator seeded
+    with ``[seed, i]``, where ``seed`` is derived from ``random_state`` and
+    ``i`` is the index of the chunk. Hence, the chunks are reproducible for a
+    given ``random_state`` and ``chunk_size``, and each chunk can be
+    regenerated independently of the others.
+
+    Parameters
+    ----------
+    centers : int or array-like of shape (n_centers, n_features), default 5
+        Number of centers to generate, or the fixed center locations.
+
+    center_box : pair of floats (min, max), default (-10.0, 10.0)
+        Bounding box for each cluster center when centers are generated at
+        random.
+
+    cluster_std : float or array-like of shape (n_centers,), default 1.0
+        Standard deviation of the clusters.
+
+    contamination : float, default 0.02
+        Proportion of outliers in the data set.
+
+    n_features : int, default 25
+        Number of features for each sample.
+
+    n_samples : int, default 500
+        Number of samples.
+
+    anomaly_type : str, default 'global'
+        Type of outliers. Valid options are
+        ['clustered'|'dependency'|'global'|'local'].
+
+        - 'clustered': outliers form a small dense cluster of their own.
+        - 'dependency': each feature of an outlier is drawn from an
+          independently chosen cluster, which preserves the marginal
+          distributions of the inliers but breaks the dependency between
+          the features. This requires at least 2 centers.
+        - 'global': outliers are drawn uniformly from the bounding box of
+          the data.
+        - 'local': outliers are drawn around the cluster centers with a
+          larger standard deviation.
+
+    chunk_size : int, default 10000
+        Number of samples in each chunk.
+
+    dtype : data-type, default np.float64
+        Data type of the generated data.
+
+    random_state : int, RandomState instance, default None
+        Seed of the pseudo random number generator.
+
+    shuffle : bool, default True
+        If True, shuffle samples within each chunk.
+
+    Returns
+    -------
+    chunks : generator
+        Generator which yields pairs ``(X, y)`` of the chunks, where ``X`` is
+        of shape (n_chunk_samples, n_features) and ``y`` is -1 for outliers
+        and +1 for inliers.
+
+    Examples
+    --------
+    >>> from kenchi.datasets import iter_blobs
+    >>> chunks = iter_blobs(
+    ...     n_samples=25000, n_features=2, chunk_size=10000, random_state=0
+    ... )
+    >>> [X.shape for X, y in chunks]
+    [(10000, 2), (10000, 2), (5000, 2)]
+    """
+
+    params = _check_blobs_params(
+        centers, center_box, cluster_std, contamination, n_features,
+        n_samples, anomaly_type, chunk_size, dtype, random_state, shuffle
+    )
+
+    return _iter_chunks(params)
+
+
+def _check_blobs_params(
+    centers, center_box, cluster_std, contamination, n_features, n_samples,
+    anomaly_type, chunk_size, dtype, random_state, shuffle
+):
+    """Check the parameters of ``iter_blobs``, and draw the parameters which
+    are shared between the chunks.
+    """
+
+    check_contamination(contamination)
+
+    if anomaly_type not in ANOMALY_TYPES:
+        raise ValueError(f'invalid anomaly_type: {anomaly_type}')
+
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive but was {chunk_size}')
+
+    seed              = check_random_state(random_state).randint(MAX_SEED)
+    rnd               = np.random.RandomState(seed)
+
+    if np.isscalar(centers):
+        centers       = rnd.uniform(
+            center_box[0], center_box[1], size=(centers, n_features)
+        )
+    else:
+        centers       = np.asarray(centers, dtype=np.float64)
+
+    n_centers, n_features = centers.shape
+
+    if anomaly_type == 'dependency' and n_centers < 2:
+        raise ValueError(
+            f'dependency anomalies require at least 2 centers '
+            f'but was {n_centers}'
+        )
+
+    cluster_std       = np.broadcast_to(
+        np.asarray(cluster_std, dtype=np.float64), (n_centers,)
+    )
+
+    return {
+        'anomaly_type':   anomaly_type,
+        'centers':        centers,
+        'chunk_size':     chunk_size,
+        'cluster_std':    cluster_std,
+        'contamination':  contamination,
+        'dtype':          np.dtype(dtype),
+        'high':           np.maximum(
+            center_box[1], np.max(centers.T + 3. * cluster_std, axis=1)
+        ),
+        'low':            np.minimum(
+            center_box[0], np.min(centers.T - 3. * cluster_std, axis=1)
+        ),
+        'n_features':     n_features,
+        'n_samples':      n_samples,
+        'outlier_center': rnd.uniform(
+            center_box[0], center_box[1], size=n_features
+        ),
+        'seed':           seed,
+        'shuffle':        shuffle
+    }
+
+
+def _iter_chunks(params):
+    n_samples  = params['n_samples']
+    chunk_size = params['chunk_size']
+
+    for i, start in enumerate(range(0, n_samples, chunk_size)):
+        yield _generate_chunk(
+            i, start, min(start + chunk_size, n_samples), params
+        )
+
+
+def _generate_chunk(i, start, stop, params):
+    """Generate the i-th chunk, which consists of the samples in
+    [start, stop).
+    """
+
+    rnd                     = np.random.RandomState([params['seed'], i])
+    centers                 = params['centers']
+    cluster_std             = params['cluster_std']
+    contamination           = params['contamination']
+    n_centers, n_features   = centers.shape
+
+    # distribute the outliers so that the total number of the outliers is
+    # the same as that of make_blobs
+    n_samples               = stop - start
+    n_outliers              = int(np.round(contamination * stop)) \
+        - int(np.round(contamination * start))
+    n_inliers               = n_samples - n_outliers
+
+    X                       = np.empty(
+        (n_samples, n_features), dtype=params['dtype']
+    )
+    y                       = np.empty(n_samples, dtype=int)
+    y[:n_inliers]           = POS_LABEL
+    y[n_inliers:]           = NEG_LABEL
+
+    labels                  = rnd.randint(n_centers, size=n_inliers)
+    X[:n_inliers]           = centers[labels] \
+        + cluster_std[labels, np.newaxis] \
+        * rnd.standard_normal((n_inliers, n_features))
+
+    anomaly_type            = params['anomaly_type']
+    size                    = (n_outliers, n_features)
+
+    if anomaly_type == 'clustered':
+        X[n_inliers:]       = params['outlier_center'] \
+            + CLUSTERED_SCALE * np.mean(cluster_std) \
+            * rnd.standard_normal(size)
+
+    elif anomaly_type == 'dependency':
+        labels              = rnd.randint(n_centers, size=size)
+        X[n_inliers:]       = centers[labels, np.arange(n_features)] \
+            + cluster_std[labels] * rnd.standard_normal(size)
+
+    elif anomaly_type == 'global':
+        X[n_inliers:]       = rnd.uniform(
+            params['low'], params['high'], size=size
+        )
+
+    else:
+        labels              = rnd.randint(n_centers, size=n_outliers)
+        X[n_inliers:]       = centers[labels] \
+            + LOCAL_SCALE * cluster_std[labels, np.newaxis] \
+            * rnd.standard_normal(size)
+
+    if params['shuffle']:
+        ind                 = rnd.permutation(n_samples)
+        X                   = X[ind]
+        y                   = y[ind]
+
+    return X, y
+
+
+def save_blobs(filename_X, filename_y, **kwargs):
+    """Generate isotropic Gaussian blobs with outliers chunk by chunk, and
+    write them to a pair of memory-mapped ``.npy`` files.
+
+    Parameters
+    ----------
+    filename_X : str or pathlib.Path
+        Path of the ``.npy`` file in which the data is to be stored.
+
+    filename_y : str or pathlib.Path
+        Path of the ``.npy`` file in which the labels are to be stored.
+
+    kwargs : dict
+        Other keywords passed to ``iter_blobs``.
+
+    Returns
+    -------
+    X : numpy.memmap of shape (n_samples, n_features)
+        Memory-mapped data.
+
+    y : numpy.memmap of shape (n_samples,)
+        Memory-mapped labels, which are -1 for outliers and +1 for inliers.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> from kenchi.datasets import save_blobs
+    >>> with tempfile.TemporaryDirectory() as dirname:
+    ...     X, y = save_blobs(
+    ...         os.path.join(dirname, 'X.npy'), os.path.join(dirname, 'y.npy'),
+    ...         n_samples=25000, n_features=2, random_state=0
+    ...     )
+    ...     X.shape
+    (25000, 2)
+    """
+
+    arguments         = signature(iter_blobs).bind(**kwargs)
+
+    arguments.apply_defaults()
+
+    params            = _check_blobs_params(**arguments.arguments)
+    n_samples         = params['n_samples']
+    X                 = open_memmap(
+        filename_X, mode='w+', dtype=params['dtype'],
+        shape=(n_samples, params['n_features'])
+    )
+    y                 = open_memmap(
+        filename_y, mode='w+', dtype=int, shape=(n_samples,)
+    )
+    start             = 0
+
+    for X_chunk, y_chunk in _iter_chunks(params):
+        stop          = start + len(y_chunk)
+        X[start:stop] = X_chunk
+        y[start:stop] = y_chunk
+        start         = stop
+
+    X.flush()
+    y.flush()
+
+    return X, y
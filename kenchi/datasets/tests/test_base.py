@@ -1,9 +1,121 @@
 import doctest
+import os
+import tempfile
+import unittest
 
+import numpy as np
 from kenchi.datasets import base
 
 
+def set_up_data_home(test):
+    # the examples cache the datasets in a temporary data directory instead
+    # of the default one
+    test.globs['environ'] = os.environ.copy()
+    os.environ['KENCHI_DATA'] = tempfile.mkdtemp()
+
+
+def tear_down_data_home(test):
+    base.clear_data_home()
+
+    os.environ.clear()
+    os.environ.update(test.globs['environ'])
+
+
 def load_tests(loader, tests, ignore):
-    tests.addTests(doctest.DocTestSuite(base))
+    tests.addTests(doctest.DocTestSuite(
+        base, setUp=set_up_data_home, tearDown=tear_down_data_home
+    ))
 
     return tests
+
+
+class DataCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.data_home = tempfile.mkdtemp()
+
+        base._load_data.cache_clear()
+
+    def tearDown(self):
+        base.clear_data_home(self.data_home)
+
+    def test_cache(self):
+        pima     = base.load_pima(data_home=self.data_home)
+        filename = os.path.join(self.data_home, 'pima.npy')
+
+        self.assertTrue(os.path.exists(filename))
+
+        base._load_data.cache_clear()
+
+        cached   = base.load_pima(data_home=self.data_home)
+
+        np.testing.assert_array_equal(cached.data, pima.data)
+        np.testing.assert_array_equal(cached.target, pima.target)
+        self.assertTrue(cached.data.flags.writeable)
+
+    def test_cache_invalid_checksum(self):
+        base.load_wilt(data_home=self.data_home)
+
+        filename = os.path.join(self.data_home, 'wilt_test.sha256')
+
+        with open(filename, 'w') as f:
+            f.write('invalid')
+
+        base._load_data.cache_clear()
+
+        wilt     = base.load_wilt(data_home=self.data_home)
+
+        self.assertEqual(wilt.data.shape, (4839, 5))
+        self.assertEqual(np.sum(wilt.target == -1), 261)
+
+        with open(filename) as f:
+            self.assertNotEqual(f.read(), 'invalid')
+
+    def test_lru_cache(self):
+        base.load_pendigits(random_state=0, data_home=self.data_home)
+
+        hits = base._load_data.cache_info().hits
+
+        base.load_pendigits(random_state=0, data_home=self.data_home)
+
+        self.assertEqual(base._load_data.cache_info().hits, hits + 2)
+
+    def test_cache_corrupted(self):
+        pima     = base.load_pima(data_home=self.data_home)
+        filename = os.path.join(self.data_home, 'pima.npy')
+
+        # a valid .npy file whose content differs from the cached data
+        np.save(filename, np.zeros((1, 1)))
+
+        base._load_data.cache_clear()
+
+        cached   = base.load_pima(data_home=self.data_home)
+
+        np.testing.assert_array_equal(cached.data, pima.data)
+
+    def test_cache_modified(self):
+        pima     = base.load_pima(data_home=self.data_home)
+        filename = os.path.join(self.data_home, 'pima.npy')
+        stat     = os.stat(filename)
+
+        # the content is overwritten in place without changing the size
+        data     = np.load(filename, mmap_mode='r+')
+        data[:]  = 0.
+
+        del data
+
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        base._load_data.cache_clear()
+
+        cached   = base.load_pima(data_home=self.data_home)
+
+        np.testing.assert_array_equal(cached.data, pima.data)
+
+    def test_unwritable_data_home(self):
+        with tempfile.NamedTemporaryFile() as f:
+            # a directory cannot be created under a regular file
+            data_home = os.path.join(f.name, 'kenchi_data')
+            pima      = base.load_pima(data_home=data_home)
+
+            self.assertEqual(pima.data.shape, (768, 8))
+            self.assertFalse(os.path.exists(data_home))
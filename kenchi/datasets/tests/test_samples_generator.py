@@ -1,5 +1,9 @@
 import doctest
+import os
+import tempfile
+import unittest
 
+import numpy as np
 from kenchi.datasets import samples_generator
 
 
@@ -7,3 +11,67 @@ def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(samples_generator))
 
     return tests
+
+
+class IterBlobsTest(unittest.TestCase):
+    def test_iter_blobs(self):
+        for anomaly_type in samples_generator.ANOMALY_TYPES:
+            chunks = list(samples_generator.iter_blobs(
+                anomaly_type  = anomaly_type,
+                chunk_size    = 300,
+                contamination = 0.05,
+                n_features    = 3,
+                n_samples     = 1000,
+                random_state  = 0
+            ))
+            X      = np.concatenate([X for X, _ in chunks])
+            y      = np.concatenate([y for _, y in chunks])
+
+            self.assertEqual([len(y) for _, y in chunks], [300, 300, 300, 100])
+            self.assertEqual(X.shape, (1000, 3))
+            self.assertEqual(np.sum(y == -1), 50)
+
+    def test_iter_blobs_reproducible(self):
+        kwargs       = {'chunk_size': 100, 'n_samples': 250, 'random_state': 0}
+        X, _         = zip(*samples_generator.iter_blobs(**kwargs))
+        X_other, _   = zip(*samples_generator.iter_blobs(**kwargs))
+
+        np.testing.assert_array_equal(
+            np.concatenate(X), np.concatenate(X_other)
+        )
+
+    def test_iter_blobs_dtype(self):
+        X, _ = next(
+            samples_generator.iter_blobs(dtype=np.float32, random_state=0)
+        )
+
+        self.assertEqual(X.dtype, np.float32)
+
+    def test_iter_blobs_invalid(self):
+        self.assertRaises(
+            ValueError, samples_generator.iter_blobs, anomaly_type='invalid'
+        )
+        self.assertRaises(
+            ValueError, samples_generator.iter_blobs, chunk_size=0
+        )
+        self.assertRaises(
+            ValueError, samples_generator.iter_blobs,
+            anomaly_type='dependency', centers=1
+        )
+
+    def test_save_blobs(self):
+        kwargs = {'chunk_size': 100, 'n_samples': 250, 'random_state': 0}
+
+        with tempfile.TemporaryDirectory() as dirname:
+            X, y = samples_generator.save_blobs(
+                os.path.join(dirname, 'X.npy'),
+                os.path.join(dirname, 'y.npy'),
+                **kwargs
+            )
+            X_loaded = np.load(os.path.join(dirname, 'X.npy'))
+
+            del X, y
+
+        X_chunks, _ = zip(*samples_generator.iter_blobs(**kwargs))
+
+        np.testing.assert_array_equal(X_loaded, np.concatenate(X_chunks))
@@ -0,0 +1,202 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from sklearn.utils import Bunch
+
+__all__ = [
+    'disable_instrumentation', 'enable_instrumentation',
+    'instrumentation_context'
+]
+
+_config = {'callbacks': (), 'enabled': False}
+
+
+def enable_instrumentation(callbacks=None):
+    """Enable the instrumentation of outlier detectors. Once enabled, ``fit``
+    sets ``fit_stats_`` and each scoring call sets ``last_call_stats_`` to a
+    Bunch object, which holds the wall time, the CPU time, the allocated
+    bytes and the number of samples of the call and of each of its stages.
+    The allocated bytes, i.e., the net change of the memory traced by
+    ``tracemalloc``, are only recorded while ``tracemalloc`` is tracing.
+
+    Parameters
+    ----------
+    callbacks : callable or list of callables, default None
+        Functions called with the detector and the statistics after each
+        instrumented call, e.g., to export the statistics to a monitoring
+        system.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.instrumentation import (
+    ...     disable_instrumentation, enable_instrumentation
+    ... )
+    >>> from kenchi.outlier_detection import HBOS
+    >>> X = np.random.RandomState(0).normal(size=(100, 2))
+    >>> enable_instrumentation()
+    >>> det = HBOS().fit(X)
+    >>> list(det.fit_stats_.stages)
+    ['check_array', 'fit', 'anomaly_score', 'threshold', 'contamination', \
+'normalizers']
+    >>> det.fit_stats_.n_samples
+    100
+    >>> disable_instrumentation()
+    """
+
+    if callbacks is None:
+        callbacks = ()
+    elif callable(callbacks):
+        callbacks = (callbacks, )
+
+    _config.update(callbacks=tuple(callbacks), enabled=True)
+
+
+def disable_instrumentation():
+    """Disable the instrumentation of outlier detectors."""
+
+    _config.update(callbacks=(), enabled=False)
+
+
+@contextmanager
+def instrumentation_context(callbacks=None):
+    """Context manager which enables the instrumentation of outlier detectors
+    within its scope.
+
+    Parameters
+    ----------
+    callbacks : callable or list of callables, default None
+        Functions called with the detector and the statistics after each
+        instrumented call.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.instrumentation import instrumentation_context
+    >>> from kenchi.outlier_detection import HBOS
+    >>> X = np.random.RandomState(0).normal(size=(100, 2))
+    >>> det = HBOS(novelty=True).fit(X)
+    >>> calls = []
+    >>> with instrumentation_context(lambda det, stats: calls.append(stats)):
+    ...     _ = det.predict(X[:10])
+    >>> calls[0].method, calls[0].n_samples
+    ('anomaly_score', 10)
+    """
+
+    old_config = dict(_config)
+
+    enable_instrumentation(callbacks)
+
+    try:
+        yield
+    finally:
+        _config.update(old_config)
+
+
+def _traced_memory():
+    if tracemalloc.is_tracing():
+        current, _ = tracemalloc.get_traced_memory()
+
+        return current
+
+    return None
+
+
+class _Measurement:
+    """Snapshot of the clocks and the traced memory."""
+
+    __slots__ = ('wall_time', 'cpu_time', 'memory')
+
+    def __init__(self):
+        self.wall_time = time.perf_counter()
+        self.cpu_time  = time.process_time()
+        self.memory    = _traced_memory()
+
+    def elapsed(self, n_samples):
+        end            = _Measurement()
+
+        if self.memory is None or end.memory is None:
+            allocated_bytes = None
+        else:
+            allocated_bytes = end.memory - self.memory
+
+        return Bunch(
+            wall_time       = end.wall_time - self.wall_time,
+            cpu_time        = end.cpu_time - self.cpu_time,
+            allocated_bytes = allocated_bytes,
+            n_samples       = n_samples
+        )
+
+
+class _NullStage:
+    """Stage used while the instrumentation is disabled, whose attributes
+    are written but never read.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _NullRecorder:
+    """Recorder used while the instrumentation is disabled, which does
+    nothing.
+    """
+
+    n_samples    = None
+    _stage       = _NullStage()
+
+    def stage(self, name, n_samples=None):
+        return self._stage
+
+    def finish(self, estimator):
+        pass
+
+
+class _Recorder:
+    """Recorder of the statistics of a single call and of its stages."""
+
+    def __init__(self, method, attribute, callbacks):
+        self.method     = method
+        self.attribute  = attribute
+        self.callbacks  = callbacks
+        self.n_samples  = None
+        self.stages     = {}
+        self._start     = _Measurement()
+
+    @contextmanager
+    def stage(self, name, n_samples=None):
+        start           = _Measurement()
+        info            = Bunch(n_samples=n_samples)
+
+        try:
+            yield info
+        finally:
+            self.stages[name] = start.elapsed(info.n_samples)
+
+    def finish(self, estimator):
+        stats           = self._start.elapsed(self.n_samples)
+        stats.method    = self.method
+        stats.stages    = self.stages
+
+        setattr(estimator, self.attribute, stats)
+
+        for callback in self.callbacks:
+            callback(estimator, stats)
+
+
+NULL_RECORDER = _NullRecorder()
+
+
+def get_recorder(method, attribute):
+    """Return a recorder of the statistics of a call, which are set to the
+    given attribute of the estimator, if the instrumentation is enabled.
+    """
+
+    if not _config['enabled']:
+        return NULL_RECORDER
+
+    return _Recorder(method, attribute, _config['callbacks'])
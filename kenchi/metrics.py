@@ -1,14 +1,77 @@
+from collections import OrderedDict
+from threading import Lock
+
 import numpy as np
+from sklearn import get_config
 from sklearn.metrics import auc, recall_score
-from sklearn.utils import check_random_state
+from sklearn.utils import check_random_state, gen_batches, get_chunk_n_rows
+
+__all__ = ['EMAUCScorer', 'LeeLiuScorer', 'NegativeMVAUCScorer']
+
+# total size in bytes of the uniform samples retained across calls
+MAX_CACHED_UNIFORM_SAMPLES_BYTES = 2 ** 26
+
+_uniform_samples_cache           = OrderedDict()
+_uniform_samples_lock            = Lock()
+
+
+def _lebesgue_measure(sorted_score_samples, offsets, data_volume):
+    """Compute Lebesgue measure for each offset. Scores must be sorted in
+    ascending order.
+    """
+
+    n_samples,   = sorted_score_samples.shape
+    n_greater_eq  = n_samples - np.searchsorted(
+        sorted_score_samples, offsets, side='left'
+    )
+
+    return n_greater_eq / n_samples * data_volume
+
+
+def _draw_uniform_samples(internal_state, data_max, data_min, size):
+    """Draw samples from the uniform distribution over the hypercube enclosing
+    the data, or reuse the ones drawn before with the same arguments. The
+    least recently used samples are evicted once the cached ones exceed
+    ``MAX_CACHED_UNIFORM_SAMPLES_BYTES`` in total.
+    """
+
+    key                    = (
+        internal_state[1].tobytes(), internal_state[2],
+        data_max.tobytes(), data_min.tobytes(), size
+    )
+
+    with _uniform_samples_lock:
+        if key in _uniform_samples_cache:
+            _uniform_samples_cache.move_to_end(key)
+
+            return _uniform_samples_cache[key]
+
+    rnd                    = np.random.RandomState()
+
+    rnd.set_state(internal_state)
+
+    U                      = rnd.uniform(
+        low                = data_min,
+        high               = data_max,
+        size               = size
+    )
+
+    U.setflags(write=False)
 
-__all__ = ['LeeLiuScorer', 'NegativeMVAUCScorer']
+    if U.nbytes > MAX_CACHED_UNIFORM_SAMPLES_BYTES:
+        return U
 
+    with _uniform_samples_lock:
+        _uniform_samples_cache[key] = U
+        nbytes             = sum(
+            cached.nbytes for cached in _uniform_samples_cache.values()
+        )
 
-def _lebesgue_measure(score_samples, offset, data_volume):
-    """Compute Lebesgue measure."""
+        while nbytes > MAX_CACHED_UNIFORM_SAMPLES_BYTES:
+            _, evicted     = _uniform_samples_cache.popitem(last=False)
+            nbytes        -= evicted.nbytes
 
-    return np.mean(score_samples >= offset) * data_volume
+    return U
 
 
 class LeeLiuScorer:
@@ -52,16 +115,144 @@ class LeeLiuScorer:
         return r ** 2 / (1. - det.contamination_)
 
 
-class NegativeMVAUCScorer:
+class _BaseVolumeScorer:
+    """Base class for scorers which compare the scores of the given samples
+    with the ones of samples drawn from the uniform distribution over the
+    hypercube enclosing the data.
+
+    The uniform samples are drawn only once for the same random state,
+    hypercube and number of samples, and are shared among all the scorers.
+    Thus, they are reused across all the candidate detectors in a
+    hyperparameter search. A single draw is cached only if it fits in
+    ``working_memory``, and the least recently used draws are evicted once
+    the cached ones exceed ``MAX_CACHED_UNIFORM_SAMPLES_BYTES`` in total.
+    """
+
+    def _get_hypercube(self, X):
+        """Get the hypercube enclosing the data."""
+
+        if self.data_max is None:
+            data_max = np.max(X, axis=0)
+        else:
+            data_max = np.asarray(self.data_max, dtype=float)
+
+        if self.data_min is None:
+            data_min = np.min(X, axis=0)
+        else:
+            data_min = np.asarray(self.data_min, dtype=float)
+
+        return data_max, data_min
+
+    def _get_data_volume(self, data_max, data_min):
+        """Get the volume of the hypercube enclosing the data, and raise
+        ValueError if it is not positive.
+        """
+
+        data_volume = np.prod(data_max - data_min)
+
+        if data_volume <= 0.:
+            raise ValueError(
+                f'the hypercube enclosing the data must have positive volume '
+                f'but features {np.flatnonzero(data_max <= data_min)} have '
+                f'zero range; pass data_max and data_min explicitly'
+            )
+
+        return data_volume
+
+    def _score_uniform_samples(self, det, data_max, data_min):
+        """Compute the opposite of the anomaly score for each sample which is
+        drawn from the uniform distribution over the hypercube enclosing the
+        data. If the samples do not fit in ``working_memory``, they are drawn
+        and scored in blocks, so that a large number of samples can be used
+        even in high dimensions.
+        """
+
+        n_features            = det.n_features_
+        size                  = (self.n_uniform_samples, n_features)
+        working_memory        = get_config()['working_memory'] * 2 ** 20
+
+        if 8 * self.n_uniform_samples * n_features <= working_memory:
+            U                 = _draw_uniform_samples(
+                self.internal_state, data_max, data_min, size
+            )
+
+            return det.score_samples(U)
+
+        rnd                   = np.random.RandomState()
+
+        rnd.set_state(self.internal_state)
+
+        chunk_n_rows          = get_chunk_n_rows(row_bytes=8 * n_features)
+        score_uniform_samples = np.empty(self.n_uniform_samples)
+
+        for s in gen_batches(self.n_uniform_samples, chunk_n_rows):
+            U                 = rnd.uniform(
+                low           = data_min,
+                high          = data_max,
+                size          = (s.stop - s.start, n_features)
+            )
+            score_uniform_samples[s] = det.score_samples(U)
+
+        return score_uniform_samples
+
+    def _mv_curve(self, score_samples, score_uniform_samples, data_volume):
+        """Compute mass-volume pairs for different offsets. The scores of the
+        samples and the uniform samples are sorted once, and the volume for
+        each offset is found by binary search, which takes O((n_offsets +
+        n_uniform_samples) log n_uniform_samples) time.
+
+        Parameters
+        ----------
+        score_samples : array-like of shape (n_samples,)
+            Opposite of the anomaly score for each sample.
+
+        score_uniform_samples : array-like of shape (n_uniform_samples,)
+            Opposite of the anomaly score for each sample which is drawn from
+            the uniform distribution over the hypercube enclosing the data.
+
+        data_volume : float
+            Volume of the hypercube enclosing the data.
+
+        Returns
+        -------
+        mass : array-like of shape (n_offsets,)
+
+        volume : array-like of shape (n_offsets,)
+
+        offsets : array-like of shape (n_offsets,)
+        """
+
+        n_samples,            = score_samples.shape
+
+        mass                  = np.linspace(0., 1., self.n_offsets)
+
+        # equivalent to np.percentile(score_samples, 100. * (1. - mass)), but
+        # avoids partitioning the scores for each of many offsets
+        offsets               = np.interp(
+            (n_samples - 1.) * (1. - mass),
+            np.arange(n_samples),
+            np.sort(score_samples)
+        )
+        volume                = _lebesgue_measure(
+            np.sort(score_uniform_samples), offsets, data_volume
+        )
+
+        return mass, volume, offsets
+
+
+class NegativeMVAUCScorer(_BaseVolumeScorer):
     """Negative MV AUC scorer.
 
     Parameters
     ----------
-    data_max : array-like of shape (n_features,)
-        Per feature maximum seen in the data.
+    data_max : array-like of shape (n_features,), default None
+        Per feature maximum seen in the data. If None, the maximum is computed
+        from the data passed to the scorer, e.g., for each fold of
+        cross-validation.
 
-    data_min : array-like of shape (n_features,)
-        Per feature minimum seen in the data.
+    data_min : array-like of shape (n_features,), default None
+        Per feature minimum seen in the data. If None, the minimum is computed
+        from the data passed to the scorer.
 
     interval : tuple, default (0.9, 0.999)
         Interval of probabilities.
@@ -85,7 +276,7 @@ class NegativeMVAUCScorer:
     """
 
     def __init__(
-        self, data_max, data_min, interval=(0.9, 0.999),
+        self, data_max=None, data_min=None, interval=(0.9, 0.999),
         n_offsets=1000, n_uniform_samples=1000, random_state=None
     ):
         self.data_max          = data_max
@@ -115,21 +306,15 @@ class NegativeMVAUCScorer:
             Opposite of the area under the MV curve.
         """
 
-        rnd                   = np.random.RandomState()
-
-        rnd.set_state(self.internal_state)
-
-        U                     = rnd.uniform(
-            low               = self.data_min,
-            high              = self.data_max,
-            size              = (self.n_uniform_samples, det.n_features_)
-        )
-
+        data_max, data_min    = self._get_hypercube(X)
+        data_volume           = self._get_data_volume(data_max, data_min)
         score_samples         = det.score_samples(X)
-        score_uniform_samples = det.score_samples(U)
+        score_uniform_samples = self._score_uniform_samples(
+            det, data_max, data_min
+        )
 
         mass, volume, _       = self._mv_curve(
-            score_samples, score_uniform_samples
+            score_samples, score_uniform_samples, data_volume
         )
 
         is_in_range           = \
@@ -137,8 +322,116 @@ class NegativeMVAUCScorer:
 
         return -auc(mass[is_in_range], volume[is_in_range], reorder=True)
 
-    def _mv_curve(self, score_samples, score_uniform_samples):
-        """Compute mass-volume pairs for different offsets.
+
+class EMAUCScorer(_BaseVolumeScorer):
+    """EM AUC scorer.
+
+    Parameters
+    ----------
+    data_max : array-like of shape (n_features,), default None
+        Per feature maximum seen in the data. If None, the maximum is computed
+        from the data passed to the scorer, e.g., for each fold of
+        cross-validation.
+
+    data_min : array-like of shape (n_features,), default None
+        Per feature minimum seen in the data. If None, the minimum is computed
+        from the data passed to the scorer.
+
+    n_offsets : int, default 1000
+        Number of offsets.
+
+    n_thresholds : int, default 1000
+        Number of thresholds at which the EM curve is evaluated.
+
+    n_uniform_samples : int, default 1000
+        Number of samples which are drawn from the uniform distribution over
+        the hypercube enclosing the data.
+
+    random_state : int or RandomState instance, default None
+        Seed of the pseudo random number generator.
+
+    t_max : float, default 0.9
+        The EM curve is integrated while its value is greater than ``t_max``.
+
+    References
+    ----------
+    .. [#goix16] Goix, N.,
+        "How to evaluate the quality of unsupervised anomaly detection
+        algorithms?"
+        In ICML Anomaly Detection Workshop, 2016.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.metrics import EMAUCScorer
+    >>> from kenchi.outlier_detection import MiniBatchKMeans
+    >>> X = np.array([
+    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+    ... ])
+    >>> det = MiniBatchKMeans(n_clusters=1, random_state=0).fit(X)
+    >>> scorer = EMAUCScorer(random_state=0)
+    >>> scorer(det, X) > 0.
+    True
+    """
+
+    def __init__(
+        self, data_max=None, data_min=None, n_offsets=1000,
+        n_thresholds=1000, n_uniform_samples=1000, random_state=None,
+        t_max=0.9
+    ):
+        self.data_max          = data_max
+        self.data_min          = data_min
+        self.n_offsets         = n_offsets
+        self.n_thresholds      = n_thresholds
+        self.n_uniform_samples = n_uniform_samples
+        self.random_state      = random_state
+        self.t_max             = t_max
+        self.internal_state    = check_random_state(random_state).get_state()
+
+    def __call__(self, det, X, y=None):
+        """Compute the area under the Excess-Mass (EM) curve.
+
+        Parameters
+        ----------
+        det : object
+            Detector.
+
+        X : array-like of shape (n_samples, n_features)
+            Data.
+
+        y : ignored
+
+        Returns
+        -------
+        score : float
+            Area under the EM curve.
+        """
+
+        data_max, data_min    = self._get_hypercube(X)
+
+        # the thresholds of the EM curve are scaled by 1 / data_volume
+        data_volume           = self._get_data_volume(data_max, data_min)
+        score_samples         = det.score_samples(X)
+        score_uniform_samples = self._score_uniform_samples(
+            det, data_max, data_min
+        )
+
+        thresholds, em        = self._em_curve(
+            score_samples, score_uniform_samples, data_volume
+        )
+
+        # integrate up to the first threshold at which EM drops below t_max
+        n_thresholds          = np.argmax(em <= self.t_max) + 1
+
+        if n_thresholds == 1:
+            n_thresholds      = self.n_thresholds
+
+        return auc(thresholds[:n_thresholds], em[:n_thresholds])
+
+    def _em_curve(self, score_samples, score_uniform_samples, data_volume):
+        """Compute the EM curve, that is, the upper envelope of the lines
+        mass - t * volume over all the offsets.
 
         Parameters
         ----------
@@ -149,23 +442,29 @@ class NegativeMVAUCScorer:
             Opposite of the anomaly score for each sample which is drawn from
             the uniform distribution over the hypercube enclosing the data.
 
+        data_volume : float
+            Volume of the hypercube enclosing the data.
+
         Returns
         -------
-        mass : array-like of shape (n_offsets,)
-
-        volume : array-like of shape (n_offsets,)
+        thresholds : array-like of shape (n_thresholds,)
 
-        offsets : array-like of shape (n_offsets,)
+        em : array-like of shape (n_thresholds,)
         """
 
-        data_volume           = np.prod(self.data_max - self.data_min)
+        mass, volume, _       = self._mv_curve(
+            score_samples, score_uniform_samples, data_volume
+        )
 
-        mass                  = np.linspace(0., 1., self.n_offsets)
-        offsets               = np.percentile(
-            score_samples, 100. * (1. - mass)
+        thresholds            = np.linspace(
+            0., 100. / data_volume, self.n_thresholds
         )
-        volume                = np.vectorize(
-            _lebesgue_measure, excluded=[0, 2]
-        )(score_uniform_samples, offsets, data_volume)
+        em                    = np.empty(self.n_thresholds)
+        chunk_n_rows          = get_chunk_n_rows(row_bytes=8 * self.n_offsets)
 
-        return mass, volume, offsets
+        for s in gen_batches(self.n_thresholds, chunk_n_rows):
+            em[s]             = np.max(
+                mass - thresholds[s, np.newaxis] * volume, axis=1
+            )
+
+        return thresholds, em
@@ -0,0 +1,198 @@
+import numpy as np
+from scipy.special import gammainc, ndtr
+
+__all__ = [
+    'GammaNormalizer', 'GaussianNormalizer', 'RankNormalizer',
+    'NORMALIZERS'
+]
+
+
+class _BaseNormalizer:
+    """Base class for all normalizers in kenchi, which transform anomaly
+    scores into values in [0, 1] by the calibration described in
+    [#kriegel11]_.
+
+    References
+    ----------
+    .. [#kriegel11] Kriegel, H.-P., Kroger, P., Schubert, E., and Zimek, A.,
+        "Interpreting and unifying outlier scores,"
+        In Proceedings of SDM, pp. 13-24, 2011.
+    """
+
+    def normalize(self, anomaly_score, out=None):
+        """Compute the normalized anomaly score for each sample.
+
+        Parameters
+        ----------
+        anomaly_score : array-like of shape (n_samples,)
+            Anomaly score for each sample.
+
+        out : array-like of shape (n_samples,), default None
+            Preallocated array into which the result is to be written.
+
+        Returns
+        -------
+        normalized : array-like of shape (n_samples,)
+            Normalized anomaly score for each sample.
+        """
+
+        normalized = self.cdf(anomaly_score)
+
+        if out is None:
+            out    = normalized
+
+        np.multiply(normalized, 2., out=out)
+        np.subtract(out, 1., out=out)
+
+        return np.maximum(out, 0., out=out)
+
+
+class GaussianNormalizer(_BaseNormalizer):
+    """Normalizer which assumes that anomaly scores follow a normal
+    distribution.
+
+    Attributes
+    ----------
+    loc_ : float
+        Mean of the anomaly scores.
+
+    scale_ : float
+        Standard deviation of the anomaly scores.
+    """
+
+    def fit(self, anomaly_score):
+        """Fit the normalizer according to the given anomaly scores."""
+
+        self.loc_   = np.mean(anomaly_score)
+        self.scale_ = np.std(anomaly_score)
+
+        return self
+
+    def fit_sketch(self, sketch):
+        """Fit the normalizer according to the given quantile sketch."""
+
+        self.loc_   = sketch.mean_
+        self.scale_ = sketch.std_
+
+        return self
+
+    def cdf(self, anomaly_score):
+        """Compute the cumulative distribution function."""
+
+        return ndtr((anomaly_score - self.loc_) / self.scale_)
+
+
+class GammaNormalizer(_BaseNormalizer):
+    """Normalizer which assumes that anomaly scores shifted by their minimum
+    follow a gamma distribution, whose parameters are estimated by the method
+    of moments.
+
+    Attributes
+    ----------
+    loc_ : float
+        Minimum of the anomaly scores.
+
+    shape_ : float
+        Shape parameter.
+
+    scale_ : float
+        Scale parameter.
+    """
+
+    def _fit_moments(self, loc, mean, var):
+        # the method of moments is undefined for constant anomaly scores
+        if not var > 0. or not mean > loc:
+            raise ValueError(
+                f'anomaly scores must not be constant to fit a gamma '
+                f'distribution but had variance {var}; use another '
+                f'calibration family'
+            )
+
+        self.loc_   = loc
+        self.shape_ = (mean - loc) ** 2 / var
+        self.scale_ = var / (mean - loc)
+
+        return self
+
+    def fit(self, anomaly_score):
+        """Fit the normalizer according to the given anomaly scores."""
+
+        return self._fit_moments(
+            np.min(anomaly_score), np.mean(anomaly_score),
+            np.var(anomaly_score)
+        )
+
+    def fit_sketch(self, sketch):
+        """Fit the normalizer according to the given quantile sketch."""
+
+        return self._fit_moments(sketch.min_, sketch.mean_, sketch.var_)
+
+    def cdf(self, anomaly_score):
+        """Compute the cumulative distribution function."""
+
+        return gammainc(
+            self.shape_,
+            np.maximum(anomaly_score - self.loc_, 0.) / self.scale_
+        )
+
+
+class RankNormalizer(_BaseNormalizer):
+    """Normalizer which uses the empirical distribution of anomaly scores,
+    represented by a lookup table of their quantiles.
+
+    Parameters
+    ----------
+    n_quantiles : int, default 1000
+        Number of the quantiles in the lookup table.
+
+    Attributes
+    ----------
+    quantiles_ : array-like of shape (n_quantiles,)
+        Quantiles of the anomaly scores.
+
+    references_ : array-like of shape (n_quantiles,)
+        Probabilities corresponding to the quantiles.
+    """
+
+    def __init__(self, n_quantiles=1000):
+        self.n_quantiles = n_quantiles
+
+    def fit(self, anomaly_score):
+        """Fit the normalizer according to the given anomaly scores."""
+
+        n_samples,       = np.shape(anomaly_score)
+        self.references_ = np.linspace(
+            0., 1., min(self.n_quantiles, n_samples)
+        )
+
+        # equivalent to np.percentile with linear interpolation, which is
+        # slow for many quantiles
+        self.quantiles_  = np.interp(
+            self.references_ * (n_samples - 1),
+            np.arange(n_samples),
+            np.sort(anomaly_score)
+        )
+
+        return self
+
+    def fit_sketch(self, sketch):
+        """Fit the normalizer according to the given quantile sketch."""
+
+        self.references_ = np.linspace(
+            0., 1., min(self.n_quantiles, sketch.n_samples_)
+        )
+        self.quantiles_  = sketch.quantile(self.references_)
+
+        return self
+
+    def cdf(self, anomaly_score):
+        """Compute the cumulative distribution function."""
+
+        return np.interp(anomaly_score, self.quantiles_, self.references_)
+
+
+NORMALIZERS = {
+    'gamma':    GammaNormalizer,
+    'gaussian': GaussianNormalizer,
+    'rank':     RankNormalizer
+}
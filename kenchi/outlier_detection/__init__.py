@@ -1,8 +1,26 @@
-from .angle_based import *  # noqa
-from .classification_based import *  # noqa
-from .clustering_based import *  # noqa
-from .density_based import *  # noqa
-from .distance_based import *  # noqa
-from .ensemble import *  # noqa
-from .reconstruction_based import *  # noqa
-from .statistical import *  # noqa
+from ..utils import lazy_load
+
+# detectors are imported on first access, so that only the dependencies of
+# the used detectors are imported
+DETECTORS = {
+    'FastABOD':                  'angle_based',
+    'OCSVM':                     'classification_based',
+    'MiniBatchKMeans':           'clustering_based',
+    'LOF':                       'density_based',
+    'KNN':                       'distance_based',
+    'OneTimeSampling':           'distance_based',
+    'Cascade':                   'ensemble',
+    'FeatureBagging':            'ensemble',
+    'IForest':                   'ensemble',
+    'ScoreEnsemble':             'ensemble',
+    'PCA':                       'reconstruction_based',
+    'GMM':                       'statistical',
+    'HBOS':                      'statistical',
+    'KDE':                       'statistical',
+    'SparseStructureLearning':   'statistical',
+    'SparseStructureLearningCV': 'statistical'
+}
+
+__all__   = sorted(DETECTORS)
+
+lazy_load(globals(), submodules=set(DETECTORS.values()), attributes=DETECTORS)
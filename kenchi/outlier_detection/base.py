@@ -1,24 +1,76 @@
 from abc import abstractmethod, ABC
 
 import numpy as np
-from scipy.stats import norm
 from sklearn.base import BaseEstimator
-from sklearn.externals.joblib import dump
-from sklearn.utils import check_array
-from sklearn.utils.validation import check_is_fitted
+from sklearn.utils import Bunch, check_array
+from sklearn.utils.validation import _num_samples, check_is_fitted
 
+from ..instrumentation import get_recorder, NULL_RECORDER
+from ..normalization import NORMALIZERS
+from ..persistence import dump as dump_directory
 from ..plotting import plot_anomaly_score, plot_roc_curve
 from ..utils import check_contamination, check_novelty
 
-__all__   = ['BaseOutlierDetector']
+__all__   = ['BaseOutlierDetector', 'CompiledScorer']
 
 NEG_LABEL = -1
 POS_LABEL = 1
 
+# calibration family fitted by every detector, used when normalize is True
+DEFAULT_NORMALIZER = 'gaussian'
+OUTPUTS   = (
+    'anomaly_score', 'decision_function', 'predict', 'predict_proba'
+)
+
+
+def _check_outputs(outputs, out, n_samples):
+    """Raise ValueError if the outputs or the preallocated arrays of
+    ``score_batch`` are not valid.
+    """
+
+    for name in outputs:
+        if name not in OUTPUTS:
+            raise ValueError(
+                f'outputs must be a subset of {OUTPUTS} but got {name}'
+            )
+
+    for name in out:
+        if name == 'predict_proba':
+            shape = (n_samples, 2)
+        else:
+            shape = (n_samples, )
+
+        if out[name].shape != shape:
+            raise ValueError(
+                f'out[{name!r}] must be of shape {shape} '
+                f'but was {out[name].shape}'
+            )
+
 
 class BaseOutlierDetector(BaseEstimator, ABC):
     """Base class for all outlier detectors in kenchi.
 
+    Notes
+    -----
+    Input data of dtype float32 is not upcast by the input validation, and
+    other numeric data is converted to float64. HBOS, PCA, KNN,
+    OneTimeSampling, MiniBatchKMeans, SparseStructureLearning and FastABOD
+    compute the anomaly score in the dtype of the given data, which halves the
+    memory footprint at the cost of precision: the relative error of the
+    anomaly score is typically around 1e-6, and samples whose scores are
+    within that error of ``threshold_`` may be labeled differently than with
+    float64 data. Neighbor searches and pairwise distances are still computed
+    in float64 internally, and the graphical lasso of SparseStructureLearning
+    is solved in float64 before the precision matrix is cast to the dtype of
+    the training data. Other detectors return float64 anomaly scores.
+
+    When the instrumentation is enabled by
+    ``kenchi.instrumentation.enable_instrumentation``, ``fit`` sets
+    ``fit_stats_`` and ``anomaly_score``, on which the other scoring methods
+    rely, sets ``last_call_stats_``. Both hold the wall time, the CPU time,
+    the allocated bytes and the number of samples of the call and of each of
+    its stages.
+
     References
     ----------
     .. [#kriegel11] Kriegel, H.-P., Kroger, P., Schubert, E., and Zimek, A.,
@@ -28,6 +80,21 @@ class BaseOutlierDetector(BaseEstimator, ABC):
 
     _estimator_type = 'outlier_detector'
 
+    @property
+    def random_variable_(self):
+        """scipy.stats.rv_frozen: Normal RV object according to the derived
+        anomaly scores, whose parameters are those of the gaussian normalizer.
+        """
+
+        # scipy.stats is slow to import
+        from scipy.stats import norm
+
+        self._check_is_fitted()
+
+        normalizer = self.normalizers_['gaussian']
+
+        return norm(loc=normalizer.loc_, scale=normalizer.scale_)
+
     def _check_params(self):
         """Raise ValueError if parameters are not valid."""
 
@@ -37,6 +104,8 @@ class BaseOutlierDetector(BaseEstimator, ABC):
     def _check_array(self, X, **kwargs):
         """Raise ValueError if the array is not valid."""
 
+        kwargs.setdefault('dtype', [np.float64, np.float32])
+
         X             = check_array(X, **kwargs)
         _, n_features = X.shape
         n_features_   = getattr(self, 'n_features_', n_features)
@@ -54,8 +123,8 @@ class BaseOutlierDetector(BaseEstimator, ABC):
 
         check_is_fitted(
             self, [
-                'anomaly_score_', 'classes_', 'contamination_', 'n_features_',
-                'random_variable_', 'threshold_'
+                'classes_', 'contamination_', 'n_features_', 'normalizers_',
+                'threshold_'
             ]
         )
 
@@ -65,6 +134,9 @@ class BaseOutlierDetector(BaseEstimator, ABC):
         if hasattr(self, 'contamination'):
             return self.contamination
 
+        if hasattr(self, 'score_sketch_'):
+            return 1. - self.score_sketch_.cdf(self.threshold_)
+
         is_outlier = self.anomaly_score_ > self.threshold_
         n_samples, = is_outlier.shape
         n_outliers = np.sum(is_outlier)
@@ -74,28 +146,149 @@ class BaseOutlierDetector(BaseEstimator, ABC):
     def _get_threshold(self):
         """Get the threshold according to the derived anomaly scores."""
 
+        if hasattr(self, 'score_sketch_'):
+            return self.score_sketch_.quantile(1. - self.contamination)
+
         return np.percentile(
             self.anomaly_score_,
             100. * (1. - self.contamination),
             interpolation = 'lower'
         )
 
-    def _get_random_variable(self):
-        """Get the RV object according to the derived anomaly scores."""
+    def _make_normalizer(self, name):
+        """Fit a normalizer of the given calibration family according to the
+        derived anomaly scores.
+        """
+
+        if name not in NORMALIZERS:
+            raise ValueError(
+                f'normalize must be one of {sorted(NORMALIZERS)} '
+                f'but was {name}'
+            )
+
+        normalizer = NORMALIZERS[name]()
+
+        if hasattr(self, 'score_sketch_'):
+            return normalizer.fit_sketch(self.score_sketch_)
+
+        return normalizer.fit(self.anomaly_score_)
+
+    def _fit_normalizers(self, names):
+        """Fit the normalizers of the given calibration families in addition
+        to the ones already fitted. Meta-detectors call this while fitted for
+        the families with which they score their detectors.
+        """
+
+        for name in names:
+            if name not in self.normalizers_:
+                self.normalizers_[name] = self._make_normalizer(name)
+
+        return self
+
+    def _get_normalizer(self, name):
+        """Get the normalizer of the given calibration family. This does not
+        modify the detector, so that it can be called concurrently: a family
+        which was not fitted by ``fit`` is fitted for this call only.
+        """
+
+        if name in self.normalizers_:
+            return self.normalizers_[name]
+
+        return self._make_normalizer(name)
+
+    def _normalize(self, anomaly_score, normalize, out=None):
+        """Normalize the anomaly scores with the given calibration family."""
+
+        if normalize is True:
+            normalize = DEFAULT_NORMALIZER
+
+        return self._get_normalizer(normalize).normalize(
+            anomaly_score, out=out
+        )
+
+    def _fit_anomaly_score(
+        self, chunks, sketch=None, recorder=NULL_RECORDER,
+        training_score=None
+    ):
+        """Compute the anomaly score for each training sample, and set the
+        attributes derived from them. If ``sketch`` is given, the anomaly
+        scores are summarized by the sketch instead of being retained. If
+        ``training_score`` is given, it is used as the anomaly scores of the
+        single chunk instead of computing them. The time spent in each step
+        is recorded by ``recorder``.
+        """
+
+        anomaly_score         = []
+        n_samples             = 0
 
-        loc, scale = norm.fit(self.anomaly_score_)
+        with recorder.stage('anomaly_score') as stage:
+            for X in chunks:
+                n_chunk_samples, self.n_features_ = X.shape
+                n_samples    += n_chunk_samples
 
-        return norm(loc=loc, scale=scale)
+                if training_score is None:
+                    score     = self._anomaly_score(X)
+                else:
+                    score     = training_score
+
+                if sketch is None:
+                    anomaly_score.append(score)
+                else:
+                    sketch.update(score)
+
+            stage.n_samples   = n_samples
+
+        self.classes_         = np.array([NEG_LABEL, POS_LABEL])
+
+        if sketch is None:
+            self.anomaly_score_ = np.concatenate(anomaly_score)
+
+            vars(self).pop('score_sketch_', None)
+        else:
+            self.score_sketch_  = sketch
+
+            vars(self).pop('anomaly_score_', None)
+
+        with recorder.stage('threshold'):
+            self.threshold_       = self._get_threshold()
+
+        with recorder.stage('contamination'):
+            self.contamination_   = self._get_contamination()
+
+        with recorder.stage('normalizers'):
+            self.normalizers_     = {}
+
+            self._fit_normalizers([DEFAULT_NORMALIZER])
+
+        recorder.n_samples    = n_samples
+
+        recorder.finish(self)
+
+        return self
 
     @abstractmethod
     def _fit(self, X):
+        """Fit the model according to a validated array. Return self, or the
+        anomaly score for each training sample if they are computed while
+        fitting, e.g., by meta-detectors whose detectors with novelty=False
+        cannot score the training samples afterwards.
+        """
+
         pass
 
+    def _compile(self):
+        """Return a function that computes the anomaly score for each sample
+        of a validated array. Detectors override this to snapshot their
+        fitted parameters into plain arrays.
+        """
+
+        return self._anomaly_score
+
     @abstractmethod
     def _anomaly_score(self, X):
         pass
 
-    def fit(self, X, y=None):
+    def fit(self, X, y=None, sketch=None):
         """Fit the model according to the given training data.
 
         Parameters
@@ -105,26 +298,34 @@ class BaseOutlierDetector(BaseEstimator, ABC):
 
         y : ignored
 
+        sketch : KLLSketch, default None
+            Quantile sketch. If provided, the anomaly scores of the training
+            samples are summarized by the sketch, which is stored as
+            ``score_sketch_``, and ``anomaly_score_`` is not retained.
+            ``threshold_`` and the normalizers of the anomaly scores are then
+            derived from the sketch.
+
         Returns
         -------
         self : object
             Return self.
         """
 
-        self._check_params()
+        recorder               = get_recorder('fit', 'fit_stats_')
 
-        X                     = self._check_array(X, estimator=self)
+        self._check_params()
 
-        self._fit(X)
+        with recorder.stage('check_array') as stage:
+            X                  = self._check_array(X, estimator=self)
+            stage.n_samples, _ = X.shape
 
-        self.classes_         = np.array([NEG_LABEL, POS_LABEL])
-        _, self.n_features_   = X.shape
-        self.anomaly_score_   = self._anomaly_score(X)
-        self.threshold_       = self._get_threshold()
-        self.contamination_   = self._get_contamination()
-        self.random_variable_ = self._get_random_variable()
+        with recorder.stage('fit', n_samples=stage.n_samples):
+            result             = self._fit(X)
 
-        return self
+        return self._fit_anomaly_score(
+            [X], sketch=sketch, recorder=recorder,
+            training_score=None if result is self else result
+        )
 
     def fit_predict(self, X, y=None):
         """Fit the model according to the given training data and predict if a
@@ -172,7 +373,7 @@ class BaseOutlierDetector(BaseEstimator, ABC):
             NEG_LABEL
         )
 
-    def predict_proba(self, X=None):
+    def predict_proba(self, X=None, normalize=True):
         """Predict class probabilities for each sample.
 
         Parameters
@@ -181,13 +382,17 @@ class BaseOutlierDetector(BaseEstimator, ABC):
             Data. If None, predict if a particular training sample is an
             outlier or not.
 
+        normalize : bool or str, default True
+            Calibration family used to normalize the anomaly score. Valid
+            options are ['gamma'|'gaussian'|'rank']. True means 'gaussian'.
+
         Returns
         -------
         y_score : array-like of shape (n_samples, n_classes)
             Class probabilities.
         """
 
-        anomaly_score = self.anomaly_score(X, normalize=True)
+        anomaly_score = self.anomaly_score(X, normalize=normalize)
 
         return np.concatenate([
             anomaly_score[:, np.newaxis], 1. - anomaly_score[:, np.newaxis]
@@ -244,8 +449,10 @@ class BaseOutlierDetector(BaseEstimator, ABC):
         X : array-like of shape (n_samples, n_features), default None
             Data. If None, compute the anomaly score for each training sample.
 
-        normalize : bool, default False
-            If True, return the normalized anomaly score.
+        normalize : bool or str, default False
+            If True or the name of a calibration family, return the
+            normalized anomaly score. Valid options are
+            ['gamma'|'gaussian'|'rank']. True means 'gaussian'.
 
         Returns
         -------
@@ -256,27 +463,201 @@ class BaseOutlierDetector(BaseEstimator, ABC):
         self._check_is_fitted()
 
         if X is None:
+            if not hasattr(self, 'anomaly_score_'):
+                raise ValueError(
+                    'anomaly_score_ is not retained when the model is fitted '
+                    'with a sketch, X must be given'
+                )
+
             anomaly_score = self.anomaly_score_
 
             if normalize:
-                return np.maximum(
-                    0., 2. * self.random_variable_.cdf(anomaly_score) - 1.
-                )
+                return self._normalize(anomaly_score, normalize)
             else:
                 return anomaly_score
 
         if hasattr(self, 'novelty'):
             check_novelty(self.novelty, 'anomaly_score')
 
-        X                 = self._check_array(X, estimator=self)
-        anomaly_score     = self._anomaly_score(X)
+        recorder               = get_recorder(
+            'anomaly_score', 'last_call_stats_'
+        )
+
+        with recorder.stage('check_array') as stage:
+            X                  = self._check_array(X, estimator=self)
+            stage.n_samples, _ = X.shape
+
+        recorder.n_samples     = stage.n_samples
+
+        with recorder.stage('anomaly_score', n_samples=stage.n_samples):
+            anomaly_score = self._anomaly_score(X)
 
         if normalize:
-            return np.maximum(
-                0., 2. * self.random_variable_.cdf(anomaly_score) - 1.
-            )
+            with recorder.stage('normalize', n_samples=stage.n_samples):
+                anomaly_score = self._normalize(anomaly_score, normalize)
+
+        recorder.finish(self)
+
+        return anomaly_score
+
+    def score_batch(
+        self, X=None, outputs=OUTPUTS, threshold=None, normalize=True,
+        out=None
+    ):
+        """Compute several outputs for each sample from a single evaluation of
+        the anomaly score.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features), default None
+            Data. If None, compute the outputs for each training sample.
+
+        outputs : tuple of str, default ('anomaly_score', \
+            'decision_function', 'predict', 'predict_proba')
+            Names of the outputs to be computed.
+
+        threshold : float, default None
+            User-provided threshold.
+
+        normalize : bool or str, default True
+            Calibration family used to compute the class probabilities. Valid
+            options are ['gamma'|'gaussian'|'rank']. True means 'gaussian'.
+
+        out : dict, default None
+            Preallocated arrays keyed by output names, into which the results
+            are to be written. Each array must have the shape and a dtype
+            compatible with the corresponding output.
+
+        Returns
+        -------
+        result : Bunch
+            Dictionary-like object, whose attributes are the requested
+            outputs.
+
+            anomaly_score : array-like of shape (n_samples,)
+                Anomaly score for each sample.
+
+            decision_function : array-like of shape (n_samples,)
+                Shifted opposite of the anomaly score for each sample.
+
+            predict : array-like of shape (n_samples,)
+                Return -1 for outliers and +1 for inliers.
+
+            predict_proba : array-like of shape (n_samples, n_classes)
+                Class probabilities.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from kenchi.outlier_detection import MiniBatchKMeans
+        >>> X = np.array([
+        ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+        ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+        ... ])
+        >>> det = MiniBatchKMeans(n_clusters=1, random_state=0).fit(X)
+        >>> result = det.score_batch(X, outputs=('predict', ))
+        >>> result.predict
+        array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+        """
+
+        if out is None:
+            out               = {}
+
+        if X is None:
+            anomaly_score     = self.anomaly_score()
+            n_samples,        = anomaly_score.shape
+
+            _check_outputs(outputs, out, n_samples)
+
+            # the training scores are not returned as is, since the caller
+            # may modify the result
+            if 'anomaly_score' in outputs and 'anomaly_score' not in out:
+                anomaly_score = anomaly_score.copy()
         else:
-            return anomaly_score
+            # the outputs are checked before the data is scored
+            _check_outputs(outputs, out, _num_samples(X))
+
+            anomaly_score     = self.anomaly_score(X)
+
+        if threshold is None:
+            threshold         = self.threshold_
+
+        result                = Bunch()
+
+        for name in outputs:
+            result[name]      = self._compute_output(
+                name, anomaly_score, threshold, normalize, out.get(name)
+            )
+
+        return result
+
+    def _compute_output(
+        self, name, anomaly_score, threshold, normalize, out=None
+    ):
+        """Compute an output of ``score_batch`` from the anomaly scores, and
+        write it into ``out`` if given.
+        """
+
+        n_samples,  = anomaly_score.shape
+
+        if name == 'anomaly_score':
+            if out is None:
+                return anomaly_score
+
+            np.copyto(out, anomaly_score)
+
+            return out
+
+        if name == 'decision_function':
+            return np.subtract(threshold, anomaly_score, out=out)
+
+        if name == 'predict':
+            if out is None:
+                out = np.empty(n_samples, dtype=int)
+
+            out.fill(POS_LABEL)
+            np.copyto(out, NEG_LABEL, where=anomaly_score > threshold)
+
+            return out
+
+        if out is None:
+            out     = np.empty((n_samples, 2), dtype=anomaly_score.dtype)
+
+        proba       = self._normalize(anomaly_score, normalize, out=out[:, 0])
+
+        np.subtract(1., proba, out=out[:, 1])
+
+        return out
+
+    def compile(self):
+        """Export a low-overhead scorer which snapshots the fitted parameters
+        and skips input validation on each call.
+
+        Returns
+        -------
+        scorer : CompiledScorer
+            Scorer for the fitted outlier detector.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from kenchi.outlier_detection import MiniBatchKMeans
+        >>> X = np.array([
+        ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+        ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+        ... ])
+        >>> det = MiniBatchKMeans(n_clusters=1, random_state=0).fit(X)
+        >>> scorer = det.compile()
+        >>> scorer.score_one(X[-1]) > scorer.threshold
+        True
+        """
+
+        self._check_is_fitted()
+
+        if hasattr(self, 'novelty'):
+            check_novelty(self.novelty, 'compile')
+
+        return CompiledScorer(self._compile(), self.threshold_)
 
     def to_pickle(self, filename, **kwargs):
         """Persist an outlier detector object.
@@ -295,8 +676,31 @@ class BaseOutlierDetector(BaseEstimator, ABC):
             List of file names in which the data is stored.
         """
 
+        from sklearn.externals.joblib import dump
+
         return dump(self, filename, **kwargs)
 
+    def to_directory(self, dirname, **kwargs):
+        """Persist an outlier detector object into a directory, where large
+        arrays are stored as separate ``.npy`` files, so that they can be
+        memory-mapped by ``kenchi.persistence.load``.
+
+        Parameters
+        ----------
+        dirname : str or pathlib.Path
+            Path of the directory in which it is to be stored.
+
+        kwargs : dict
+            Other keywords passed to ``kenchi.persistence.dump``.
+
+        Returns
+        -------
+        filenames : list
+            List of file names in which the data is stored.
+        """
+
+        return dump_directory(self, dirname, **kwargs)
+
     def plot_anomaly_score(self, X=None, normalize=False, **kwargs):
         """Plot the anomaly score for each sample.
 
@@ -305,8 +709,9 @@ class BaseOutlierDetector(BaseEstimator, ABC):
         X : array-like of shape (n_samples, n_features), default None
             Data. If None, plot the anomaly score for each training samples.
 
-        normalize : bool, default False
-            If True, plot the normalized anomaly score.
+        normalize : bool or str, default False
+            If True or the name of a calibration family, plot the normalized
+            anomaly score.
 
         ax : matplotlib Axes, default None
             Target axes instance.
@@ -408,3 +813,60 @@ class BaseOutlierDetector(BaseEstimator, ABC):
         kwargs.setdefault('label', self.__class__.__name__)
 
         return plot_roc_curve(**kwargs)
+
+
+class CompiledScorer:
+    """Low-overhead scorer exported from a fitted outlier detector.
+
+    Input validation is skipped on each call, so the given data must be
+    finite and of shape (n_features,) or (n_samples, n_features).
+
+    Parameters
+    ----------
+    score_func : callable
+        Function that computes the anomaly score for each sample of an array
+        of shape (n_samples, n_features).
+
+    threshold : float
+        Threshold.
+    """
+
+    __slots__ = ('threshold', '_score_func')
+
+    def __init__(self, score_func, threshold):
+        self.threshold   = threshold
+        self._score_func = score_func
+
+    def score_one(self, x):
+        """Compute the anomaly score for a single sample.
+
+        Parameters
+        ----------
+        x : array-like of shape (n_features,)
+            Sample.
+
+        Returns
+        -------
+        anomaly_score : float
+            Anomaly score for the sample.
+        """
+
+        x = np.asarray(x, dtype=np.float64).reshape(1, -1)
+
+        return float(self._score_func(x)[0])
+
+    def score_many(self, X):
+        """Compute the anomaly score for each sample.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Data.
+
+        Returns
+        -------
+        anomaly_score : array-like of shape (n_samples,)
+            Anomaly score for each sample.
+        """
+
+        return self._score_func(np.asarray(X, dtype=np.float64))
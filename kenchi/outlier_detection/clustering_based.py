@@ -113,6 +113,11 @@ class MiniBatchKMeans(BaseOutlierDetector):
         self.reassignment_ratio = reassignment_ratio
         self.tol                = tol
 
+    def _check_array(self, X, **kwargs):
+        kwargs.setdefault('accept_sparse', 'csr')
+
+        return super()._check_array(X, **kwargs)
+
     def _check_is_fitted(self):
         super()._check_is_fitted()
 
@@ -136,3 +141,16 @@ class MiniBatchKMeans(BaseOutlierDetector):
 
     def _anomaly_score(self, X):
         return np.min(self.estimator_.transform(X), axis=1)
+
+    def _compile(self):
+        cluster_centers = np.array(self.cluster_centers_, order='C')
+        center_norms    = np.sum(cluster_centers ** 2, axis=1)
+
+        def score_func(X):
+            dist = center_norms - 2. * X @ cluster_centers.T
+
+            return np.sqrt(
+                np.maximum(np.min(dist, axis=1) + np.sum(X ** 2, axis=1), 0.)
+            )
+
+        return score_func
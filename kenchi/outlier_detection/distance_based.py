@@ -1,13 +1,26 @@
 import numpy as np
+import scipy.sparse as sp
+from sklearn.metrics import pairwise_distances_chunked
 from sklearn.neighbors import DistanceMetric, NearestNeighbors
-from sklearn.utils import check_random_state
+from sklearn.utils import (
+    Bunch, check_random_state, gen_batches, get_chunk_n_rows
+)
 from sklearn.utils.validation import check_is_fitted
 
 from .base import BaseOutlierDetector
+from ..utils import check_novelty
 
 __all__ = ['KNN', 'OneTimeSampling']
 
 
+def _min_dist(dist, start):
+    """Reduce a block of the distance matrix to the minimum distance for each
+    sample.
+    """
+
+    return np.min(dist, axis=1)
+
+
 class KNN(BaseOutlierDetector):
     """Outlier detector using k-nearest neighbors algorithm.
 
@@ -19,7 +32,8 @@ class KNN(BaseOutlierDetector):
 
     algorithm : str, default 'auto'
         Tree algorithm to use. Valid algorithms are
-        ['kd_tree'|'ball_tree'|'auto'].
+        ['kd_tree'|'ball_tree'|'auto']. Brute force search is always used for
+        sparse input.
 
     contamination : float, default 0.1
         Proportion of outliers in the data set. Used to define the threshold.
@@ -107,6 +121,11 @@ class KNN(BaseOutlierDetector):
         self.p             = p
         self.metric_params = metric_params
 
+    def _check_array(self, X, **kwargs):
+        kwargs.setdefault('accept_sparse', 'csr')
+
+        return super()._check_array(X, **kwargs)
+
     def _check_is_fitted(self):
         super()._check_is_fitted()
 
@@ -135,11 +154,141 @@ class KNN(BaseOutlierDetector):
         else:
             dist, _ = self.estimator_.kneighbors(X)
 
+        # the neighbors are searched in double precision
+        dist = dist.astype(X.dtype, copy=False)
+
         if self.aggregate:
             return np.sum(dist, axis=1)
         else:
             return np.max(dist, axis=1)
 
+    def _score_path(self, dist, n_neighbors, aggregate):
+        """Compute the anomaly scores for the given combinations of the
+        number of neighbors and the aggregation mode from the distances to
+        the nearest neighbors, which are sorted in ascending order.
+        """
+
+        n_samples, _  = dist.shape
+        anomaly_score = np.empty(
+            (n_samples, len(n_neighbors) * len(aggregate)), dtype=dist.dtype
+        )
+        columns       = np.asarray(n_neighbors) - 1
+
+        for i, a in enumerate(aggregate):
+            j = i * len(n_neighbors)
+
+            if a:
+                anomaly_score[:, j:j + len(n_neighbors)] = \
+                    np.cumsum(dist, axis=1)[:, columns]
+            else:
+                anomaly_score[:, j:j + len(n_neighbors)] = dist[:, columns]
+
+        return anomaly_score
+
+    def anomaly_score_path(self, X=None, n_neighbors=None, aggregate=None):
+        """Compute the anomaly scores and the thresholds for several numbers
+        of neighbors and aggregation modes at once. A single ``kneighbors``
+        query for the largest number of neighbors is run on the training data
+        and, if ``X`` is given, another one on ``X``. The anomaly scores for
+        smaller numbers of neighbors are derived from the sorted distances and
+        their cumulative sums.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features), default None
+            Data. If None, compute the anomaly scores of the training samples.
+
+        n_neighbors : int or list of ints, default None
+            Numbers of neighbors. Each of them is clipped to the number of the
+            training samples minus one as in ``fit``. If None,
+            ``n_neighbors_`` is used.
+
+        aggregate : bool or list of bools, default None
+            Aggregation modes. If None, both False and True are used.
+
+        Returns
+        -------
+        path : Bunch
+            Dictionary-like object, whose attributes are ``params``, the list
+            of the parameters of shape (n_configs,), ``anomaly_score``, the
+            anomaly scores of shape (n_samples, n_configs), and
+            ``threshold``, the thresholds of shape (n_configs,) derived from
+            the anomaly scores of the training samples. The parameters are
+            ordered by the aggregation mode first and by the number of
+            neighbors second. Each column equals ``anomaly_score_`` of
+            ``KNN`` fitted with the corresponding parameters.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from kenchi.outlier_detection import KNN
+        >>> X = np.array([
+        ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+        ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+        ... ])
+        >>> det = KNN(n_neighbors=3).fit(X)
+        >>> path = det.anomaly_score_path(n_neighbors=[1, 3])
+        >>> path.params # doctest: +NORMALIZE_WHITESPACE
+        [{'aggregate': False, 'n_neighbors': 1},
+         {'aggregate': False, 'n_neighbors': 3},
+         {'aggregate': True, 'n_neighbors': 1},
+         {'aggregate': True, 'n_neighbors': 3}]
+        >>> path.anomaly_score.shape
+        (10, 4)
+        """
+
+        self._check_is_fitted()
+
+        # X is validated before the training data is queried, which is as
+        # expensive as the query on X
+        if X is not None:
+            check_novelty(self.novelty, 'anomaly_score_path')
+
+            X         = self._check_array(X, estimator=self)
+
+        n_samples, _  = self.X_.shape
+
+        if n_neighbors is None:
+            n_neighbors = [self.n_neighbors_]
+        elif np.ndim(n_neighbors) == 0:
+            n_neighbors = [n_neighbors]
+
+        if aggregate is None:
+            aggregate   = [False, True]
+        elif np.ndim(aggregate) == 0:
+            aggregate   = [aggregate]
+
+        n_neighbors   = [
+            max(1, min(int(k), n_samples - 1)) for k in n_neighbors
+        ]
+        aggregate     = [bool(a) for a in aggregate]
+        n_neighbors_  = max(n_neighbors)
+        dist, _       = self.estimator_.kneighbors(n_neighbors=n_neighbors_)
+        dist          = dist.astype(self.X_.dtype, copy=False)
+        anomaly_score = self._score_path(dist, n_neighbors, aggregate)
+        threshold     = np.percentile(
+            anomaly_score,
+            100. * (1. - self.contamination),
+            axis          = 0,
+            interpolation = 'lower'
+        )
+
+        if X is not None:
+            dist, _       = self.estimator_.kneighbors(
+                X, n_neighbors=n_neighbors_
+            )
+            dist          = dist.astype(X.dtype, copy=False)
+            anomaly_score = self._score_path(dist, n_neighbors, aggregate)
+
+        return Bunch(
+            params        = [
+                {'aggregate': a, 'n_neighbors': k}
+                for a in aggregate for k in n_neighbors
+            ],
+            anomaly_score = anomaly_score,
+            threshold     = threshold
+        )
+
 
 class OneTimeSampling(BaseOutlierDetector):
     """One-time sampling.
@@ -150,7 +299,10 @@ class OneTimeSampling(BaseOutlierDetector):
         Proportion of outliers in the data set. Used to define the threshold.
 
     metric : str, default 'euclidean'
-        Distance metric to use.
+        Distance metric to use. Dense input accepts the metrics of
+        ``sklearn.neighbors.DistanceMetric``, and sparse input those of
+        ``sklearn.metrics.pairwise_distances``, e.g., 'euclidean' and
+        'cosine'.
 
     novelty : bool, default False
         If True, you can use predict, decision_function and anomaly_score on
@@ -228,6 +380,8 @@ class OneTimeSampling(BaseOutlierDetector):
             )
 
     def _check_array(self, X, **kwargs):
+        kwargs.setdefault('accept_sparse', 'csr')
+
         X            = super()._check_array(X, **kwargs)
         n_samples, _ = X.shape
 
@@ -256,11 +410,26 @@ class OneTimeSampling(BaseOutlierDetector):
         self.subsamples_ = np.sort(subsamples)
         self.S_          = X[self.subsamples_]
 
-        self.metric_     = DistanceMetric.get_metric(
+        return self
+
+    def _anomaly_score(self, X):
+        # the distance matrix is computed block by block within the working
+        # memory, and sparse input is never densified
+        if sp.issparse(X):
+            return np.concatenate(list(pairwise_distances_chunked(
+                X, self.S_, metric=self.metric, reduce_func=_min_dist,
+                **self._metric_params
+            ))).astype(X.dtype, copy=False)
+
+        n_samples, _  = X.shape
+        metric        = DistanceMetric.get_metric(
             self.metric, **self._metric_params
         )
+        chunk_n_rows  = get_chunk_n_rows(row_bytes=8 * self.n_subsamples)
+        anomaly_score = np.empty(n_samples, dtype=X.dtype)
 
-        return self
+        # the distances are computed in double precision
+        for s in gen_batches(n_samples, chunk_n_rows):
+            anomaly_score[s] = np.min(metric.pairwise(X[s], self.S_), axis=1)
 
-    def _anomaly_score(self, X):
-        return np.min(self.metric_.pairwise(X, self.S_), axis=1)
+        return anomaly_score
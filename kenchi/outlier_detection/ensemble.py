@@ -1,9 +1,82 @@
+import numpy as np
+from sklearn.base import clone
 from sklearn.ensemble import IsolationForest
+from sklearn.externals.joblib import delayed, Parallel
+from sklearn.utils import check_random_state, gen_batches, get_chunk_n_rows
 from sklearn.utils.validation import check_is_fitted
 
 from .base import BaseOutlierDetector
+from .density_based import LOF
+from ..normalization import NORMALIZERS
 
-__all__ = ['IForest']
+__all__ = ['Cascade', 'FeatureBagging', 'IForest', 'ScoreEnsemble']
+
+COMBINATIONS   = ('aom', 'max', 'mean', 'moa', 'weighted')
+BAGGING_COMBINATIONS = ('breadth_first', 'cumulative_sum')
+NORMALIZATIONS = tuple(sorted(NORMALIZERS)) + ('zscore', )
+
+
+def _fit_normalizer(det, normalize):
+    """Fit the normalizer of the given calibration family of a fitted
+    detector or of the final detector of a fitted pipeline, so that scoring
+    does not fit it on each call.
+    """
+
+    if normalize not in NORMALIZERS:
+        return
+
+    final = det.steps[-1][1] if hasattr(det, 'steps') else det
+
+    final._fit_normalizers([normalize])
+
+
+def _set_novelty(det, novelty):
+    """Set the ``novelty`` parameter of a detector or of the final detector
+    of a pipeline, if it has the parameter.
+    """
+
+    final = det.steps[-1][1] if hasattr(det, 'steps') else det
+
+    if 'novelty' in final.get_params():
+        final.set_params(novelty=novelty)
+
+    return det
+
+
+def _fit_detector(det, X, normalize):
+    """Fit a detector, and return it together with the normalized anomaly
+    scores of the training samples.
+    """
+
+    det.fit(X)
+
+    _fit_normalizer(det, normalize)
+
+    return det, _score_detector(det, None, normalize)
+
+
+def _fit_subspace(det, X, features, normalize=None):
+    """Fit a detector on a feature subspace, and return it together with the
+    anomaly scores of the training samples.
+    """
+
+    # fancy indexing gathers the columns into a contiguous copy
+    det.fit(X[:, features])
+
+    _fit_normalizer(det, normalize)
+
+    return det, det.anomaly_score()
+
+
+def _score_detector(det, X, normalize):
+    """Compute the anomaly scores normalized by the calibration family of the
+    detector. The z-scores are computed by the caller.
+    """
+
+    if normalize in NORMALIZERS:
+        return det.anomaly_score(X, normalize=normalize)
+
+    return det.anomaly_score(X)
 
 
 class IForest(BaseOutlierDetector):
@@ -124,3 +197,586 @@ class IForest(BaseOutlierDetector):
 
     def _anomaly_score(self, X):
         return -self.estimator_.score_samples(X)
+
+
+class ScoreEnsemble(BaseOutlierDetector):
+    """Ensemble of heterogeneous outlier detectors, whose normalized anomaly
+    scores are combined into a single anomaly score. The detectors are fitted
+    concurrently by joblib, and evaluated concurrently in threads.
+
+    Parameters
+    ----------
+    detectors : list of (str, object) tuples
+        Named outlier detectors, which are cloned before being fitted. Their
+        ``novelty`` parameters, if any, are overridden by that of the
+        ensemble.
+
+    combine : str, default 'mean'
+        Combination of the normalized anomaly scores. Valid options are
+        ['aom'|'max'|'mean'|'moa'|'weighted']. 'aom' (average of maximum)
+        averages the maxima of randomly drawn buckets of detectors and 'moa'
+        (maximum of average) takes the maximum of their averages.
+
+    contamination : float, default 0.1
+        Proportion of outliers in the data set. Used to define the threshold.
+
+    normalize : str, default 'gaussian'
+        Normalization of the anomaly scores of each detector. Valid options
+        are ['gamma'|'gaussian'|'rank'|'zscore']. 'gamma', 'gaussian' and
+        'rank' are the calibration families of the detectors, which transform
+        anomaly scores into values in [0, 1]. 'zscore' standardizes anomaly
+        scores by the mean and the standard deviation of those of the
+        training samples.
+
+    n_buckets : int, default 5
+        Number of buckets of detectors, used when ``combine`` is 'aom' or
+        'moa'.
+
+    n_jobs : int, default 1
+        Number of jobs to run in parallel. If -1, then the number of jobs is
+        set to the number of CPU cores.
+
+    novelty : bool, default False
+        If True, you can use predict, decision_function and anomaly_score on
+        new unseen data and not on the training data.
+
+    random_state : int or RandomState instance, default None
+        Seed of the pseudo random number generator, used to draw the buckets
+        of detectors.
+
+    weights : array-like of shape (n_detectors,), default None
+        Weights of the detectors, used when ``combine`` is 'weighted'. If
+        None, the detectors are weighted uniformly.
+
+    Attributes
+    ----------
+    anomaly_score_ : array-like of shape (n_samples,)
+        Anomaly score for each training data.
+
+    buckets_ : list of array-likes
+        Indices of the detectors in each bucket.
+
+    contamination_ : float
+        Actual proportion of outliers in the data set.
+
+    detectors_ : list of objects
+        Fitted outlier detectors.
+
+    loc_ : array-like of shape (n_detectors,)
+        Mean of the anomaly scores of the training samples for each
+        detector, used to compute the z-scores.
+
+    scale_ : array-like of shape (n_detectors,)
+        Standard deviation of the anomaly scores of the training samples for
+        each detector, used to compute the z-scores.
+
+    threshold_ : float
+        Threshold.
+
+    References
+    ----------
+    .. [#aggarwal15] Aggarwal, C. C., and Sathe, S.,
+        "Theoretical foundations and algorithms for outlier ensembles,"
+        ACM SIGKDD Explorations Newsletter, 17(1), pp. 24-47, 2015.
+
+    .. [#kriegel11] Kriegel, H.-P., Kroger, P., Schubert, E., and Zimek, A.,
+        "Interpreting and unifying outlier scores,"
+        In Proceedings of SDM, pp. 13-24, 2011.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.outlier_detection import HBOS, KNN, ScoreEnsemble
+    >>> X = np.array([
+    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+    ... ])
+    >>> det = ScoreEnsemble([
+    ...     ('hbos', HBOS()), ('knn', KNN(n_neighbors=3))
+    ... ])
+    >>> det.fit_predict(X)
+    array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+    """
+
+    @property
+    def named_detectors_(self):
+        """dict: Fitted outlier detectors keyed by their names.
+        """
+
+        return {
+            name: det for (name, _), det in zip(
+                self.detectors, self.detectors_
+            )
+        }
+
+    def __init__(
+        self, detectors, combine='mean', contamination=0.1,
+        normalize='gaussian', n_buckets=5, n_jobs=1, novelty=False,
+        random_state=None, weights=None
+    ):
+        self.detectors     = detectors
+        self.combine       = combine
+        self.contamination = contamination
+        self.normalize     = normalize
+        self.n_buckets     = n_buckets
+        self.n_jobs        = n_jobs
+        self.novelty       = novelty
+        self.random_state  = random_state
+        self.weights       = weights
+
+    def _check_params(self):
+        super()._check_params()
+
+        if not self.detectors:
+            raise ValueError('detectors must not be empty')
+
+        if self.combine not in COMBINATIONS:
+            raise ValueError(
+                f'combine must be one of {list(COMBINATIONS)} '
+                f'but was {self.combine}'
+            )
+
+        if self.normalize not in NORMALIZATIONS:
+            raise ValueError(
+                f'normalize must be one of {list(NORMALIZATIONS)} '
+                f'but was {self.normalize}'
+            )
+
+        if self.n_buckets < 1:
+            raise ValueError(
+                f'n_buckets must be positive but was {self.n_buckets}'
+            )
+
+        if self.weights is not None \
+                and len(self.weights) != len(self.detectors):
+            raise ValueError(
+                f'weights must have {len(self.detectors)} elements '
+                f'but had {len(self.weights)} elements'
+            )
+
+    def _check_array(self, X, **kwargs):
+        # each detector validates the data by itself
+        kwargs.setdefault('accept_sparse', 'csr')
+
+        return super()._check_array(X, **kwargs)
+
+    def _check_is_fitted(self):
+        super()._check_is_fitted()
+
+        check_is_fitted(self, ['buckets_', 'detectors_', 'loc_', 'scale_'])
+
+    def _fit(self, X):
+        results                = Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_detector)(
+                _set_novelty(clone(det), self.novelty), X, self.normalize
+            ) for _, det in self.detectors
+        )
+        self.detectors_, scores = zip(*results)
+        self.detectors_        = list(self.detectors_)
+        scores                 = np.column_stack(scores)
+        self.loc_              = np.mean(scores, axis=0)
+        self.scale_            = np.std(scores, axis=0)
+
+        self.scale_[self.scale_ == 0.] = 1.
+
+        rnd                    = check_random_state(self.random_state)
+        n_detectors            = len(self.detectors_)
+        self.buckets_          = np.array_split(
+            rnd.permutation(n_detectors), min(self.n_buckets, n_detectors)
+        )
+
+        # the training samples are scored by the detectors while fitted,
+        # since detectors with novelty=False cannot score them afterwards
+        return self._combine(scores)
+
+    def _anomaly_score(self, X):
+        # threads share the fitted detectors instead of sending them to
+        # worker processes on each call
+        return self._combine(np.column_stack(
+            Parallel(n_jobs=self.n_jobs, prefer='threads')(
+                delayed(_score_detector)(det, X, self.normalize)
+                for det in self.detectors_
+            )
+        ))
+
+    def _combine(self, scores):
+        """Combine the normalized anomaly scores of the detectors."""
+
+        if self.normalize == 'zscore':
+            scores = (scores - self.loc_) / self.scale_
+
+        if self.combine == 'max':
+            return np.max(scores, axis=1)
+
+        if self.combine == 'mean':
+            return np.mean(scores, axis=1)
+
+        if self.combine == 'weighted':
+            return np.average(scores, axis=1, weights=self.weights)
+
+        if self.combine == 'aom':
+            return np.mean([
+                np.max(scores[:, bucket], axis=1) for bucket in self.buckets_
+            ], axis=0)
+
+        return np.max([
+            np.mean(scores[:, bucket], axis=1) for bucket in self.buckets_
+        ], axis=0)
+
+
+class Cascade(BaseOutlierDetector):
+    """Two-stage cascade of outlier detectors. A cheap first-stage detector
+    screens the samples, and only the samples whose anomaly scores are
+    greater than or equal to the screening threshold are scored by an
+    expensive second-stage detector. The other samples are cleared as
+    inliers, whose anomaly scores are 0.
+
+    The screening threshold is calibrated on the training data, so that the
+    proportion of the training outliers of the second-stage detector which
+    are cleared by the first-stage detector does not exceed
+    ``false_negative_rate``. Scoring does not modify the detector. The
+    samples routed to the second stage are reported by ``route``.
+
+    Parameters
+    ----------
+    first : object
+        First-stage outlier detector, which is cloned before being fitted.
+
+    second : object
+        Second-stage outlier detector, which is cloned before being fitted.
+
+    contamination : float, default 0.1
+        Proportion of outliers in the data set. Used to define the threshold.
+
+    false_negative_rate : float, default 0.01
+        Maximum proportion of the training outliers of the second-stage
+        detector cleared by the first-stage detector.
+
+    normalize : str, default 'gaussian'
+        Calibration family used to normalize the anomaly scores of the
+        second-stage detector. Valid options are ['gamma'|'gaussian'|'rank'].
+
+    Attributes
+    ----------
+    anomaly_score_ : array-like of shape (n_samples,)
+        Anomaly score for each training data.
+
+    contamination_ : float
+        Actual proportion of outliers in the data set.
+
+    first_ : object
+        Fitted first-stage outlier detector.
+
+    second_ : object
+        Fitted second-stage outlier detector.
+
+    screening_threshold_ : float
+        Threshold of the anomaly scores of the first-stage detector, below
+        which samples are cleared.
+
+    stage_fractions_ : array-like of shape (2,)
+        Proportions of the training samples finished by the first stage and
+        scored by the second stage.
+
+    threshold_ : float
+        Threshold.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.outlier_detection import Cascade, HBOS, KNN
+    >>> X = np.array([
+    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+    ... ])
+    >>> det = Cascade(
+    ...     HBOS(novelty=True), KNN(n_neighbors=3, novelty=True)
+    ... ).fit(X)
+    >>> det.predict([[0., 0.], [3., 0.], [1000., 1.]])
+    array([ 1,  1, -1])
+    >>> det.route([[0., 0.], [3., 0.], [1000., 1.]]).mean()
+    0.3333333333333333
+    """
+
+    def __init__(
+        self, first, second, contamination=0.1, false_negative_rate=0.01,
+        normalize='gaussian'
+    ):
+        self.first               = first
+        self.second              = second
+        self.contamination       = contamination
+        self.false_negative_rate = false_negative_rate
+        self.normalize           = normalize
+
+    def _check_params(self):
+        super()._check_params()
+
+        if not 0. <= self.false_negative_rate <= 1.:
+            raise ValueError(
+                f'false_negative_rate must be between 0.0 and 1.0 inclusive '
+                f'but was {self.false_negative_rate}'
+            )
+
+        if self.normalize not in NORMALIZERS:
+            raise ValueError(
+                f'normalize must be one of {sorted(NORMALIZERS)} '
+                f'but was {self.normalize}'
+            )
+
+    def _check_array(self, X, **kwargs):
+        # each detector validates the data by itself
+        kwargs.setdefault('accept_sparse', 'csr')
+
+        return super()._check_array(X, **kwargs)
+
+    def _check_is_fitted(self):
+        super()._check_is_fitted()
+
+        check_is_fitted(
+            self, ['first_', 'second_', 'screening_threshold_']
+        )
+
+    def _fit(self, X):
+        self.first_               = clone(self.first).fit(X)
+        self.second_              = clone(self.second).fit(X)
+
+        _fit_normalizer(self.second_, self.normalize)
+
+        first_score               = self.first_.anomaly_score()
+        is_outlier                = self.second_.predict() < 0
+
+        if np.any(is_outlier):
+            self.screening_threshold_ = np.percentile(
+                first_score[is_outlier],
+                100. * self.false_negative_rate,
+                interpolation = 'lower'
+            )
+        else:
+            self.screening_threshold_ = -np.inf
+
+        is_routed                 = first_score >= self.screening_threshold_
+        routed_fraction           = np.mean(is_routed)
+        self.stage_fractions_     = np.array(
+            [1. - routed_fraction, routed_fraction]
+        )
+
+        # the training samples are scored by the detectors while fitted,
+        # since detectors with novelty=False cannot score them afterwards
+        return np.where(
+            is_routed, self.second_.anomaly_score(normalize=self.normalize),
+            0.
+        )
+
+    def _anomaly_score(self, X):
+        is_routed              = self.route(X)
+        n_samples, _           = X.shape
+        anomaly_score          = np.zeros(n_samples, dtype=X.dtype)
+
+        if np.any(is_routed):
+            anomaly_score[is_routed] = self.second_.anomaly_score(
+                X[is_routed], normalize=self.normalize
+            )
+
+        return anomaly_score
+
+    def route(self, X):
+        """Determine which samples are scored by the second-stage detector.
+        The mean of the result is the proportion of the samples scored by the
+        second stage.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Data.
+
+        Returns
+        -------
+        is_routed : array-like of shape (n_samples,)
+            Return True for the samples scored by the second-stage detector
+            and False for those cleared by the first-stage detector.
+        """
+
+        self._check_is_fitted()
+
+        return self.first_.anomaly_score(X) >= self.screening_threshold_
+
+
+class FeatureBagging(BaseOutlierDetector):
+    """Feature bagging, which fits detectors on random feature subspaces and
+    combines their anomaly scores.
+
+    Parameters
+    ----------
+    detector : object, default None
+        Base outlier detector, which is cloned for each subspace. If None,
+        ``LOF`` is used. Its ``novelty`` parameter, if any, is overridden by
+        that of the ensemble.
+
+    combine : str, default 'cumulative_sum'
+        Combination of the anomaly scores. Valid options are
+        ['breadth_first'|'cumulative_sum']. 'cumulative_sum' sums the anomaly
+        scores. 'breadth_first' takes the maximum of the ranks of the anomaly
+        scores among those of the training samples, which orders samples as
+        the breadth-first interleaving of the rankings of the detectors.
+
+    contamination : float, default 0.1
+        Proportion of outliers in the data set. Used to define the threshold.
+
+    n_estimators : int, default 10
+        Number of feature subspaces.
+
+    n_jobs : int, default 1
+        Number of jobs to run in parallel. If -1, then the number of jobs is
+        set to the number of CPU cores.
+
+    novelty : bool, default False
+        If True, you can use predict, decision_function and anomaly_score on
+        new unseen data and not on the training data.
+
+    random_state : int or RandomState instance, default None
+        Seed of the pseudo random number generator.
+
+    Attributes
+    ----------
+    anomaly_score_ : array-like of shape (n_samples,)
+        Anomaly score for each training data.
+
+    contamination_ : float
+        Actual proportion of outliers in the data set.
+
+    detectors_ : list of objects
+        Outlier detectors fitted on the feature subspaces.
+
+    features_ : list of array-likes
+        Sorted indices of the features of each subspace, whose size is drawn
+        uniformly from [n_features / 2, n_features - 1].
+
+    threshold_ : float
+        Threshold.
+
+    References
+    ----------
+    .. [#lazarevic05] Lazarevic, A., and Kumar, V.,
+        "Feature bagging for outlier detection,"
+        In Proceedings of SIGKDD, pp. 157-166, 2005.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.outlier_detection import FeatureBagging, KNN
+    >>> X = np.array([
+    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+    ... ])
+    >>> det = FeatureBagging(KNN(n_neighbors=3), random_state=0)
+    >>> det.fit_predict(X)
+    array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+    """
+
+    def __init__(
+        self, detector=None, combine='cumulative_sum', contamination=0.1,
+        n_estimators=10, n_jobs=1, novelty=False, random_state=None
+    ):
+        self.detector      = detector
+        self.combine       = combine
+        self.contamination = contamination
+        self.n_estimators  = n_estimators
+        self.n_jobs        = n_jobs
+        self.novelty       = novelty
+        self.random_state  = random_state
+
+    def _check_params(self):
+        super()._check_params()
+
+        if self.combine not in BAGGING_COMBINATIONS:
+            raise ValueError(
+                f'combine must be one of {list(BAGGING_COMBINATIONS)} '
+                f'but was {self.combine}'
+            )
+
+        if self.n_estimators < 1:
+            raise ValueError(
+                f'n_estimators must be positive but was {self.n_estimators}'
+            )
+
+    def _check_array(self, X, **kwargs):
+        # each detector validates the data by itself
+        kwargs.setdefault('accept_sparse', 'csr')
+
+        return super()._check_array(X, **kwargs)
+
+    def _check_is_fitted(self):
+        super()._check_is_fitted()
+
+        check_is_fitted(self, ['detectors_', 'features_'])
+
+    def _make_detector(self):
+        if self.detector is None:
+            det = LOF()
+        else:
+            det = clone(self.detector)
+
+        return _set_novelty(det, self.novelty)
+
+    def _fit(self, X):
+        _, n_features          = X.shape
+        rnd                    = check_random_state(self.random_state)
+        min_features           = max(1, n_features // 2)
+        max_features           = max(min_features, n_features - 1)
+        self.features_         = [
+            np.sort(rnd.choice(
+                n_features,
+                rnd.randint(min_features, max_features + 1),
+                replace=False
+            )) for _ in range(self.n_estimators)
+        ]
+
+        results                = Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_subspace)(
+                self._make_detector(), X, features,
+                'rank' if self.combine == 'breadth_first' else None
+            ) for features in self.features_
+        )
+        self.detectors_, scores = zip(*results)
+        self.detectors_        = list(self.detectors_)
+        n_samples, _           = X.shape
+        anomaly_score          = np.zeros(n_samples, dtype=X.dtype)
+
+        for det, score in zip(self.detectors_, scores):
+            self._accumulate(anomaly_score, det, score)
+
+        # the training samples are scored by the detectors while fitted,
+        # since detectors with novelty=False cannot score them afterwards
+        return anomaly_score
+
+    def _accumulate(self, anomaly_score, det, score):
+        """Combine the anomaly scores of a detector into the given array."""
+
+        if self.combine == 'cumulative_sum':
+            anomaly_score += score
+        else:
+            np.maximum(
+                anomaly_score, det._get_normalizer('rank').cdf(score),
+                out=anomaly_score
+            )
+
+    def _anomaly_score(self, X):
+        n_samples, n_features  = X.shape
+        anomaly_score          = np.zeros(n_samples, dtype=X.dtype)
+
+        # the subspaces are gathered from blocks of rows, so that the memory
+        # does not grow with the number of the subspaces
+        chunk_n_rows           = get_chunk_n_rows(
+            row_bytes=X.dtype.itemsize * n_features
+        )
+
+        for s in gen_batches(n_samples, chunk_n_rows):
+            X_chunk            = X[s]
+
+            for det, features in zip(self.detectors_, self.features_):
+                self._accumulate(
+                    anomaly_score[s], det,
+                    det.anomaly_score(X_chunk[:, features])
+                )
+
+        return anomaly_score
@@ -1,5 +1,9 @@
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, svds
 from sklearn.decomposition import PCA as _PCA
+from sklearn.utils import check_random_state
+from sklearn.utils.extmath import row_norms, svd_flip
 from sklearn.utils.validation import check_is_fitted
 
 from .base import BaseOutlierDetector
@@ -20,7 +24,7 @@ class PCA(BaseOutlierDetector):
         'randomized'.
 
     n_components : int, float, or string, default None
-        Number of components to keep.
+        Number of components to keep. Must be an int for sparse input.
 
     random_state : int or RandomState instance, default None
         Seed of the pseudo random number generator.
@@ -130,6 +134,11 @@ class PCA(BaseOutlierDetector):
         self.tol            = tol
         self.whiten         = whiten
 
+    def _check_array(self, X, **kwargs):
+        kwargs.setdefault('accept_sparse', 'csr')
+
+        return super()._check_array(X, **kwargs)
+
     def _check_is_fitted(self):
         super()._check_is_fitted()
 
@@ -150,13 +159,115 @@ class PCA(BaseOutlierDetector):
             svd_solver     = self.svd_solver,
             tol            = self.tol,
             whiten         = self.whiten
-        ).fit(X)
+        )
+
+        if sp.issparse(X):
+            return self._fit_sparse(X)
+
+        self.estimator_.fit(X)
+
+        return self
+
+    def _fit_sparse(self, X):
+        """Fit the model to the given sparse data, which is centered
+        implicitly so that it is never densified.
+        """
+
+        n_samples, n_features = X.shape
+        n_components          = self.n_components
+
+        if not isinstance(n_components, (int, np.integer)) \
+                or not 0 < n_components < min(n_samples, n_features):
+            raise ValueError(
+                f'n_components must be an int in [1, '
+                f'{min(n_samples, n_features) - 1}] for sparse input '
+                f'but was {n_components}'
+            )
+
+        mean                  = np.asarray(X.mean(axis=0)).ravel()
+        ones                  = np.ones(n_samples, dtype=X.dtype)
+
+        def matvec(v):
+            return X @ v - mean @ v
+
+        def rmatvec(u):
+            return X.T @ u - mean * np.sum(u)
+
+        def matmat(V):
+            return X @ V - ones[:, np.newaxis] * (mean @ V)
+
+        X_centered            = LinearOperator(
+            (n_samples, n_features), dtype=X.dtype, matvec=matvec,
+            matmat=matmat, rmatvec=rmatvec
+        )
+        rnd                   = check_random_state(self.random_state)
+        n_min                 = min(n_samples, n_features)
+        v0                    = rnd.uniform(-1., 1., n_min)
+        U, S, V               = svds(
+            X_centered, k=n_components, tol=self.tol, v0=v0
+        )
+
+        # flip the order to obtain the singular values in descending order
+        U, V                  = svd_flip(U[:, ::-1], V[::-1])
+        S                     = S[::-1]
+
+        explained_variance    = S ** 2 / (n_samples - 1)
+        sum_of_squares        = np.asarray(X.multiply(X).sum(axis=0))
+        total_variance        = np.sum(
+            sum_of_squares.ravel() - n_samples * mean ** 2
+        ) / (n_samples - 1)
+
+        noise_variance        = (
+            total_variance - explained_variance.sum()
+        ) / (n_min - n_components)
+
+        self.estimator_.mean_                     = mean
+        self.estimator_.components_               = V
+        self.estimator_.explained_variance_       = explained_variance
+        self.estimator_.explained_variance_ratio_ = \
+            explained_variance / total_variance
+        self.estimator_.singular_values_          = S
+        self.estimator_.noise_variance_           = noise_variance
+        self.estimator_.n_components_             = n_components
+        self.estimator_.n_samples_                = n_samples
+        self.estimator_.n_features_               = n_features
 
         return self
 
     def _anomaly_score(self, X):
+        if sp.issparse(X):
+            return self._sparse_anomaly_score(X)
+
         return np.sum((X - self._reconstruct(X)) ** 2, axis=1)
 
+    def _sparse_anomaly_score(self, X):
+        """Compute the squared reconstruction error for each sample of the
+        given sparse data as the squared norm of the centered sample minus
+        that of its projection, so that the data is never densified.
+        """
+
+        mean        = self.mean_
+        components  = self.components_
+        X_projected = X @ components.T - mean @ components.T
+        X_sq_norms  = row_norms(X, squared=True) - 2. * (X @ mean) \
+            + mean @ mean
+
+        return np.maximum(
+            X_sq_norms - np.sum(X_projected ** 2, axis=1), 0.
+        ).astype(X.dtype, copy=False)
+
+    def _compile(self):
+        mean       = np.array(self.mean_, order='C')
+        components = np.array(self.components_, order='C')
+
+        def score_func(X):
+            X_centered = X - mean
+            X_residual = X_centered - X_centered @ components.T @ components
+
+            return np.sum(X_residual ** 2, axis=1)
+
+        return score_func
+
     def _reconstruct(self, X):
         """Apply dimensionality reduction to the given data, and transform the
         data back to its original space.
@@ -1,14 +1,62 @@
 import numpy as np
-from sklearn.cluster import affinity_propagation
-from sklearn.covariance import GraphicalLasso
-from sklearn.mixture import GaussianMixture
-from sklearn.neighbors import KernelDensity
+import scipy.sparse as sp
+from sklearn.utils import Bunch, gen_batches, get_chunk_n_rows
 from sklearn.utils.validation import check_is_fitted
 
 from .base import BaseOutlierDetector
+from ..instrumentation import get_recorder
 from ..plotting import plot_graphical_model, plot_partial_corrcoef
 
-__all__ = ['GMM', 'HBOS', 'KDE', 'SparseStructureLearning']
+__all__ = [
+    'GMM', 'HBOS', 'KDE', 'SparseStructureLearning',
+    'SparseStructureLearningCV'
+]
+
+
+def _merge_moments(n_samples, location, scatter, X, assume_centered=False):
+    """Merge the number of samples, the mean and the scatter matrix of the
+    given data into the running ones.
+
+    References
+    ----------
+    .. [#chan79] Chan, T. F., Golub, G. H., and LeVeque, R. J.,
+        "Updating formulae and a pairwise algorithm for computing sample
+        variances,"
+        Technical Report STAN-CS-79-773, Stanford University, 1979.
+    """
+
+    n_samples_chunk, n_features = X.shape
+
+    # the mean and the scatter matrix are computed and accumulated in double
+    # precision, since float32 data loses precision as it is summed
+    X                           = X.astype(np.float64, copy=False)
+
+    if assume_centered:
+        location_chunk          = np.zeros(n_features)
+        X_centered              = X
+    else:
+        location_chunk          = np.mean(X, axis=0)
+        X_centered              = X - location_chunk
+
+    scatter_chunk               = X_centered.T @ X_centered
+
+    if n_samples == 0:
+        return n_samples_chunk, location_chunk, scatter_chunk
+
+    n_samples_total             = n_samples + n_samples_chunk
+
+    if assume_centered:
+        return n_samples_total, location, scatter + scatter_chunk
+
+    delta                       = location_chunk - location
+    location                    = location \
+        + n_samples_chunk / n_samples_total * delta
+    scatter                     = scatter + scatter_chunk \
+        + n_samples * n_samples_chunk / n_samples_total * np.outer(
+            delta, delta
+        )
+
+    return n_samples_total, location, scatter
 
 
 class GMM(BaseOutlierDetector):
@@ -173,6 +221,8 @@ class GMM(BaseOutlierDetector):
         )
 
     def _fit(self, X):
+        from sklearn.mixture import GaussianMixture
+
         self.estimator_     = GaussianMixture(
             covariance_type = self.covariance_type,
             init_params     = self.init_params,
@@ -193,6 +243,55 @@ class GMM(BaseOutlierDetector):
     def _anomaly_score(self, X):
         return -self.estimator_.score_samples(X)
 
+    def _compile(self):
+        n_components, n_features = self.estimator_.means_.shape
+        covariance_type          = self.estimator_.covariance_type
+        precisions_chol          = self.estimator_.precisions_cholesky_
+
+        # express every covariance type as a stack of full Cholesky factors
+        if covariance_type == 'full':
+            precisions_chol      = np.array(precisions_chol)
+        elif covariance_type == 'tied':
+            precisions_chol      = np.tile(
+                precisions_chol, (n_components, 1, 1)
+            )
+        elif covariance_type == 'diag':
+            precisions_chol      = np.array([
+                np.diag(prec_chol) for prec_chol in precisions_chol
+            ])
+        else:
+            precisions_chol      = precisions_chol[:, np.newaxis, np.newaxis] \
+                * np.eye(n_features)
+
+        means_chol               = np.einsum(
+            'kd,kde->ke', self.estimator_.means_, precisions_chol
+        )
+        log_det                  = np.sum(
+            np.log(np.diagonal(precisions_chol, axis1=1, axis2=2)), axis=1
+        )
+        precisions_chol          = np.ascontiguousarray(
+            precisions_chol.transpose(1, 0, 2).reshape(n_features, -1)
+        )
+        offset                   = np.log(self.estimator_.weights_) \
+            + log_det - 0.5 * n_features * np.log(2. * np.pi)
+
+        def score_func(X):
+            n_samples, _         = X.shape
+            Y                    = (X @ precisions_chol).reshape(
+                n_samples, n_components, n_features
+            ) - means_chol
+            weighted_log_prob    = offset - 0.5 * np.sum(Y ** 2, axis=2)
+            max_log_prob         = np.max(weighted_log_prob, axis=1)
+
+            return -max_log_prob - np.log(
+                np.sum(
+                    np.exp(weighted_log_prob - max_log_prob[:, np.newaxis]),
+                    axis=1
+                )
+            )
+
+        return score_func
+
 
 class HBOS(BaseOutlierDetector):
     """Histogram-based outlier detector.
@@ -257,6 +356,11 @@ class HBOS(BaseOutlierDetector):
         self.contamination = contamination
         self.novelty       = novelty
 
+    def _check_array(self, X, **kwargs):
+        kwargs.setdefault('accept_sparse', 'csr')
+
+        return super()._check_array(X, **kwargs)
+
     def _check_is_fitted(self):
         super()._check_is_fitted()
 
@@ -265,21 +369,114 @@ class HBOS(BaseOutlierDetector):
     def _fit(self, X):
         _, n_features   = X.shape
 
-        self.data_max_  = np.max(X, axis=0)
-        self.data_min_  = np.min(X, axis=0)
+        if sp.issparse(X):
+            self.data_max_ = X.max(axis=0).toarray().ravel()
+            self.data_min_ = X.min(axis=0).toarray().ravel()
+            columns        = self._sparse_columns(X)
+        else:
+            self.data_max_ = np.max(X, axis=0)
+            self.data_min_ = np.min(X, axis=0)
+            columns        = ((col, None) for col in X.T)
+
         self.hist_      = np.empty(n_features, dtype=object)
         self.bin_edges_ = np.empty(n_features, dtype=object)
 
-        for j, col in enumerate(X.T):
+        for j, (col, weights) in enumerate(columns):
             self.hist_[j], self.bin_edges_[j] = np.histogram(
-                col, bins=self.bins, density=True
+                col, bins=self.bins, density=True, weights=weights
             )
 
         return self
 
+    def _sparse_columns(self, X):
+        """Generate the nonzero values of each column of the given sparse
+        data, where the implicit zeros are represented by a single zero
+        weighted by their number.
+        """
+
+        n_samples, n_features = X.shape
+        X                     = X.tocsc()
+
+        for j in range(n_features):
+            col               = X.data[X.indptr[j]:X.indptr[j + 1]]
+            n_zeros           = n_samples - col.size
+
+            if n_zeros == 0:
+                yield col, None
+
+            # bin estimators do not support weights, so the column is
+            # densified
+            elif isinstance(self.bins, str):
+                yield np.concatenate([col, np.zeros(n_zeros)]), None
+
+            else:
+                yield np.append(col, 0.), np.append(np.ones(col.size), n_zeros)
+
+    def _neg_log_prob(self, features, values):
+        """Look up the negative log probabilities of the given values of the
+        given features in the histograms.
+        """
+
+        n_bins        = np.array([hist.size for hist in self.hist_])
+        offsets       = np.cumsum(n_bins) - n_bins
+        first_edges   = np.array([edges[0] for edges in self.bin_edges_])
+        bin_widths    = np.array([
+            edges[1] - edges[0] for edges in self.bin_edges_
+        ])
+
+        with np.errstate(divide='ignore'):
+            neg_log_prob = -np.log(np.concatenate(self.hist_ * bin_widths))
+
+        # the bins are equally spaced
+        ind           = np.floor(
+            (values - first_edges[features]) / bin_widths[features]
+        ).astype(int)
+        ind           = np.minimum(np.maximum(ind, 0), n_bins[features] - 1)
+        is_in_range   = (self.data_min_[features] <= values) \
+            & (values <= self.data_max_[features])
+
+        return np.where(
+            is_in_range, neg_log_prob[offsets[features] + ind], np.inf
+        )
+
+    def _sparse_anomaly_score(self, X):
+        """Compute the anomaly score for each sample of the given sparse data
+        from the scores of the implicit zeros and the corrections for the
+        nonzero values, so that the data is never densified.
+        """
+
+        n_samples, n_features = X.shape
+        features              = np.arange(n_features)
+        zero_neg_log_prob     = self._neg_log_prob(
+            features, np.zeros(n_features)
+        )
+        is_inf                = np.isinf(zero_neg_log_prob)
+        zero_neg_log_prob[is_inf] = 0.
+
+        rows                  = np.repeat(
+            np.arange(n_samples), np.diff(X.indptr)
+        )
+        cols                  = X.indices
+        correction            = self._neg_log_prob(cols, X.data) \
+            - zero_neg_log_prob[cols]
+        anomaly_score         = np.sum(zero_neg_log_prob) + np.bincount(
+            rows, weights=correction, minlength=n_samples
+        )
+
+        # a sample is out of range if any of its implicit zeros is
+        n_inf_replaced        = np.bincount(
+            rows, weights=is_inf[cols], minlength=n_samples
+        )
+        anomaly_score[n_inf_replaced < np.sum(is_inf)] = np.inf
+
+        return anomaly_score.astype(X.dtype, copy=False)
+
     def _anomaly_score(self, X):
+        if sp.issparse(X):
+            return self._sparse_anomaly_score(X)
+
         n_samples, _           = X.shape
-        anomaly_score          = np.zeros(n_samples)
+        anomaly_score          = np.zeros(n_samples, dtype=X.dtype)
 
         for j, col in enumerate(X.T):
             bins,              = self.hist_[j].shape
@@ -292,7 +489,7 @@ class HBOS(BaseOutlierDetector):
             ind                = np.digitize(col, self.bin_edges_[j]) - 1
             ind[is_in_range & (ind == bins)] = bins - 1
 
-            prob               = np.zeros(n_samples)
+            prob               = np.zeros(n_samples, dtype=X.dtype)
             prob[is_in_range]  = self.hist_[j][ind[is_in_range]] * bin_width
 
             with np.errstate(divide='ignore'):
@@ -300,6 +497,42 @@ class HBOS(BaseOutlierDetector):
 
         return anomaly_score
 
+    def _compile(self):
+        n_features         = self.n_features_
+        n_bins             = np.array([hist.size for hist in self.hist_])
+        max_bins           = np.max(n_bins)
+        data_max           = np.array(self.data_max_)
+        data_min           = np.array(self.data_min_)
+
+        # pad the tables so that all features can be looked up at once
+        bin_edges          = np.full((n_features, max_bins + 1), np.inf)
+        neg_log_prob       = np.full((n_features, max_bins), np.inf)
+
+        for j, (hist, edges) in enumerate(zip(self.hist_, self.bin_edges_)):
+            bins,          = hist.shape
+            bin_edges[j, :bins + 1] = edges
+
+            with np.errstate(divide='ignore'):
+                neg_log_prob[j, :bins] = -np.log(hist * (edges[1] - edges[0]))
+
+        features           = np.arange(n_features)
+        max_ind            = n_bins - 1
+
+        def score_func(X):
+            ind            = np.sum(
+                bin_edges <= X[:, :, np.newaxis], axis=2
+            ) - 1
+            ind            = np.minimum(np.maximum(ind, 0), max_ind)
+            anomaly_score  = np.sum(neg_log_prob[features, ind], axis=1)
+            is_in_range    = np.all(
+                (data_min <= X) & (X <= data_max), axis=1
+            )
+            anomaly_score[~is_in_range] = np.inf
+
+            return anomaly_score
+
+        return score_func
+
 
 class KDE(BaseOutlierDetector):
     """Outlier detector using Kernel Density Estimation (KDE).
@@ -398,6 +631,9 @@ class KDE(BaseOutlierDetector):
         check_is_fitted(self, 'X_')
 
     def _fit(self, X):
+        # sklearn.neighbors is slow to import
+        from sklearn.neighbors import KernelDensity
+
         self.estimator_   = KernelDensity(
             algorithm     = self.algorithm,
             atol          = self.atol,
@@ -416,70 +652,9 @@ class KDE(BaseOutlierDetector):
         return -self.estimator_.score_samples(X)
 
 
-class SparseStructureLearning(BaseOutlierDetector):
-    """Outlier detector using sparse structure learning.
-
-    Parameters
-    ----------
-    alpha : float, default 0.01
-        Regularization parameter.
-
-    assume_centered : bool, default False
-        If True, data are not centered before computation.
-
-    contamination : float, default 0.1
-        Proportion of outliers in the data set. Used to define the threshold.
-
-    enet_tol : float, default 1e-04
-        Tolerance for the elastic net solver used to calculate the descent
-        direction. This parameter controls the accuracy of the search direction
-        for a given column update, not of the overall parameter estimate. Only
-        used for mode='cd'.
-
-    max_iter : integer, default 100
-        Maximum number of iterations.
-
-    mode : str, default 'cd'
-        Lasso solver to use: coordinate descent or LARS.
-
-    tol : float, default 1e-04
-        Tolerance to declare convergence.
-
-    apcluster_params : dict, default None
-        Additional parameters passed to
-        ``sklearn.cluster.affinity_propagation``.
-
-    Attributes
-    ----------
-    anomaly_score_ : array-like of shape (n_samples,)
-        Anomaly score for each training data.
-
-    contamination_ : float
-        Actual proportion of outliers in the data set.
-
-    threshold_ : float
-        Threshold.
-
-    labels_ : array-like of shape (n_features,)
-        Label of each feature.
-
-    References
-    ----------
-    .. [#ide09] Ide, T., Lozano, C., Abe, N., and Liu, Y.,
-        "Proximity-based anomaly detection using sparse structure learning,"
-        In Proceedings of SDM, pp. 97-108, 2009.
-
-    Examples
-    --------
-    >>> import numpy as np
-    >>> from kenchi.outlier_detection import SparseStructureLearning
-    >>> X = np.array([
-    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
-    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
-    ... ])
-    >>> det = SparseStructureLearning()
-    >>> det.fit_predict(X)
-    array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+class _BaseSparseStructureLearning(BaseOutlierDetector):
+    """Base class for the outlier detectors using sparse structure
+    learning.
     """
 
     @property
@@ -550,50 +725,186 @@ class SparseStructureLearning(BaseOutlierDetector):
 
         return self.estimator_.precision_
 
-    def __init__(
-        self, alpha=0.01, assume_centered=False, contamination=0.1,
-        enet_tol=1e-04, max_iter=100, mode='cd', tol=1e-04,
-        apcluster_params=None
-    ):
-        self.alpha            = alpha
-        self.apcluster_params = apcluster_params
-        self.assume_centered  = assume_centered
-        self.contamination    = contamination
-        self.enet_tol         = enet_tol
-        self.max_iter         = max_iter
-        self.mode             = mode
-        self.tol              = tol
-
     def _check_is_fitted(self):
         super()._check_is_fitted()
 
         check_is_fitted(
             self, [
                 'covariance_', 'labels_', 'location_', 'n_iter_',
-                'partial_corrcoef_', 'precision_'
+                'partial_corrcoef_', 'precision_', 'sparse_precision_'
             ]
         )
 
-    def _fit(self, X):
-        self.estimator_     = GraphicalLasso(
-            alpha           = self.alpha,
-            assume_centered = self.assume_centered,
-            enet_tol        = self.enet_tol,
-            max_iter        = self.max_iter,
-            mode            = self.mode,
-            tol             = self.tol
-        ).fit(X)
+    def _check_array(self, X, **kwargs):
+        # covariance does not make sense for a single feature
+        kwargs['ensure_min_features'] = 2
+
+        return super()._check_array(X, **kwargs)
+
+    def _empirical_covariance(self, X):
+        """Compute the location and the empirical covariance matrix."""
+
+        # sklearn.covariance imports scipy.stats, which is slow to import
+        from sklearn.covariance import empirical_covariance
 
-        _, self.labels_     = affinity_propagation(
+        if self.assume_centered:
+            location = np.zeros(X.shape[1], dtype=X.dtype)
+        else:
+            location = np.mean(X, axis=0)
+
+        emp_cov      = empirical_covariance(
+            X, assume_centered=self.assume_centered
+        )
+
+        return location, emp_cov
+
+    def _fit_structure(self):
+        """Cluster the features, and keep the sparse precision matrix."""
+
+        from sklearn.cluster import affinity_propagation
+
+        _, self.labels_        = affinity_propagation(
             self.partial_corrcoef_, **self._apcluster_params
         )
+        self.sparse_precision_ = sp.csr_matrix(
+            self.precision_, dtype=self.location_.dtype
+        )
 
         return self
 
     def _anomaly_score(self, X):
-        return self.estimator_.mahalanobis(X)
+        n_samples, _  = X.shape
+        anomaly_score = np.empty(n_samples, dtype=X.dtype)
+
+        for s, X_centered, X_precision in self._centered_product(X):
+            anomaly_score[s] = np.sum(X_centered * X_precision, axis=1)
 
-    def featurewise_anomaly_score(self, X):
+        return anomaly_score
+
+    def _compile(self):
+        location  = np.array(self.location_, order='C')
+        precision = self.sparse_precision_.copy()
+
+        # the sparse product only pays off when most entries are zero
+        if precision.nnz > 0.5 * np.prod(precision.shape):
+            precision = precision.toarray()
+
+        def score_func(X):
+            X_centered = X - location
+
+            # the precision matrix is symmetric
+            return np.sum(X_centered * (precision @ X_centered.T).T, axis=1)
+
+        return score_func
+
+    def _centered_product(self, X):
+        """Generate blocks of the centered data and their products with the
+        sparse precision matrix.
+        """
+
+        n_samples, n_features = X.shape
+        chunk_n_rows          = get_chunk_n_rows(row_bytes=16 * n_features)
+
+        for s in gen_batches(n_samples, chunk_n_rows):
+            X_centered        = X[s] - self.location_
+
+            # the precision matrix is symmetric
+            yield s, X_centered, (self.sparse_precision_ @ X_centered.T).T
+
+    def _featurewise_anomaly_score(self, X_precision):
+        """Compute the feature-wise anomaly scores from the product of the
+        centered data and the precision matrix.
+        """
+
+        diag = self.sparse_precision_.diagonal()
+
+        return 0.5 * np.log(2. * np.pi / diag) + 0.5 / diag * X_precision ** 2
+
+    def fit_path(self, X, alphas=10):
+        """Fit the model along a path of decreasing regularization
+        parameters. Each graphical lasso is warm-started from the covariance
+        matrix estimated with the previous regularization parameter, and the
+        empirical covariance matrix is computed only once.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data.
+
+        alphas : int or array-like of shape (n_alphas,), default 10
+            Regularization parameters. If an int is given, the grid is
+            log-spaced between alpha_max and 0.01 * alpha_max, where alpha_max
+            is the smallest value for which all the partial correlations are
+            zero. If alpha_max is 0, i.e., the features are uncorrelated, every
+            regularization parameter gives the same model, and the path
+            consists of a single detector with alpha=0.
+
+        Returns
+        -------
+        path : list
+            Fitted detectors in decreasing order of the regularization
+            parameter.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from kenchi.outlier_detection import SparseStructureLearning
+        >>> X = np.array([
+        ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+        ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+        ... ])
+        >>> det = SparseStructureLearning()
+        >>> path = det.fit_path(X, alphas=[1., 0.1, 0.01])
+        >>> [det.alpha for det in path]
+        [1.0, 0.1, 0.01]
+        """
+
+        self._check_params()
+
+        X                        = self._check_array(X, estimator=self)
+        location, emp_cov        = self._empirical_covariance(X)
+
+        if np.isscalar(alphas):
+            emp_cov_offdiag      = emp_cov - np.diag(np.diag(emp_cov))
+            alpha_max            = np.max(np.abs(emp_cov_offdiag))
+
+            # the log-spaced grid is undefined when alpha_max is 0
+            if alpha_max == 0.:
+                alphas           = [0.]
+            else:
+                alphas           = np.logspace(
+                    np.log10(alpha_max), np.log10(0.01 * alpha_max), alphas
+                )
+        else:
+            alphas               = np.sort(alphas)[::-1]
+
+        path                     = []
+        cov_init                 = None
+
+        for alpha in alphas:
+            det                  = SparseStructureLearning(
+                alpha            = alpha,
+                assume_centered  = self.assume_centered,
+                contamination    = self.contamination,
+                enet_tol         = self.enet_tol,
+                max_iter         = self.max_iter,
+                mode             = self.mode,
+                tol              = self.tol,
+                apcluster_params = self.apcluster_params
+            )
+
+            det._fit_covariance(location, emp_cov, cov_init=cov_init)
+            det._fit_anomaly_score([X])
+
+            cov_init             = det.covariance_
+
+            path.append(det)
+
+        return path
+
+    def featurewise_anomaly_score(
+        self, X, n_top_features=None, outliers_only=False
+    ):
         """Compute the feature-wise anomaly scores for each sample.
 
         Parameters
@@ -601,21 +912,110 @@ class SparseStructureLearning(BaseOutlierDetector):
         X : array-like of shape (n_samples, n_features)
             Data.
 
+        n_top_features : int, default None
+            If provided, return only the indices and the scores of the
+            features that contribute most to the anomaly score of each sample.
+
+        outliers_only : bool, default False
+            If True, return the feature-wise anomaly scores only for the
+            samples which are predicted as outliers.
+
         Returns
         -------
-        anomaly_score : array-like of shape (n_samples, n_features)
-            Feature-wise anomaly scores for each sample.
+        anomaly_score : array-like of shape (n_samples, n_features) or Bunch
+            Feature-wise anomaly scores for each sample. If ``n_top_features``
+            is provided or ``outliers_only`` is True, a Bunch object with the
+            following attributes is returned instead, where features are
+            sorted in descending order of their scores.
+
+            sample_ind : array-like of shape (n_selected_samples,)
+                Indices of the selected samples.
+
+            feature_ind : array-like of shape (n_selected_samples, k)
+                Indices of the top k features of each selected sample.
+
+            anomaly_score : array-like of shape (n_selected_samples, k)
+                Feature-wise anomaly scores of the top k features.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from kenchi.outlier_detection import SparseStructureLearning
+        >>> X = np.array([
+        ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+        ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+        ... ])
+        >>> det = SparseStructureLearning().fit(X)
+        >>> top = det.featurewise_anomaly_score(
+        ...     X, n_top_features=1, outliers_only=True
+        ... )
+        >>> top.sample_ind
+        array([9])
+        >>> top.feature_ind
+        array([[0]])
         """
 
         self._check_is_fitted()
 
-        X = self._check_array(X, estimator=self)
+        X                    = self._check_array(X, estimator=self)
+        _, n_features        = X.shape
+
+        if n_top_features is None and not outliers_only:
+            anomaly_score    = np.empty(X.shape)
+
+            for s, _, X_precision in self._centered_product(X):
+                anomaly_score[s] = self._featurewise_anomaly_score(
+                    X_precision
+                )
+
+            return anomaly_score
+
+        if n_top_features is None:
+            n_top_features   = n_features
+
+        if not 0 < n_top_features <= n_features:
+            raise ValueError(
+                f'n_top_features must be in (0, {n_features}] '
+                f'but was {n_top_features}'
+            )
+
+        sample_ind           = []
+        feature_ind          = []
+        anomaly_score        = []
+
+        for s, X_centered, X_precision in self._centered_product(X):
+            ind              = np.arange(s.start, s.stop)
+
+            if outliers_only:
+                is_outlier   = np.sum(
+                    X_centered * X_precision, axis=1
+                ) > self.threshold_
+                ind          = ind[is_outlier]
+                X_precision  = X_precision[is_outlier]
+
+            score            = self._featurewise_anomaly_score(X_precision)
+            rows             = np.arange(len(ind))[:, np.newaxis]
+
+            if n_top_features < n_features:
+                top          = np.argpartition(
+                    -score, n_top_features - 1, axis=1
+                )[:, :n_top_features]
+            else:
+                top          = np.tile(np.arange(n_features), (len(ind), 1))
+
+            top              = top[
+                rows, np.argsort(-score[rows, top], axis=1, kind='mergesort')
+            ]
 
-        return 0.5 * np.log(
-            2. * np.pi / np.diag(self.precision_)
-        ) + 0.5 / np.diag(
-            self.precision_
-        ) * ((X - self.location_) @ self.precision_) ** 2
+            sample_ind.append(ind)
+            feature_ind.append(top)
+            anomaly_score.append(score[rows, top])
+
+        return Bunch(
+            sample_ind    = np.concatenate(sample_ind),
+            feature_ind   = np.concatenate(feature_ind),
+            anomaly_score = np.concatenate(anomaly_score)
+        )
 
     def plot_graphical_model(self, **kwargs):
         """Plot the Gaussian Graphical Model (GGM).
@@ -698,3 +1098,346 @@ class SparseStructureLearning(BaseOutlierDetector):
         kwargs['partial_corrcoef'] = self.partial_corrcoef_
 
         return plot_partial_corrcoef(**kwargs)
+
+
+class SparseStructureLearning(_BaseSparseStructureLearning):
+    """Outlier detector using sparse structure learning.
+
+    Parameters
+    ----------
+    alpha : float, default 0.01
+        Regularization parameter.
+
+    assume_centered : bool, default False
+        If True, data are not centered before computation.
+
+    contamination : float, default 0.1
+        Proportion of outliers in the data set. Used to define the threshold.
+
+    enet_tol : float, default 1e-04
+        Tolerance for the elastic net solver used to calculate the descent
+        direction. This parameter controls the accuracy of the search direction
+        for a given column update, not of the overall parameter estimate. Only
+        used for mode='cd'.
+
+    max_iter : integer, default 100
+        Maximum number of iterations.
+
+    mode : str, default 'cd'
+        Lasso solver to use: coordinate descent or LARS.
+
+    tol : float, default 1e-04
+        Tolerance to declare convergence.
+
+    apcluster_params : dict, default None
+        Additional parameters passed to
+        ``sklearn.cluster.affinity_propagation``.
+
+    Attributes
+    ----------
+    anomaly_score_ : array-like of shape (n_samples,)
+        Anomaly score for each training data.
+
+    contamination_ : float
+        Actual proportion of outliers in the data set.
+
+    threshold_ : float
+        Threshold.
+
+    labels_ : array-like of shape (n_features,)
+        Label of each feature.
+
+    sparse_precision_ : sparse matrix of shape (n_features, n_features)
+        Estimated precision matrix in CSR format. Anomaly scores are computed
+        from this matrix, so that the cost of scoring is proportional to the
+        number of its non-zero entries.
+
+    References
+    ----------
+    .. [#ide09] Ide, T., Lozano, C., Abe, N., and Liu, Y.,
+        "Proximity-based anomaly detection using sparse structure learning,"
+        In Proceedings of SDM, pp. 97-108, 2009.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.outlier_detection import SparseStructureLearning
+    >>> X = np.array([
+    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+    ... ])
+    >>> det = SparseStructureLearning()
+    >>> det.fit_predict(X)
+    array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+    """
+
+    def __init__(
+        self, alpha=0.01, assume_centered=False, contamination=0.1,
+        enet_tol=1e-04, max_iter=100, mode='cd', tol=1e-04,
+        apcluster_params=None
+    ):
+        self.alpha            = alpha
+        self.apcluster_params = apcluster_params
+        self.assume_centered  = assume_centered
+        self.contamination    = contamination
+        self.enet_tol         = enet_tol
+        self.max_iter         = max_iter
+        self.mode             = mode
+        self.tol              = tol
+
+    def _fit(self, X):
+        return self._fit_covariance(*self._empirical_covariance(X))
+
+    def _fit_covariance(self, location, emp_cov, cov_init=None):
+        """Fit the model according to the given location and empirical
+        covariance matrix.
+        """
+
+        from sklearn.covariance import graphical_lasso, GraphicalLasso
+
+        self.estimator_           = GraphicalLasso(
+            alpha                 = self.alpha,
+            assume_centered       = self.assume_centered,
+            enet_tol              = self.enet_tol,
+            max_iter              = self.max_iter,
+            mode                  = self.mode,
+            tol                   = self.tol
+        )
+        self.estimator_.location_ = location
+
+        self.estimator_.covariance_, self.estimator_.precision_, \
+            self.estimator_.n_iter_ = graphical_lasso(
+                emp_cov,
+                alpha             = self.alpha,
+                cov_init          = cov_init,
+                enet_tol          = self.enet_tol,
+                max_iter          = self.max_iter,
+                mode              = self.mode,
+                return_n_iter     = True,
+                tol               = self.tol
+            )
+
+        return self._fit_structure()
+
+    def fit_chunks(self, chunks, sketch=None):
+        """Fit the model according to the given training data split into
+        chunks. The location and the scatter matrix are accumulated in a
+        single pass over the chunks, so that the training data is never
+        required to be resident in memory as a whole.
+
+        Parameters
+        ----------
+        chunks : iterable
+            Re-iterable collection of array-like of shape
+            (n_samples_chunk, n_features), e.g., a list of memory-mapped
+            arrays. It is iterated over twice: once to accumulate the
+            location and the scatter matrix, and once to compute the anomaly
+            score for each training sample.
+
+        sketch : KLLSketch, default None
+            Quantile sketch. If provided, the anomaly scores of the training
+            samples are summarized by the sketch, and ``anomaly_score_`` is
+            not retained.
+
+        Returns
+        -------
+        self : object
+            Return self.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from kenchi.outlier_detection import SparseStructureLearning
+        >>> X = np.array([
+        ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+        ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+        ... ])
+        >>> det = SparseStructureLearning()
+        >>> det.fit_chunks([X[:4], X[4:]]).predict()
+        array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+        """
+
+        if iter(chunks) is chunks:
+            raise ValueError('chunks must be re-iterable but was an iterator')
+
+        recorder                     = get_recorder('fit', 'fit_stats_')
+
+        self._check_params()
+
+        n_samples, location, scatter = 0, None, None
+        n_features, dtype            = None, None
+
+        with recorder.stage('fit') as stage:
+            for i, X in enumerate(chunks):
+                X                    = self._check_array(X, estimator=self)
+
+                if n_features is None:
+                    _, n_features    = X.shape
+                    dtype            = X.dtype
+                elif X.shape[1] != n_features:
+                    raise ValueError(
+                        f'chunk {i} is expected to have {n_features} '
+                        f'features but had {X.shape[1]} features'
+                    )
+
+                dtype                = np.promote_types(dtype, X.dtype)
+                n_samples, location, scatter = _merge_moments(
+                    n_samples, location, scatter, X,
+                    assume_centered  = self.assume_centered
+                )
+
+            if n_samples == 0:
+                raise ValueError('chunks must contain at least one sample')
+
+            self.n_features_         = n_features
+
+            # the location is stored in the dtype of the data as in fit
+            self._fit_covariance(
+                location.astype(dtype, copy=False), scatter / n_samples
+            )
+
+            stage.n_samples          = n_samples
+
+        return self._fit_anomaly_score(
+            (self._check_array(X, estimator=self) for X in chunks),
+            sketch   = sketch,
+            recorder = recorder
+        )
+
+
+class SparseStructureLearningCV(_BaseSparseStructureLearning):
+    """Outlier detector using sparse structure learning with cross-validated
+    choice of the regularization parameter.
+
+    Parameters
+    ----------
+    alphas : int or array-like of shape (n_alphas,), default 4
+        Regularization parameters. If an int is given, a grid of alphas is
+        computed and refined iteratively.
+
+    assume_centered : bool, default False
+        If True, data are not centered before computation.
+
+    contamination : float, default 0.1
+        Proportion of outliers in the data set. Used to define the threshold.
+
+    cv : int, cross-validation generator or iterable, default None
+        Determines the cross-validation splitting strategy.
+
+    enet_tol : float, default 1e-04
+        Tolerance for the elastic net solver used to calculate the descent
+        direction. This parameter controls the accuracy of the search direction
+        for a given column update, not of the overall parameter estimate. Only
+        used for mode='cd'.
+
+    max_iter : integer, default 100
+        Maximum number of iterations.
+
+    mode : str, default 'cd'
+        Lasso solver to use: coordinate descent or LARS.
+
+    n_jobs : int, default 1
+        Number of folds to compute in parallel. If -1, then the number of jobs
+        is set to the number of CPU cores.
+
+    n_refinements : int, default 4
+        Number of times the grid is refined. Not used if explicit values of
+        alphas are passed.
+
+    tol : float, default 1e-04
+        Tolerance to declare convergence.
+
+    apcluster_params : dict, default None
+        Additional parameters passed to
+        ``sklearn.cluster.affinity_propagation``.
+
+    Attributes
+    ----------
+    anomaly_score_ : array-like of shape (n_samples,)
+        Anomaly score for each training data.
+
+    contamination_ : float
+        Actual proportion of outliers in the data set.
+
+    threshold_ : float
+        Threshold.
+
+    labels_ : array-like of shape (n_features,)
+        Label of each feature.
+
+    sparse_precision_ : sparse matrix of shape (n_features, n_features)
+        Estimated precision matrix in CSR format.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.outlier_detection import SparseStructureLearningCV
+    >>> X = np.array([
+    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+    ... ])
+    >>> det = SparseStructureLearningCV(cv=3)
+    >>> det.fit_predict(X)
+    array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+    """
+
+    @property
+    def alpha_(self):
+        """float: Regularization parameter selected by cross-validation.
+        """
+
+        return self.estimator_.alpha_
+
+    @property
+    def cv_alphas_(self):
+        """list: All regularization parameters explored.
+        """
+
+        return self.estimator_.cv_alphas_
+
+    @property
+    def grid_scores_(self):
+        """array-like of shape (n_alphas, n_folds): Log-likelihood score on
+        left-out data across folds.
+        """
+
+        return self.estimator_.grid_scores_
+
+    def __init__(
+        self, alphas=4, assume_centered=False, contamination=0.1, cv=None,
+        enet_tol=1e-04, max_iter=100, mode='cd', n_jobs=1, n_refinements=4,
+        tol=1e-04, apcluster_params=None
+    ):
+        self.alphas           = alphas
+        self.apcluster_params = apcluster_params
+        self.assume_centered  = assume_centered
+        self.contamination    = contamination
+        self.cv               = cv
+        self.enet_tol         = enet_tol
+        self.max_iter         = max_iter
+        self.mode             = mode
+        self.n_jobs           = n_jobs
+        self.n_refinements    = n_refinements
+        self.tol              = tol
+
+    def _check_is_fitted(self):
+        super()._check_is_fitted()
+
+        check_is_fitted(self, ['alpha_', 'cv_alphas_', 'grid_scores_'])
+
+    def _fit(self, X):
+        from sklearn.covariance import GraphicalLassoCV
+
+        self.estimator_     = GraphicalLassoCV(
+            alphas          = self.alphas,
+            assume_centered = self.assume_centered,
+            cv              = self.cv,
+            enet_tol        = self.enet_tol,
+            max_iter        = self.max_iter,
+            mode            = self.mode,
+            n_jobs          = self.n_jobs,
+            n_refinements   = self.n_refinements,
+            tol             = self.tol
+        ).fit(X)
+
+        return self._fit_structure()
@@ -12,6 +12,8 @@ def load_tests(loader, tests, ignore):
 
 
 class FastABODTest(unittest.TestCase, OutlierDetectorTestMixin):
+    preserves_float32 = True
+
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
             self.prepare_data()
@@ -12,6 +12,9 @@ def load_tests(loader, tests, ignore):
 
 
 class MiniBatchKMeansTest(unittest.TestCase, OutlierDetectorTestMixin):
+    accepts_sparse    = True
+    preserves_float32 = True
+
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
             self.prepare_data()
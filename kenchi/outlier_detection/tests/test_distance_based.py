@@ -1,8 +1,10 @@
 import doctest
 import unittest
 
+import numpy as np
 from kenchi.outlier_detection import distance_based
 from kenchi.tests.common_tests import OutlierDetectorTestMixin
+from sklearn import config_context
 
 
 def load_tests(loader, tests, ignore):
@@ -12,14 +14,55 @@ def load_tests(loader, tests, ignore):
 
 
 class KNNTest(unittest.TestCase, OutlierDetectorTestMixin):
+    accepts_sparse    = True
+    preserves_float32 = True
+
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
             self.prepare_data()
 
         self.sut = distance_based.KNN(n_neighbors=3)
 
+    def test_anomaly_score_path(self):
+        self.sut.fit(self.X_train)
+
+        path = self.sut.anomaly_score_path(n_neighbors=[1, 3, 5])
+
+        self.assertEqual(path.anomaly_score.shape, (len(self.X_train), 6))
+
+        for params, anomaly_score, threshold in zip(
+            path.params, path.anomaly_score.T, path.threshold
+        ):
+            det = distance_based.KNN(**params).fit(self.X_train)
+
+            np.testing.assert_allclose(anomaly_score, det.anomaly_score_)
+            self.assertAlmostEqual(threshold, det.threshold_)
+
+    def test_anomaly_score_path_novelty(self):
+        self.sut.set_params(novelty=True).fit(self.X_train)
+
+        path = self.sut.anomaly_score_path(
+            self.X_test, n_neighbors=[2, 4], aggregate=True
+        )
+
+        for params, anomaly_score in zip(path.params, path.anomaly_score.T):
+            det = distance_based.KNN(novelty=True, **params).fit(self.X_train)
+
+            np.testing.assert_allclose(
+                anomaly_score, det.anomaly_score(self.X_test)
+            )
+
+    def test_anomaly_score_path_without_novelty(self):
+        self.sut.fit(self.X_train)
+
+        with self.assertRaises(AttributeError):
+            self.sut.anomaly_score_path(self.X_test)
+
 
 class OneTimeSamplingTest(unittest.TestCase, OutlierDetectorTestMixin):
+    accepts_sparse    = True
+    preserves_float32 = True
+
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
             self.prepare_data()
@@ -27,3 +70,16 @@ class OneTimeSamplingTest(unittest.TestCase, OutlierDetectorTestMixin):
         self.sut = distance_based.OneTimeSampling(
             n_subsamples=3, random_state=0
         )
+
+    def test_anomaly_score_subsamples(self):
+        self.sut.set_params(novelty=True).fit(self.X_train)
+
+        X             = np.vstack([self.sut.S_, self.X_test])
+        anomaly_score = self.sut.anomaly_score(X)
+
+        np.testing.assert_array_equal(anomaly_score[:3], 0.)
+
+        with config_context(working_memory=0):
+            np.testing.assert_array_equal(
+                self.sut.anomaly_score(X), anomaly_score
+            )
@@ -3,6 +3,12 @@ import unittest
 
 import numpy as np
 from kenchi.outlier_detection import ensemble
+from kenchi.outlier_detection.distance_based import KNN
+from kenchi.outlier_detection.reconstruction_based import PCA
+from kenchi.outlier_detection.statistical import HBOS
+from kenchi.pipeline import make_pipeline
+from sklearn import config_context
+from sklearn.preprocessing import StandardScaler
 from kenchi.tests.common_tests import OutlierDetectorTestMixin
 
 
@@ -12,6 +18,143 @@ def load_tests(loader, tests, ignore):
     return tests
 
 
+class CascadeTest(unittest.TestCase, OutlierDetectorTestMixin):
+    def setUp(self):
+        self.X_train, self.X_test, self.y_train, self.y_test = \
+            self.prepare_data()
+
+        self.sut = ensemble.Cascade(
+            HBOS(novelty=True), KNN(n_neighbors=3, novelty=True),
+            false_negative_rate=0.
+        )
+
+    def test_fit(self):
+        super().test_fit()
+
+        is_outlier  = self.sut.second_.predict() < 0
+        first_score = self.sut.first_.anomaly_score()
+
+        self.assertGreaterEqual(
+            np.min(first_score[is_outlier]), self.sut.screening_threshold_
+        )
+        self.assertAlmostEqual(np.sum(self.sut.stage_fractions_), 1.)
+        self.assertGreater(self.sut.stage_fractions_[0], 0.)
+
+    def test_anomaly_score_routed(self):
+        self.sut.fit(self.X_train)
+
+        is_routed     = self.sut.route(self.X_test)
+        anomaly_score = self.sut.anomaly_score(self.X_test)
+
+        np.testing.assert_array_equal(anomaly_score[~is_routed], 0.)
+        np.testing.assert_allclose(
+            anomaly_score[is_routed],
+            self.sut.second_.anomaly_score(
+                self.X_test[is_routed], normalize='gaussian'
+            )
+        )
+
+    def test_anomaly_score_read_only(self):
+        self.sut.fit(self.X_train)
+
+        params = set(vars(self.sut))
+
+        self.sut.predict(self.X_test)
+
+        self.assertEqual(set(vars(self.sut)), params)
+
+    def test_anomaly_score_float32(self):
+        self.sut.fit(self.X_train)
+
+        anomaly_score = self.sut.anomaly_score(
+            self.X_test.astype(np.float32)
+        )
+
+        self.assertEqual(anomaly_score.dtype, np.float32)
+
+    def test_pipeline(self):
+        pipeline = make_pipeline(StandardScaler(), self.sut)
+        y_pred   = pipeline.fit(self.X_train).predict(self.X_test)
+
+        self.assertEqual(y_pred.shape, self.y_test.shape)
+
+    def test_invalid_params(self):
+        for params in [{'false_negative_rate': 1.5}, {'normalize': 'zscore'}]:
+            self.sut.set_params(**params)
+
+            with self.assertRaises(ValueError):
+                self.sut.fit(self.X_train)
+
+
+class FeatureBaggingTest(unittest.TestCase, OutlierDetectorTestMixin):
+    accepts_sparse = True
+
+    def setUp(self):
+        self.X_train, self.X_test, self.y_train, self.y_test = \
+            self.prepare_data()
+
+        self.sut = ensemble.FeatureBagging(
+            KNN(n_neighbors=3), n_estimators=5, random_state=0
+        )
+
+    def test_fit(self):
+        super().test_fit()
+
+        self.assertEqual(len(self.sut.detectors_), 5)
+
+        for det, features in zip(self.sut.detectors_, self.sut.features_):
+            self.assertEqual(len(features), 1)
+            self.assertTrue(det.novelty is False)
+
+    def test_anomaly_score_training(self):
+        self.sut.fit(self.X_train)
+
+        np.testing.assert_allclose(
+            self.sut.anomaly_score_,
+            np.sum([det.anomaly_score_ for det in self.sut.detectors_], axis=0)
+        )
+
+    def test_anomaly_score_chunked(self):
+        self.sut.set_params(combine='breadth_first', novelty=True)
+
+        anomaly_score = self.sut.fit(self.X_train).anomaly_score(self.X_test)
+        scores        = [
+            det._get_normalizer('rank').cdf(
+                det.anomaly_score(self.X_test[:, features])
+            ) for det, features in zip(
+                self.sut.detectors_, self.sut.features_
+            )
+        ]
+
+        np.testing.assert_allclose(anomaly_score, np.max(scores, axis=0))
+
+        for det in self.sut.detectors_:
+            self.assertIn('rank', det.normalizers_)
+
+        with config_context(working_memory=0):
+            np.testing.assert_allclose(
+                self.sut.anomaly_score(self.X_test), anomaly_score
+            )
+
+    def test_fit_parallel(self):
+        self.sut.set_params(novelty=True)
+
+        anomaly_score = self.sut.fit(self.X_train).anomaly_score(self.X_test)
+
+        self.sut.set_params(n_jobs=2).fit(self.X_train)
+
+        np.testing.assert_allclose(
+            self.sut.anomaly_score(self.X_test), anomaly_score
+        )
+
+    def test_invalid_params(self):
+        for params in [{'combine': 'mean'}, {'n_estimators': 0}]:
+            self.sut.set_params(**params)
+
+            with self.assertRaises(ValueError):
+                self.sut.fit(self.X_train)
+
+
 class IForestTest(unittest.TestCase, OutlierDetectorTestMixin):
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
@@ -26,3 +169,104 @@ class IForestTest(unittest.TestCase, OutlierDetectorTestMixin):
         y_pred_estimator = self.sut.estimator_.predict(self.X_test)
 
         np.testing.assert_equal(y_pred_sut, y_pred_estimator)
+
+
+class ScoreEnsembleTest(unittest.TestCase, OutlierDetectorTestMixin):
+    def setUp(self):
+        self.X_train, self.X_test, self.y_train, self.y_test = \
+            self.prepare_data()
+
+        self.sut = ensemble.ScoreEnsemble([
+            ('hbos', HBOS(novelty=True)),
+            ('knn', KNN(n_neighbors=3, novelty=True)),
+            ('pca', PCA(n_components=1))
+        ])
+
+    def test_fit_parallel(self):
+        self.sut.set_params(novelty=True)
+
+        anomaly_score = self.sut.fit(self.X_train).anomaly_score(self.X_test)
+
+        self.sut.set_params(n_jobs=2).fit(self.X_train)
+
+        np.testing.assert_allclose(
+            self.sut.anomaly_score(self.X_test), anomaly_score
+        )
+
+    def test_anomaly_score_training(self):
+        self.sut.set_params(
+            detectors=[
+                ('knn', KNN(n_neighbors=3)), ('pca', PCA(n_components=1))
+            ]
+        ).fit(self.X_train)
+
+        scores = [
+            det.anomaly_score(normalize='gaussian')
+            for det in self.sut.detectors_
+        ]
+
+        np.testing.assert_allclose(
+            self.sut.anomaly_score_, np.mean(scores, axis=0)
+        )
+
+    def test_combine(self):
+        for combine in ensemble.COMBINATIONS:
+            for normalize in ensemble.NORMALIZATIONS:
+                self.sut.set_params(
+                    combine=combine, normalize=normalize, n_buckets=2,
+                    novelty=True, random_state=0, weights=[1., 2., 3.]
+                ).fit(self.X_train)
+
+                anomaly_score = self.sut.anomaly_score(self.X_test)
+
+                self.assertEqual(anomaly_score.shape, self.y_test.shape)
+
+    def test_combine_max(self):
+        self.sut.set_params(combine='max', normalize='zscore', novelty=True)
+
+        anomaly_score = self.sut.fit(self.X_train).anomaly_score(self.X_test)
+        scores        = [
+            det.anomaly_score(self.X_test) for det in self.sut.detectors_
+        ]
+        scores        = (np.transpose(scores) - self.sut.loc_) \
+            / self.sut.scale_
+
+        np.testing.assert_allclose(anomaly_score, np.max(scores, axis=1))
+
+    def test_novelty(self):
+        self.sut.fit(self.X_train)
+
+        for det in self.sut.detectors_:
+            if hasattr(det, 'novelty'):
+                self.assertFalse(det.novelty)
+
+        self.assertRaises(
+            AttributeError, self.sut.anomaly_score, self.X_test
+        )
+
+        self.sut.set_params(novelty=True).fit(self.X_train)
+
+        for det in self.sut.detectors_:
+            if hasattr(det, 'novelty'):
+                self.assertTrue(det.novelty)
+
+    def test_named_detectors(self):
+        self.sut.fit(self.X_train)
+
+        self.assertIsInstance(self.sut.named_detectors_['hbos'], HBOS)
+        self.assertIsNot(
+            self.sut.named_detectors_['hbos'], self.sut.detectors[0][1]
+        )
+
+    def test_invalid_params(self):
+        for params in [
+            {'detectors': []},
+            {'combine': 'median'},
+            {'normalize': 'minmax'},
+            {'n_buckets': 0},
+            {'weights': [1., 2.]}
+        ]:
+            self.sut.set_params(**params)
+
+            with self.assertRaises(ValueError):
+                self.sut.fit(self.X_train)
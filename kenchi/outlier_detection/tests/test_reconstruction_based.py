@@ -1,6 +1,7 @@
 import doctest
 import unittest
 
+import scipy.sparse as sp
 from kenchi.outlier_detection import reconstruction_based
 from kenchi.tests.common_tests import OutlierDetectorTestMixin
 
@@ -12,8 +13,21 @@ def load_tests(loader, tests, ignore):
 
 
 class PCATest(unittest.TestCase, OutlierDetectorTestMixin):
+    accepts_sparse    = True
+    preserves_float32 = True
+
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
             self.prepare_data()
 
         self.sut = reconstruction_based.PCA()
+
+    def test_sparse(self):
+        self.sut.set_params(n_components=1)
+
+        super().test_sparse()
+
+    def test_sparse_invalid_n_components(self):
+        self.assertRaises(
+            ValueError, self.sut.fit, sp.csr_matrix(self.X_train)
+        )
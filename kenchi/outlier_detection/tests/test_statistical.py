@@ -1,6 +1,7 @@
 import doctest
 import unittest
 
+import numpy as np
 from kenchi.outlier_detection import statistical
 from kenchi.tests.common_tests import OutlierDetectorTestMixin
 from sklearn.exceptions import NotFittedError
@@ -30,6 +31,9 @@ class KDETest(unittest.TestCase, OutlierDetectorTestMixin):
 
 
 class HBOSTest(unittest.TestCase, OutlierDetectorTestMixin):
+    accepts_sparse    = True
+    preserves_float32 = True
+
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
             self.prepare_data()
@@ -50,6 +54,8 @@ class HBOSTest(unittest.TestCase, OutlierDetectorTestMixin):
 
 
 class SparseStructureLearningTest(unittest.TestCase, OutlierDetectorTestMixin):
+    preserves_float32 = True
+
     def setUp(self):
         self.X_train, self.X_test, self.y_train, self.y_test = \
             self.prepare_data()
@@ -63,6 +69,157 @@ class SparseStructureLearningTest(unittest.TestCase, OutlierDetectorTestMixin):
 
         self.assertEqual(anomaly_score.shape, self.X_test.shape)
 
+    def test_featurewise_anomaly_score_top_features(self):
+        self.sut.fit(self.X_train)
+
+        anomaly_score = self.sut.featurewise_anomaly_score(self.X_test)
+        top           = self.sut.featurewise_anomaly_score(
+            self.X_test, n_top_features=1
+        )
+
+        np.testing.assert_array_equal(
+            top.feature_ind[:, 0], np.argmax(anomaly_score, axis=1)
+        )
+        np.testing.assert_allclose(
+            top.anomaly_score[:, 0], np.max(anomaly_score, axis=1)
+        )
+
+    def test_featurewise_anomaly_score_outliers_only(self):
+        self.sut.fit(self.X_train)
+
+        y_pred = self.sut.predict(self.X_test)
+        top    = self.sut.featurewise_anomaly_score(
+            self.X_test, outliers_only=True
+        )
+
+        np.testing.assert_array_equal(
+            top.sample_ind, np.flatnonzero(y_pred == -1)
+        )
+        self.assertEqual(top.anomaly_score.shape, top.feature_ind.shape)
+        self.assertTrue(np.all(np.diff(top.anomaly_score, axis=1) <= 0.))
+
+    def test_anomaly_score_sparse_precision(self):
+        self.sut.fit(self.X_train)
+
+        anomaly_score = self.sut.anomaly_score(self.X_test)
+
+        np.testing.assert_allclose(
+            anomaly_score, self.sut.estimator_.mahalanobis(self.X_test)
+        )
+
+    def test_featurewise_anomaly_score_sparse_precision(self):
+        self.sut.fit(self.X_train)
+
+        diag          = np.diag(self.sut.precision_)
+        X_centered    = self.X_test - self.sut.location_
+        X_precision   = X_centered @ self.sut.precision_
+        anomaly_score = self.sut.featurewise_anomaly_score(self.X_test)
+
+        np.testing.assert_allclose(
+            anomaly_score,
+            0.5 * np.log(2. * np.pi / diag) + 0.5 / diag * X_precision ** 2
+        )
+
+    def test_compile_sparse_precision(self):
+        self.sut.set_params(alpha=10.).fit(self.X_train)
+
+        scorer = self.sut.compile()
+
+        self.assertLess(
+            self.sut.sparse_precision_.nnz, self.sut.precision_.size
+        )
+        np.testing.assert_allclose(
+            scorer.score_many(self.X_test),
+            self.sut.anomaly_score(self.X_test)
+        )
+
+    def test_fit_chunks(self):
+        chunks = np.array_split(self.X_train, 3)
+
+        self.sut.fit_chunks(chunks)
+
+        anomaly_score = self.sut.anomaly_score(self.X_test)
+        ref           = statistical.SparseStructureLearning()
+
+        ref.fit(self.X_train)
+
+        np.testing.assert_allclose(self.sut.covariance_, ref.covariance_)
+        np.testing.assert_allclose(
+            self.sut.anomaly_score_, ref.anomaly_score_
+        )
+        np.testing.assert_allclose(
+            anomaly_score, ref.anomaly_score(self.X_test)
+        )
+
+    def test_merge_moments_float32(self):
+        X             = np.random.RandomState(0).normal(
+            loc=1000., size=(10000, 2)
+        ).astype(np.float32)
+        X_float64     = X.astype(np.float64)
+        _, location, scatter = statistical._merge_moments(
+            0, None, None, X[:5000]
+        )
+        _, location, scatter = statistical._merge_moments(
+            5000, location, scatter, X[5000:]
+        )
+        X_centered    = X_float64 - np.mean(X_float64, axis=0)
+
+        self.assertEqual(location.dtype, np.float64)
+        self.assertEqual(scatter.dtype, np.float64)
+        np.testing.assert_allclose(
+            location, np.mean(X_float64, axis=0), rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            scatter, X_centered.T @ X_centered, rtol=1e-10
+        )
+
+    def test_fit_chunks_float32(self):
+        X      = self.X_train.astype(np.float32)
+
+        self.sut.fit_chunks(np.array_split(X, 3))
+
+        self.assertEqual(self.sut.location_.dtype, np.float32)
+        np.testing.assert_allclose(
+            self.sut.location_, np.mean(self.X_train, axis=0), rtol=1e-06
+        )
+
+    def test_fit_chunks_n_features(self):
+        X      = np.hstack([self.X_train, self.X_train])
+        chunks = [self.X_train[:10], X[10:]]
+
+        with self.assertRaisesRegex(ValueError, 'chunk 1'):
+            self.sut.fit_chunks(chunks)
+
+    def test_fit_chunks_iterator(self):
+        chunks = iter(np.array_split(self.X_train, 3))
+
+        self.assertRaises(ValueError, self.sut.fit_chunks, chunks)
+
+    def test_fit_path(self):
+        alphas = [0.1, 1., 0.01]
+        path   = self.sut.fit_path(self.X_train, alphas=alphas)
+
+        self.assertEqual([det.alpha for det in path], sorted(alphas)[::-1])
+
+        for det in path:
+            ref = statistical.SparseStructureLearning(alpha=det.alpha)
+
+            ref.fit(self.X_train)
+
+            np.testing.assert_allclose(
+                det.precision_, ref.precision_, atol=1e-03
+            )
+            np.testing.assert_allclose(
+                det.threshold_, ref.threshold_, rtol=1e-03
+            )
+
+    def test_fit_path_uncorrelated(self):
+        X    = np.array([[1., 0.], [-1., 0.], [0., 1.], [0., -1.]])
+        path = self.sut.fit_path(X, alphas=3)
+
+        self.assertEqual([det.alpha for det in path], [0.])
+        np.testing.assert_allclose(path[0].precision_, np.diag([2., 2.]))
+
     @if_matplotlib
     def test_plot_graphical_model(self):
         import matplotlib.pyplot as plt
@@ -99,3 +256,24 @@ class SparseStructureLearningTest(unittest.TestCase, OutlierDetectorTestMixin):
     @if_matplotlib
     def test_plot_partial_corrcoef_notfitted(self):
         self.assertRaises(NotFittedError, self.sut.plot_partial_corrcoef)
+
+
+class SparseStructureLearningCVTest(
+    unittest.TestCase, OutlierDetectorTestMixin
+):
+    def setUp(self):
+        self.X_train, self.X_test, self.y_train, self.y_test = \
+            self.prepare_data()
+
+        self.sut = statistical.SparseStructureLearningCV(cv=3)
+
+    def test_alpha_(self):
+        self.sut.fit(self.X_train)
+
+        self.assertIn(self.sut.alpha_, self.sut.cv_alphas_)
+
+    def test_fit_chunks(self):
+        self.assertFalse(hasattr(self.sut, 'fit_chunks'))
+        self.assertNotIn(
+            'fit_chunks', dir(statistical.SparseStructureLearningCV)
+        )
@@ -0,0 +1,156 @@
+import os
+import pickle
+
+import numpy as np
+
+__all__ = ['dump', 'load']
+
+PICKLE_NAME = 'model.pkl'
+ARRAY_DIR   = 'arrays'
+
+
+class _ArrayPickler(pickle.Pickler):
+    """Pickler which writes large numeric arrays to separate ``.npy`` files
+    instead of embedding them in the pickle stream.
+    """
+
+    def __init__(self, file, dirname, min_nbytes, **kwargs):
+        super().__init__(file, **kwargs)
+
+        self.dirname    = dirname
+        self.min_nbytes = min_nbytes
+        self.filenames  = []
+
+        # keep references to the written arrays, so that their ids are not
+        # reused while pickling
+        self._written   = {}
+
+    def persistent_id(self, obj):
+        if not isinstance(obj, np.ndarray) \
+                or obj.dtype.hasobject or obj.nbytes < self.min_nbytes:
+            return None
+
+        key          = id(obj)
+
+        if key in self._written:
+            return self._written[key][1]
+
+        basename     = os.path.join(ARRAY_DIR, f'{len(self._written)}.npy')
+        filename     = os.path.join(self.dirname, basename)
+
+        # the header of the .npy format is padded so that the data starts at
+        # an aligned offset
+        np.save(filename, np.asarray(obj), allow_pickle=False)
+
+        self.filenames.append(filename)
+        self._written[key] = obj, ('ndarray', basename)
+
+        return self._written[key][1]
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """Unpickler which loads arrays written by ``_ArrayPickler``."""
+
+    def __init__(self, file, dirname, mmap_mode):
+        super().__init__(file)
+
+        self.dirname   = dirname
+        self.mmap_mode = mmap_mode
+        self._loaded   = {}
+
+    def persistent_load(self, pid):
+        kind, basename = pid
+
+        if kind != 'ndarray':
+            raise pickle.UnpicklingError(f'unknown persistent id {pid}')
+
+        if basename not in self._loaded:
+            self._loaded[basename] = np.load(
+                os.path.join(self.dirname, basename),
+                mmap_mode=self.mmap_mode, allow_pickle=False
+            )
+
+        return self._loaded[basename]
+
+
+def dump(obj, dirname, min_nbytes=1024, protocol=pickle.HIGHEST_PROTOCOL):
+    """Persist an object into a directory, where numeric arrays whose size is
+    greater than or equal to ``min_nbytes`` are stored as separate ``.npy``
+    files and the rest of the object is pickled.
+
+    Parameters
+    ----------
+    obj : object
+        Object to be persisted.
+
+    dirname : str or pathlib.Path
+        Path of the directory in which it is to be stored. It is created if
+        it does not exist.
+
+    min_nbytes : int, default 1024
+        Minimum number of bytes of an array stored as a separate file.
+
+    protocol : int, default pickle.HIGHEST_PROTOCOL
+        Pickle protocol.
+
+    Returns
+    -------
+    filenames : list
+        List of file names in which the data is stored.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import numpy as np
+    >>> from kenchi.outlier_detection import KNN
+    >>> from kenchi.persistence import dump, load
+    >>> rnd = np.random.RandomState(0)
+    >>> X_train = rnd.normal(size=(1000, 2))
+    >>> X_test = rnd.normal(size=(10, 2))
+    >>> det = KNN(novelty=True).fit(X_train)
+    >>> with tempfile.TemporaryDirectory() as dirname:
+    ...     filenames = dump(det, dirname)
+    ...     det_loaded = load(dirname)
+    ...     np.array_equal(det_loaded.predict(X_test), det.predict(X_test))
+    True
+    """
+
+    dirname  = os.fspath(dirname)
+
+    os.makedirs(os.path.join(dirname, ARRAY_DIR), exist_ok=True)
+
+    filename = os.path.join(dirname, PICKLE_NAME)
+
+    with open(filename, 'wb') as f:
+        pickler = _ArrayPickler(f, dirname, min_nbytes, protocol=protocol)
+
+        pickler.dump(obj)
+
+    return [filename] + pickler.filenames
+
+
+def load(dirname, mmap_mode='r'):
+    """Load an object persisted by ``dump``. Arrays stored as separate files
+    are memory-mapped, so that processes which load the same directory share
+    the pages of the arrays.
+
+    Parameters
+    ----------
+    dirname : str or pathlib.Path
+        Path of the directory in which the object is stored.
+
+    mmap_mode : {None, 'r', 'r+', 'c'}, default 'r'
+        Mode in which the arrays are memory-mapped. If None, the arrays are
+        read into memory. With 'r', the arrays are read-only. With 'c', they
+        are copy-on-write, so that pages are only copied when modified.
+
+    Returns
+    -------
+    obj : object
+        Loaded object.
+    """
+
+    dirname = os.fspath(dirname)
+
+    with open(os.path.join(dirname, PICKLE_NAME), 'rb') as f:
+        return _ArrayUnpickler(f, dirname, mmap_mode).load()
@@ -1,10 +1,73 @@
-from sklearn.externals.joblib import dump
+from collections import OrderedDict
+from hashlib import blake2b
+
+import numpy as np
 from sklearn.pipeline import _name_estimators, Pipeline as _Pipeline
 from sklearn.utils.metaestimators import if_delegate_has_method
 
+from .outlier_detection.base import CompiledScorer
+from .persistence import dump as dump_directory
+
 __all__ = ['make_pipeline', 'Pipeline']
 
 
+class _TransformCache:
+    """Bounded in-memory LRU cache of transformed data, which is keyed by the
+    content fingerprint of the given data.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.n_bytes   = 0
+        self._entries  = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _fingerprint(self, X):
+        """Compute the content fingerprint of the given data."""
+
+        if not isinstance(X, np.ndarray) or X.dtype.hasobject:
+            return None
+
+        h = blake2b(digest_size=16)
+
+        h.update(f'{X.shape}{X.dtype.str}'.encode())
+        h.update(np.ascontiguousarray(X).data)
+
+        return h.digest()
+
+    def transform(self, transform, X):
+        """Return the transformed data from the cache if possible, otherwise
+        apply ``transform`` and store the result.
+        """
+
+        key                = self._fingerprint(X)
+
+        if key is None:
+            return transform(X)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+            return self._entries[key]
+
+        Xt                 = transform(X)
+        n_bytes            = getattr(Xt, 'nbytes', None)
+
+        if n_bytes is None or n_bytes > self.max_bytes:
+            return Xt
+
+        self._entries[key] = Xt
+        self.n_bytes      += n_bytes
+
+        while self.n_bytes > self.max_bytes:
+            _, evicted     = self._entries.popitem(last=False)
+            self.n_bytes  -= evicted.nbytes
+
+        return Xt
+
+
 def make_pipeline(*steps):
     """Construct a Pipeline from the given estimators. This is a shorthand for
     the Pipeline constructor; it does not require, and does not permit, naming
@@ -53,6 +116,13 @@ class Pipeline(_Pipeline):
         Caching the transformers is advantageous when fitting is time
         consuming.
 
+    transform_cache_size : int, default None
+        Maximum size in bytes of the in-memory cache of transformed data. If
+        provided, the transformed data is reused across calls on the same
+        data, e.g., ``anomaly_score``, ``predict`` and ``predict_proba``, and
+        the least recently used entries are evicted. The cache is cleared
+        whenever the pipeline is fitted. By default, no caching is performed.
+
     Attributes
     ----------
     named_steps : dict
@@ -76,6 +146,18 @@ class Pipeline(_Pipeline):
     array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
     """
 
+    def __init__(self, steps, memory=None, transform_cache_size=None):
+        super().__init__(steps, memory=memory)
+
+        self.transform_cache_size = transform_cache_size
+
+    def __getstate__(self):
+        state = super().__getstate__()
+
+        state.pop('_transform_cache', None)
+
+        return state
+
     def __len__(self):
         return len(self.named_steps)
 
@@ -85,16 +167,104 @@ class Pipeline(_Pipeline):
     def __iter__(self):
         return iter(self.named_steps)
 
+    def _fit(self, X, y=None, **fit_params):
+        self._transform_cache = None
+
+        return super()._fit(X, y, **fit_params)
+
     def _pre_transform(self, X):
         if X is None:
             return X
 
+        if self.transform_cache_size is None:
+            return self._transform(X)
+
+        if getattr(self, '_transform_cache', None) is None:
+            self._transform_cache = _TransformCache(self.transform_cache_size)
+
+        return self._transform_cache.transform(self._transform, X)
+
+    def _transform(self, X):
         for _, transform in self.steps[:-1]:
             if transform is not None:
                 X = transform.transform(X)
 
         return X
 
+    @if_delegate_has_method(delegate='_final_estimator')
+    def predict(self, X=None, **kwargs):
+        """Apply transforms, and predict if a particular sample is an outlier
+        or not with the final estimator.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features), default None
+            Data. If None, predict if a particular training sample is an
+            outlier or not.
+
+        threshold : float, default None
+            User-provided threshold.
+
+        Returns
+        -------
+        y_pred : array-like of shape (n_samples,)
+            Return -1 for outliers and +1 for inliers.
+        """
+
+        X = self._pre_transform(X)
+
+        return self._final_estimator.predict(X, **kwargs)
+
+    @if_delegate_has_method(delegate='_final_estimator')
+    def predict_proba(self, X=None, **kwargs):
+        """Apply transforms, and predict class probabilities for each sample
+        with the final estimator.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features), default None
+            Data. If None, predict class probabilities for each training
+            sample.
+
+        normalize : bool or str, default True
+            Calibration family used to normalize the anomaly score. Valid
+            options are ['gamma'|'gaussian'|'rank']. True means 'gaussian'.
+
+        Returns
+        -------
+        y_score : array-like of shape (n_samples, n_classes)
+            Class probabilities.
+        """
+
+        X = self._pre_transform(X)
+
+        return self._final_estimator.predict_proba(X, **kwargs)
+
+    @if_delegate_has_method(delegate='_final_estimator')
+    def decision_function(self, X=None, **kwargs):
+        """Apply transforms, and compute the decision function of the given
+        samples with the final estimator.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features), default None
+            Data. If None, compute the decision function of the given training
+            samples.
+
+        threshold : float, default None
+            User-provided threshold.
+
+        Returns
+        -------
+        shiftted_score_samples : array-like of shape (n_samples,)
+            Shifted opposite of the anomaly score for each sample. Negative
+            scores represent outliers and positive scores represent inliers.
+        """
+
+        X = self._pre_transform(X)
+
+        return self._final_estimator.decision_function(X, **kwargs)
+
     @if_delegate_has_method(delegate='_final_estimator')
     def score_samples(self, X=None):
         """Apply transforms, and compute the opposite of the anomaly score for
@@ -124,8 +294,10 @@ class Pipeline(_Pipeline):
         X : array-like of shape (n_samples, n_features)
             Data. If None, compute the anomaly score for each training samples.
 
-        normalize : bool, default False
-            If True, return the normalized anomaly score.
+        normalize : bool or str, default False
+            If True or the name of a calibration family, return the
+            normalized anomaly score. Valid options are
+            ['gamma'|'gaussian'|'rank']. True means 'gaussian'.
 
         Returns
         -------
@@ -138,7 +310,111 @@ class Pipeline(_Pipeline):
         return self._final_estimator.anomaly_score(X, **kwargs)
 
     @if_delegate_has_method(delegate='_final_estimator')
-    def featurewise_anomaly_score(self, X):
+    def score_batch(self, X=None, **kwargs):
+        """Apply transforms once, and compute several outputs for each sample
+        from a single evaluation of the anomaly score with the final
+        estimator.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features), default None
+            Data. If None, compute the outputs for each training sample.
+
+        outputs : tuple of str, default ('anomaly_score', \
+            'decision_function', 'predict', 'predict_proba')
+            Names of the outputs to be computed.
+
+        threshold : float, default None
+            User-provided threshold.
+
+        normalize : bool or str, default True
+            Calibration family used to compute the class probabilities. Valid
+            options are ['gamma'|'gaussian'|'rank']. True means 'gaussian'.
+
+        out : dict, default None
+            Preallocated arrays keyed by output names, into which the results
+            are to be written.
+
+        Returns
+        -------
+        result : Bunch
+            Dictionary-like object, whose attributes are the requested
+            outputs.
+        """
+
+        X = self._pre_transform(X)
+
+        return self._final_estimator.score_batch(X, **kwargs)
+
+    def score_all(self, X=None, threshold=None):
+        """Apply transforms once, and compute the anomaly score, the decision
+        function, the predicted labels and the class probabilities for each
+        sample from a single evaluation of the anomaly score with the final
+        estimator.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features), default None
+            Data. If None, compute the outputs for each training sample.
+
+        threshold : float, default None
+            User-provided threshold.
+
+        Returns
+        -------
+        result : Bunch
+            Dictionary-like object, with the attributes ``anomaly_score``,
+            ``decision_function``, ``predict`` and ``predict_proba``.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from kenchi.outlier_detection import MiniBatchKMeans
+        >>> from kenchi.pipeline import Pipeline
+        >>> from sklearn.preprocessing import StandardScaler
+        >>> X = np.array([
+        ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+        ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+        ... ])
+        >>> det = MiniBatchKMeans(n_clusters=1, random_state=0)
+        >>> scaler = StandardScaler()
+        >>> pipeline = Pipeline([('scaler', scaler), ('det', det)]).fit(X)
+        >>> pipeline.score_all(X).predict
+        array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
+        """
+
+        return self.score_batch(X, threshold=threshold)
+
+    @if_delegate_has_method(delegate='_final_estimator')
+    def compile(self):
+        """Export a low-overhead scorer which applies transforms, and computes
+        the anomaly score with the compiled final estimator. Unlike the
+        parameters of the final estimator, those of the transformers are not
+        snapshotted.
+
+        Returns
+        -------
+        scorer : CompiledScorer
+            Scorer for the fitted pipeline.
+        """
+
+        scorer     = self._final_estimator.compile()
+        score_func = scorer._score_func
+        transforms = [
+            transform.transform for _, transform in self.steps[:-1]
+            if transform is not None
+        ]
+
+        def pipeline_score_func(X):
+            for transform in transforms:
+                X = transform(X)
+
+            return score_func(X)
+
+        return CompiledScorer(pipeline_score_func, scorer.threshold)
+
+    @if_delegate_has_method(delegate='_final_estimator')
+    def featurewise_anomaly_score(self, X, **kwargs):
         """Apply transforms, and compute the feature-wise anomaly scores for
         each sample with the final estimator.
 
@@ -147,15 +423,23 @@ class Pipeline(_Pipeline):
         X : array-like of shape (n_samples, n_features)
             Data.
 
+        n_top_features : int, default None
+            If provided, return only the indices and the scores of the
+            features that contribute most to the anomaly score of each sample.
+
+        outliers_only : bool, default False
+            If True, return the feature-wise anomaly scores only for the
+            samples which are predicted as outliers.
+
         Returns
         -------
-        anomaly_score : array-like of shape (n_samples, n_features)
+        anomaly_score : array-like of shape (n_samples, n_features) or Bunch
             Feature-wise anomaly scores for each sample.
         """
 
         X = self._pre_transform(X)
 
-        return self._final_estimator.featurewise_anomaly_score(X)
+        return self._final_estimator.featurewise_anomaly_score(X, **kwargs)
 
     def to_pickle(self, filename, **kwargs):
         """Persist a pipeline object.
@@ -174,8 +458,31 @@ class Pipeline(_Pipeline):
             List of file names in which the data is stored.
         """
 
+        from sklearn.externals.joblib import dump
+
         return dump(self, filename, **kwargs)
 
+    def to_directory(self, dirname, **kwargs):
+        """Persist a pipeline object into a directory, where large
+        arrays are stored as separate ``.npy`` files, so that they can be
+        memory-mapped by ``kenchi.persistence.load``.
+
+        Parameters
+        ----------
+        dirname : str or pathlib.Path
+            Path of the directory in which it is to be stored.
+
+        kwargs : dict
+            Other keywords passed to ``kenchi.persistence.dump``.
+
+        Returns
+        -------
+        filenames : list
+            List of file names in which the data is stored.
+        """
+
+        return dump_directory(self, dirname, **kwargs)
+
     @if_delegate_has_method(delegate='_final_estimator')
     def plot_anomaly_score(self, X=None, **kwargs):
         """Apply transoforms, and plot the anomaly score for each sample with
@@ -186,8 +493,9 @@ class Pipeline(_Pipeline):
         X : array-like of shape (n_samples, n_features), default None
             Data. If None, plot the anomaly score for each training samples.
 
-        normalize : bool, default False
-            If True, plot the normalized anomaly score.
+        normalize : bool or str, default False
+            If True or the name of a calibration family, plot the normalized
+            anomaly score.
 
         ax : matplotlib Axes, default None
             Target axes instance.
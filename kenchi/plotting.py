@@ -1,6 +1,4 @@
 import numpy as np
-from scipy.stats import gaussian_kde
-from sklearn.metrics import auc, roc_curve
 from sklearn.utils.validation import check_array, check_symmetric, column_or_1d
 
 __all__ = [
@@ -86,6 +84,7 @@ def plot_anomaly_score(
 
     import matplotlib.pyplot as plt
     from mpl_toolkits.axes_grid1 import make_axes_locatable
+    from scipy.stats import gaussian_kde
 
     def _get_ax_hist(ax):
         locator          = ax.get_axes_locator()
@@ -236,6 +235,7 @@ def plot_roc_curve(
     """
 
     import matplotlib.pyplot as plt
+    from sklearn.metrics import auc, roc_curve
 
     fpr, tpr, _          = roc_curve(y_true, y_score)
     roc_auc              = auc(fpr, tpr)
@@ -0,0 +1,410 @@
+import asyncio
+import json
+
+import numpy as np
+from sklearn.utils import Bunch
+
+__all__ = ['MicroBatchScorer', 'start_http_server']
+
+OUTPUTS            = ('anomaly_score', 'predict')
+MAX_CONTENT_LENGTH = 2 ** 20
+REASONS            = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    500: 'Internal Server Error'
+}
+
+
+class MicroBatchScorer:
+    """Asynchronous scorer which coalesces individual records into
+    micro-batches, and computes the outputs for each batch with a single
+    vectorized call in an executor.
+
+    Parameters
+    ----------
+    detector : object
+        Fitted outlier detector or pipeline providing ``score_batch``.
+
+    executor : concurrent.futures.Executor, default None
+        Executor in which the outputs are computed. If None, the default
+        executor of the event loop is used.
+
+    max_batch_size : int, default 64
+        Maximum number of records in a batch.
+
+    max_latency : float, default 0.005
+        Maximum time in seconds to wait for more records after the first
+        record of a batch arrives.
+
+    outputs : tuple of str, default ('anomaly_score', 'predict')
+        Names of the outputs to be computed for each record.
+
+    Attributes
+    ----------
+    n_batches_ : int
+        Number of the processed batches.
+
+    n_records_ : int
+        Number of the processed records.
+
+    max_observed_batch_size_ : int
+        Size of the largest processed batch.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> import numpy as np
+    >>> from kenchi.outlier_detection import MiniBatchKMeans
+    >>> from kenchi.serving import MicroBatchScorer
+    >>> X = np.array([
+    ...     [0., 0.], [1., 1.], [2., 0.], [3., -1.], [4., 0.],
+    ...     [5., 1.], [6., 0.], [7., -1.], [8., 0.], [1000., 1.]
+    ... ])
+    >>> det = MiniBatchKMeans(n_clusters=1, random_state=0).fit(X)
+    >>> loop = asyncio.new_event_loop()
+    >>> scorer = MicroBatchScorer(det)
+    >>> async def score(X):
+    ...     await scorer.start()
+    ...     results = await asyncio.gather(*[scorer.submit(x) for x in X])
+    ...     await scorer.stop()
+    ...     return [result.predict for result in results]
+    >>> loop.run_until_complete(score(X))
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, -1]
+    >>> scorer.n_batches_
+    1
+    >>> loop.close()
+    """
+
+    @property
+    def queue_depth(self):
+        """int: Number of the records waiting to be batched."""
+
+        if self._queue is None:
+            return 0
+
+        return self._queue.qsize()
+
+    @property
+    def mean_batch_size_(self):
+        """float: Mean number of records in a batch."""
+
+        if self.n_batches_ == 0:
+            return 0.
+
+        return self.n_records_ / self.n_batches_
+
+    def __init__(
+        self, detector, executor=None, max_batch_size=64, max_latency=0.005,
+        outputs=OUTPUTS
+    ):
+        self.detector                 = detector
+        self.executor                 = executor
+        self.max_batch_size           = max_batch_size
+        self.max_latency              = max_latency
+        self.outputs                  = outputs
+
+        self.n_batches_               = 0
+        self.n_records_               = 0
+        self.max_observed_batch_size_ = 0
+
+        self._loop                    = None
+        self._queue                   = None
+        self._worker                  = None
+
+    async def start(self):
+        """Start the background task which processes micro-batches."""
+
+        if self.max_batch_size < 1:
+            raise ValueError(
+                f'max_batch_size must be positive '
+                f'but was {self.max_batch_size}'
+            )
+
+        if self.max_latency < 0.:
+            raise ValueError(
+                f'max_latency must be non-negative '
+                f'but was {self.max_latency}'
+            )
+
+        if self._worker is not None:
+            return
+
+        self._loop   = asyncio.get_event_loop()
+        self._queue  = asyncio.Queue()
+        self._worker = self._loop.create_task(self._run())
+
+    async def stop(self):
+        """Process the queued records, and stop the background task."""
+
+        if self._worker is None:
+            return
+
+        await self._queue.put(None)
+        await self._worker
+
+        self._worker = None
+
+    async def submit(self, x):
+        """Submit a single record, and wait for its outputs.
+
+        Parameters
+        ----------
+        x : array-like of shape (n_features,)
+            Record.
+
+        Returns
+        -------
+        result : Bunch
+            Dictionary-like object, whose attributes are the requested
+            outputs for the record.
+        """
+
+        if self._worker is None:
+            raise RuntimeError('the scorer has not been started')
+
+        x          = np.asarray(x, dtype=np.float64)
+
+        if x.ndim != 1:
+            raise ValueError(
+                f'x is expected to be a 1-D array but had {x.ndim} dimensions'
+            )
+
+        # a record of the wrong length is rejected before it is queued, so
+        # that it does not fail the other records in its batch
+        n_features = getattr(self.detector, 'n_features_', None)
+
+        if n_features is not None and x.shape[0] != n_features:
+            raise ValueError(
+                f'x is expected to have {n_features} features but had '
+                f'{x.shape[0]} features'
+            )
+
+        future     = self._loop.create_future()
+
+        await self._queue.put((x, future))
+
+        return await future
+
+    def metrics(self):
+        """Get the current queue depth and batch-size statistics.
+
+        Returns
+        -------
+        metrics : dict
+            Queue depth, numbers of batches and records, and mean and maximum
+            batch sizes.
+        """
+
+        return {
+            'queue_depth':             self.queue_depth,
+            'n_batches':               self.n_batches_,
+            'n_records':               self.n_records_,
+            'mean_batch_size':         self.mean_batch_size_,
+            'max_observed_batch_size': self.max_observed_batch_size_
+        }
+
+    async def _next_batch(self):
+        """Wait for the first record, and collect the following records until
+        the batch is full or the latency budget is spent.
+        """
+
+        item           = await self._queue.get()
+
+        if item is None:
+            return [], True
+
+        batch          = [item]
+        deadline       = self._loop.time() + self.max_latency
+
+        while len(batch) < self.max_batch_size:
+            timeout    = deadline - self._loop.time()
+
+            try:
+                if timeout > 0.:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                else:
+                    item = self._queue.get_nowait()
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+
+            if item is None:
+                return batch, True
+
+            batch.append(item)
+
+        return batch, False
+
+    async def _run(self):
+        done                 = False
+
+        while not done:
+            batch, done      = await self._next_batch()
+            batch            = [
+                (x, future) for x, future in batch if not future.cancelled()
+            ]
+
+            if not batch:
+                continue
+
+            xs, futures      = zip(*batch)
+
+            await self._process(xs, futures)
+
+            n_samples        = len(futures)
+            self.n_batches_ += 1
+            self.n_records_ += n_samples
+            self.max_observed_batch_size_ = max(
+                self.max_observed_batch_size_, n_samples
+            )
+
+    async def _process(self, xs, futures):
+        """Score a batch, and resolve the futures of its records. If the
+        batch fails, its records are scored one at a time, so that only the
+        futures of the offending records receive the exception.
+        """
+
+        try:
+            result = await self._loop.run_in_executor(
+                self.executor, self._score, np.vstack(xs)
+            )
+        except Exception as e:
+            if len(xs) > 1:
+                for x, future in zip(xs, futures):
+                    await self._process([x], [future])
+
+                return
+
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for i, future in enumerate(futures):
+                if not future.done():
+                    future.set_result(Bunch(**{
+                        name: result[name][i].tolist()
+                        for name in self.outputs
+                    }))
+
+    def _score(self, X):
+        return self.detector.score_batch(X, outputs=self.outputs)
+
+
+class _RequestTooLarge(Exception):
+    """Raised when Content-Length is out of the accepted range."""
+
+
+async def _handle_http(scorer, reader, writer, max_content_length):
+    """Serve a single HTTP request."""
+
+    try:
+        request_line         = await reader.readline()
+        method, path, _      = request_line.decode('latin-1').split(' ', 2)
+        headers              = {}
+
+        while True:
+            line             = await reader.readline()
+
+            if line in (b'\r\n', b'\n', b''):
+                break
+
+            name, _, value   = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        content_length       = int(headers.get('content-length', 0))
+
+        if not 0 <= content_length <= max_content_length:
+            raise _RequestTooLarge(content_length)
+
+        body                 = await reader.readexactly(content_length)
+    except _RequestTooLarge as e:
+        status, payload      = 400, {
+            'error': f'Content-Length must be in [0, {max_content_length}] '
+            f'but was {e}'
+        }
+    except (ValueError, asyncio.IncompleteReadError):
+        status, payload      = 400, {'error': 'malformed request'}
+    else:
+        status, payload      = await _route(scorer, method, path, body)
+
+    content                  = json.dumps(payload).encode()
+
+    writer.write(
+        f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+        f'Content-Type: application/json\r\n'
+        f'Content-Length: {len(content)}\r\n'
+        f'Connection: close\r\n\r\n'.encode('latin-1') + content
+    )
+
+    try:
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def _route(scorer, method, path, body):
+    """Dispatch an HTTP request, and return the status and the payload."""
+
+    if method == 'GET' and path == '/metrics':
+        return 200, scorer.metrics()
+
+    if method != 'POST' or path != '/score':
+        return 404, {'error': f'{method} {path} is not found'}
+
+    try:
+        records = json.loads(body.decode())['X']
+    except (ValueError, KeyError, TypeError):
+        return 400, {'error': 'body must be a JSON object with a key "X"'}
+
+    if not isinstance(records, list) \
+            or not all(isinstance(x, list) for x in records):
+        return 400, {'error': '"X" must be a list of lists'}
+
+    try:
+        results = await asyncio.gather(*[scorer.submit(x) for x in records])
+    except ValueError as e:
+        return 400, {'error': str(e)}
+    except Exception as e:
+        return 500, {'error': str(e)}
+
+    return 200, {
+        name: [result[name] for result in results] for name in scorer.outputs
+    }
+
+
+async def start_http_server(
+    scorer, host='127.0.0.1', port=8000,
+    max_content_length=MAX_CONTENT_LENGTH
+):
+    """Start a minimal HTTP/1.1 front end for a started micro-batching
+    scorer, which only depends on the standard library.
+
+    ``POST /score`` with a JSON body ``{"X": [[...], ...]}`` submits each
+    record to the scorer and returns the outputs for each record.
+    ``GET /metrics`` returns the queue depth and batch-size statistics.
+
+    Parameters
+    ----------
+    scorer : MicroBatchScorer
+        Started micro-batching scorer.
+
+    host : str, default '127.0.0.1'
+        Host to bind.
+
+    port : int, default 8000
+        Port to bind. If 0, an arbitrary free port is chosen.
+
+    max_content_length : int, default 1048576
+        Maximum size of a request body in bytes. A request with a larger
+        ``Content-Length`` is rejected with 400 without reading its body.
+
+    Returns
+    -------
+    server : asyncio.AbstractServer
+        Server object.
+    """
+
+    def handle(reader, writer):
+        return _handle_http(scorer, reader, writer, max_content_length)
+
+    return await asyncio.start_server(handle, host=host, port=port)
@@ -0,0 +1,267 @@
+import numpy as np
+from sklearn.utils import check_random_state
+
+__all__ = ['KLLSketch']
+
+
+class KLLSketch:
+    """Mergeable quantile sketch, which summarizes a stream of values in
+    sublinear memory. Running moments of the values are also tracked, so that
+    a normal distribution can be fitted without retaining the values.
+
+    Parameters
+    ----------
+    k : int, default 200
+        Parameter that controls the accuracy and the memory footprint. The
+        rank error decreases roughly as 1 / k, and about 3 * k values are
+        retained.
+
+    random_state : int or RandomState instance, default None
+        Seed of the pseudo random number generator used when compacting
+        values.
+
+    Attributes
+    ----------
+    n_samples_ : int
+        Number of the values seen so far.
+
+    mean_ : float
+        Mean of the values seen so far.
+
+    var_ : float
+        Variance of the values seen so far.
+
+    min_ : float
+        Minimum of the values seen so far.
+
+    max_ : float
+        Maximum of the values seen so far.
+
+    References
+    ----------
+    .. [#karnin16] Karnin, Z., Lang, K., and Liberty, E.,
+        "Optimal quantile approximation in streams,"
+        In Proceedings of FOCS, pp. 71-78, 2016.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from kenchi.sketch import KLLSketch
+    >>> sketch = KLLSketch(random_state=0)
+    >>> for chunk in np.array_split(np.arange(100000.), 10):
+    ...     sketch = sketch.update(chunk)
+    >>> sketch.n_samples_
+    100000
+    >>> abs(sketch.quantile(0.9) - 90000.) < 2000.
+    True
+    """
+
+    @property
+    def n_retained_(self):
+        """int: Number of the values retained in the sketch."""
+
+        return sum(compactor.size for compactor in self._compactors)
+
+    @property
+    def std_(self):
+        """float: Standard deviation of the values seen so far."""
+
+        return np.sqrt(self.var_)
+
+    def __init__(self, k=200, random_state=None):
+        if k < 2:
+            raise ValueError(f'k must be greater than 1 but was {k}')
+
+        self.k             = k
+        self.random_state  = random_state
+
+        self.n_samples_    = 0
+        self.mean_         = 0.
+        self.var_          = 0.
+        self.min_          = np.inf
+        self.max_          = -np.inf
+
+        self._compactors   = [np.empty(0)]
+        self._rnd          = check_random_state(random_state)
+
+    def _capacity(self, h):
+        """Get the capacity of the compactor at the given level."""
+
+        n_levels = len(self._compactors)
+
+        return max(2, int(np.ceil(self.k * (2. / 3.) ** (n_levels - h - 1))))
+
+    def _compress(self):
+        """Compact the compactors until none of them exceeds its capacity."""
+
+        h                            = 0
+
+        while h < len(self._compactors):
+            compactor                = self._compactors[h]
+
+            if compactor.size <= self._capacity(h):
+                h                   += 1
+
+                continue
+
+            if h + 1 == len(self._compactors):
+                self._compactors.append(np.empty(0))
+
+            compactor                = np.sort(compactor)
+            n_paired                 = compactor.size - compactor.size % 2
+            offset                   = self._rnd.randint(2)
+
+            # half of the paired values are promoted with the doubled weight,
+            # and the unpaired value stays at the current level
+            self._compactors[h + 1]  = np.concatenate([
+                self._compactors[h + 1], compactor[offset:n_paired:2]
+            ])
+            self._compactors[h]      = compactor[n_paired:]
+
+            # capacities of the lower levels shrink when a level is added
+            h                        = 0
+
+    def _merge_moments(self, n_samples, mean, var, data_min, data_max):
+        """Merge the moments of another set of values into the sketch."""
+
+        n_samples_total = self.n_samples_ + n_samples
+        delta           = mean - self.mean_
+
+        scatter         = self.n_samples_ * self.var_ + n_samples * var \
+            + delta ** 2 * self.n_samples_ * n_samples / n_samples_total
+
+        self.var_       = scatter / n_samples_total
+        self.mean_     += delta * n_samples / n_samples_total
+        self.n_samples_ = n_samples_total
+        self.min_       = min(self.min_, data_min)
+        self.max_       = max(self.max_, data_max)
+
+    def _weighted_values(self):
+        """Get the sorted retained values and their cumulative weights."""
+
+        values       = np.concatenate(self._compactors)
+        weights      = np.concatenate([
+            np.full(compactor.size, 2 ** h)
+            for h, compactor in enumerate(self._compactors)
+        ])
+        order        = np.argsort(values, kind='mergesort')
+
+        return values[order], np.cumsum(weights[order])
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Parameters
+        ----------
+        values : array-like
+            Values.
+
+        Returns
+        -------
+        self : KLLSketch
+            Return self.
+        """
+
+        values              = np.ravel(np.asarray(values, dtype=np.float64))
+
+        if values.size == 0:
+            return self
+
+        self._merge_moments(
+            values.size, np.mean(values), np.var(values),
+            np.min(values), np.max(values)
+        )
+
+        self._compactors[0] = np.concatenate([self._compactors[0], values])
+
+        self._compress()
+
+        return self
+
+    def merge(self, other):
+        """Merge another sketch into the sketch.
+
+        Parameters
+        ----------
+        other : KLLSketch
+            Sketch.
+
+        Returns
+        -------
+        self : KLLSketch
+            Return self.
+        """
+
+        if other.n_samples_ == 0:
+            return self
+
+        self._merge_moments(
+            other.n_samples_, other.mean_, other.var_, other.min_, other.max_
+        )
+
+        for h, compactor in enumerate(other._compactors):
+            if h == len(self._compactors):
+                self._compactors.append(np.empty(0))
+
+            self._compactors[h] = np.concatenate([
+                self._compactors[h], compactor
+            ])
+
+        self._compress()
+
+        return self
+
+    def quantile(self, q):
+        """Estimate the quantiles of the values seen so far. If the values
+        have not been compacted yet, the result is identical to that of
+        ``np.percentile(values, 100. * q, interpolation='lower')``.
+
+        Parameters
+        ----------
+        q : float or array-like
+            Quantiles to compute, which must be between 0 and 1 inclusive.
+
+        Returns
+        -------
+        quantile : float or array-like
+            Estimated quantiles.
+        """
+
+        if self.n_samples_ == 0:
+            raise ValueError('the sketch is empty')
+
+        q                   = np.asarray(q, dtype=np.float64)
+
+        if np.any((q < 0.) | (q > 1.)):
+            raise ValueError(f'q must be in [0, 1] but was {q}')
+
+        values, cum_weights = self._weighted_values()
+        ind                 = np.searchsorted(
+            cum_weights, np.floor(q * (self.n_samples_ - 1)) + 1
+        )
+
+        return values[np.minimum(ind, values.size - 1)]
+
+    def cdf(self, x):
+        """Estimate the proportion of the values seen so far which are less
+        than or equal to the given values.
+
+        Parameters
+        ----------
+        x : float or array-like
+            Values.
+
+        Returns
+        -------
+        cdf : float or array-like
+            Estimated proportions.
+        """
+
+        if self.n_samples_ == 0:
+            raise ValueError('the sketch is empty')
+
+        values, cum_weights = self._weighted_values()
+        ind                 = np.searchsorted(values, x, side='right')
+        cum_weights         = np.concatenate([[0], cum_weights])
+
+        return cum_weights[ind] / self.n_samples_
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+import scipy.sparse as sp
 from kenchi.datasets import make_blobs
 from sklearn.base import BaseEstimator
 from sklearn.exceptions import NotFittedError
@@ -11,6 +12,9 @@ from sklearn.utils.testing import if_matplotlib
 
 
 class OutlierDetectorTestMixin:
+    accepts_sparse    = False
+    preserves_float32 = False
+
     def prepare_data(self):
         X, y              = make_blobs(
             centers       = 1,
@@ -88,6 +92,108 @@ class OutlierDetectorTestMixin:
         self.assertEqual(anomaly_score.shape, self.y_test.shape)
         self.assertGreaterEqual(np.min(anomaly_score), 0.)
 
+    def test_score_batch(self):
+        if hasattr(self.sut, 'novelty'):
+            self.sut.set_params(novelty=True)
+
+        self.sut.fit(self.X_train)
+
+        n_samples, _ = self.X_test.shape
+        out          = {
+            'decision_function': np.empty(n_samples),
+            'predict_proba':     np.empty((n_samples, 2))
+        }
+        result       = self.sut.score_batch(self.X_test, out=out)
+
+        np.testing.assert_allclose(
+            result.anomaly_score, self.sut.anomaly_score(self.X_test)
+        )
+        np.testing.assert_allclose(
+            result.decision_function, self.sut.decision_function(self.X_test)
+        )
+        np.testing.assert_array_equal(
+            result.predict, self.sut.predict(self.X_test)
+        )
+        np.testing.assert_allclose(
+            result.predict_proba, self.sut.predict_proba(self.X_test)
+        )
+
+        self.assertIs(result.decision_function, out['decision_function'])
+        self.assertIs(result.predict_proba, out['predict_proba'])
+
+    def test_score_batch_training(self):
+        self.sut.fit(self.X_train)
+
+        result = self.sut.score_batch()
+
+        if hasattr(self.sut, 'anomaly_score_'):
+            self.assertIsNot(result.anomaly_score, self.sut.anomaly_score_)
+
+        np.testing.assert_array_equal(
+            result.anomaly_score, self.sut.anomaly_score()
+        )
+
+    def test_score_batch_invalid_out(self):
+        if hasattr(self.sut, 'novelty'):
+            self.sut.set_params(novelty=True)
+
+        self.sut.fit(self.X_train)
+
+        for kwargs in [
+            {'outputs': ('median', )},
+            {'out': {'predict': np.empty(1, dtype=int)}}
+        ]:
+            with self.assertRaises(ValueError):
+                self.sut.score_batch(self.X_test, **kwargs)
+
+    def test_compile(self):
+        if hasattr(self.sut, 'novelty'):
+            self.sut.set_params(novelty=True)
+
+        self.sut.fit(self.X_train)
+
+        scorer        = self.sut.compile()
+        anomaly_score = self.sut.anomaly_score(self.X_test)
+
+        np.testing.assert_allclose(
+            scorer.score_many(self.X_test), anomaly_score, atol=1e-08
+        )
+        np.testing.assert_allclose(
+            scorer.score_one(self.X_test[0]), anomaly_score[0], atol=1e-08
+        )
+
+    def test_float32(self):
+        if hasattr(self.sut, 'novelty'):
+            self.sut.set_params(novelty=True)
+
+        X_train       = self.X_train.astype(np.float32)
+        X_test        = self.X_test.astype(np.float32)
+        anomaly_score = self.sut.fit(self.X_train).anomaly_score(self.X_test)
+        score_float32 = self.sut.fit(X_train).anomaly_score(X_test)
+
+        if self.preserves_float32:
+            self.assertEqual(score_float32.dtype, np.float32)
+
+        np.testing.assert_allclose(
+            score_float32, anomaly_score, rtol=1e-03, atol=1e-03
+        )
+
+    def test_sparse(self):
+        if not self.accepts_sparse:
+            raise unittest.SkipTest('sparse input is not supported')
+
+        if hasattr(self.sut, 'novelty'):
+            self.sut.set_params(novelty=True)
+
+        X_train       = sp.csr_matrix(self.X_train)
+        X_test        = sp.csr_matrix(self.X_test)
+        anomaly_score = self.sut.fit(self.X_train).anomaly_score(self.X_test)
+        score_sparse  = self.sut.fit(X_train).anomaly_score(X_test)
+
+        np.testing.assert_allclose(
+            score_sparse, anomaly_score, rtol=1e-06, atol=1e-06
+        )
+
     def test_roc_auc_score(self):
         if hasattr(self.sut, 'novelty'):
             self.sut.set_params(novelty=True)
@@ -146,6 +252,12 @@ class OutlierDetectorTestMixin:
     def test_anomaly_score_notfitted(self):
         self.assertRaises(NotFittedError, self.sut.anomaly_score, self.X_test)
 
+    def test_compile_notfitted(self):
+        self.assertRaises(NotFittedError, self.sut.compile)
+
+    def test_score_batch_notfitted(self):
+        self.assertRaises(NotFittedError, self.sut.score_batch, self.X_test)
+
     @if_matplotlib
     def test_plot_anomaly_score_notfitted(self):
         self.assertRaises(
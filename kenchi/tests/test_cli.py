@@ -0,0 +1,184 @@
+import contextlib
+import doctest
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+from kenchi import cli
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import HBOS, SparseStructureLearning
+from kenchi.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(cli))
+
+    return tests
+
+
+class CLITest(unittest.TestCase):
+    def setUp(self):
+        self.X, _   = make_blobs(
+            centers = 1, n_features=2, n_samples=500, random_state=0
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.npy    = self.path('X.npy')
+        self.csv    = self.path('X.csv')
+        self.det    = make_pipeline(StandardScaler(), HBOS(novelty=True))
+
+        np.save(self.npy, self.X)
+        np.savetxt(
+            self.csv, self.X, delimiter=',', fmt='%.17g', header='a,b',
+            comments=''
+        )
+
+        self.det.fit(self.X)
+        self.det.to_pickle(self.path('model.pkl'))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, basename):
+        return os.path.join(self.tmpdir.name, basename)
+
+    def run_main(self, *argv):
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(cli.main(list(argv)), 0)
+
+        return stderr.getvalue()
+
+    def assert_error(self, status, *argv):
+        with contextlib.redirect_stderr(io.StringIO()) as stderr, \
+                self.assertRaises(SystemExit) as cm:
+            cli.main(list(argv))
+
+        self.assertEqual(cm.exception.code, status)
+        self.assertNotIn('Traceback', stderr.getvalue())
+
+        return stderr.getvalue()
+
+    def read_output(self, filename):
+        with open(filename) as f:
+            self.assertEqual(f.readline().strip(), 'anomaly_score,predict')
+
+        return np.loadtxt(filename, delimiter=',', skiprows=1)
+
+    def assert_output(self, filename):
+        output = self.read_output(filename)
+
+        np.testing.assert_allclose(
+            output[:, 0], self.det.anomaly_score(self.X)
+        )
+        np.testing.assert_array_equal(output[:, 1], self.det.predict(self.X))
+
+    def test_score_npy(self):
+        stderr = self.run_main(
+            'score', self.path('model.pkl'), self.npy,
+            '--output', self.path('out.csv'), '--chunk-size', '64'
+        )
+
+        self.assert_output(self.path('out.csv'))
+        self.assertIn('500 samples', stderr)
+
+    def test_score_csv(self):
+        self.run_main(
+            'score', self.path('model.pkl'), self.csv, '--skip-header', '1',
+            '--output', self.path('out.csv'), '--chunk-size', '64'
+        )
+
+        self.assert_output(self.path('out.csv'))
+
+    def test_score_stdin(self):
+        with open(self.csv) as f, \
+                contextlib.redirect_stdout(io.StringIO()) as stdout:
+            sys.stdin, stdin = f, sys.stdin
+
+            try:
+                self.run_main(
+                    'score', self.path('model.pkl'), '-', '--skip-header',
+                    '1', '--outputs', 'predict'
+                )
+            finally:
+                sys.stdin = stdin
+
+        lines = stdout.getvalue().split()
+
+        self.assertEqual(lines[0], 'predict')
+        np.testing.assert_array_equal(
+            np.array(lines[1:], dtype=int), self.det.predict(self.X)
+        )
+
+    def test_score_parallel(self):
+        self.det.to_directory(self.path('model'))
+
+        self.run_main(
+            'score', self.path('model'), self.npy,
+            '--output', self.path('out.csv'), '--chunk-size', '64',
+            '--n-jobs', '2'
+        )
+
+        self.assert_output(self.path('out.csv'))
+
+    def test_fit_chunks(self):
+        self.run_main(
+            'fit', 'SparseStructureLearning', self.npy, self.path('ssl.pkl'),
+            '--chunk-size', '64', '--param', 'assume_centered=false'
+        )
+
+        det = cli.load_model(self.path('ssl.pkl'))
+
+        np.testing.assert_allclose(
+            det.anomaly_score_,
+            SparseStructureLearning().fit(self.X).anomaly_score_,
+            rtol=1e-06
+        )
+
+    def test_fit(self):
+        self.run_main(
+            'fit', 'HBOS', self.csv, self.path('model'), '--skip-header', '1',
+            '--format', 'directory', '--param', 'bins=10', '--sketch'
+        )
+
+        det = cli.load_model(self.path('model'))
+
+        self.assertEqual(det.bins, 10)
+        self.assertTrue(det.novelty)
+        self.assertEqual(det.score_sketch_.n_samples_, 500)
+
+    def test_fit_novelty(self):
+        self.run_main('fit', 'HBOS', self.npy, self.path('hbos.pkl'))
+        self.run_main(
+            'score', self.path('hbos.pkl'), self.npy,
+            '--output', self.path('out.csv')
+        )
+
+        self.assertTrue(cli.load_model(self.path('hbos.pkl')).novelty)
+
+    def test_score_without_novelty(self):
+        self.run_main(
+            'fit', 'HBOS', self.npy, self.path('hbos.pkl'),
+            '--param', 'novelty=false'
+        )
+
+        stderr = self.assert_error(
+            1, 'score', self.path('hbos.pkl'), self.npy
+        )
+
+        self.assertIn('novelty=False', stderr)
+
+    def test_fit_unknown_detector(self):
+        self.assert_error(2, 'fit', 'Nope', self.npy, self.path('nope.pkl'))
+
+    def test_ragged_csv(self):
+        with open(self.path('ragged.csv'), 'w') as f:
+            f.write('0,0\n1,1\n2,2,2\n')
+
+        stderr = self.assert_error(
+            1, 'score', self.path('model.pkl'), self.path('ragged.csv')
+        )
+
+        self.assertIn('line 3', stderr)
@@ -0,0 +1,90 @@
+import doctest
+import tracemalloc
+import unittest
+
+import numpy as np
+from kenchi import instrumentation
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import HBOS, SparseStructureLearning
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(instrumentation))
+
+    return tests
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = make_blobs(
+            centers = 1, n_features=2, n_samples=100, random_state=0
+        )
+        self.sut  = HBOS(novelty=True)
+
+    def tearDown(self):
+        instrumentation.disable_instrumentation()
+
+    def test_disabled(self):
+        self.sut.fit(self.X).predict(self.X)
+
+        self.assertFalse(hasattr(self.sut, 'fit_stats_'))
+        self.assertFalse(hasattr(self.sut, 'last_call_stats_'))
+
+    def test_fit_stats(self):
+        instrumentation.enable_instrumentation()
+
+        self.sut.fit(self.X)
+
+        stats = self.sut.fit_stats_
+
+        self.assertEqual(stats.method, 'fit')
+        self.assertEqual(stats.n_samples, 100)
+        self.assertIsNone(stats.allocated_bytes)
+        self.assertGreaterEqual(
+            stats.wall_time,
+            sum(stage.wall_time for stage in stats.stages.values())
+        )
+        self.assertEqual(stats.stages['anomaly_score'].n_samples, 100)
+
+    def test_last_call_stats(self):
+        calls = []
+
+        with instrumentation.instrumentation_context(
+            lambda det, stats: calls.append((det, stats))
+        ):
+            self.sut.fit(self.X)
+            self.sut.predict_proba(self.X[:10])
+
+        self.sut.predict(self.X)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIs(calls[1][0], self.sut)
+        self.assertIs(calls[1][1], self.sut.last_call_stats_)
+        self.assertEqual(self.sut.last_call_stats_.n_samples, 10)
+        self.assertEqual(
+            list(self.sut.last_call_stats_.stages),
+            ['check_array', 'anomaly_score', 'normalize']
+        )
+
+    def test_allocated_bytes(self):
+        instrumentation.enable_instrumentation()
+        tracemalloc.start()
+
+        try:
+            self.sut.fit(self.X)
+        finally:
+            tracemalloc.stop()
+
+        self.assertIsInstance(self.sut.fit_stats_.allocated_bytes, int)
+
+    def test_fit_chunks(self):
+        instrumentation.enable_instrumentation()
+
+        sut   = SparseStructureLearning()
+
+        sut.fit_chunks(np.array_split(self.X, 3))
+
+        stats = sut.fit_stats_
+
+        self.assertEqual(stats.n_samples, 100)
+        self.assertEqual(stats.stages['fit'].n_samples, 100)
@@ -0,0 +1,143 @@
+import doctest
+import unittest
+
+import numpy as np
+from kenchi import metrics
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import MiniBatchKMeans
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(metrics))
+
+    return tests
+
+
+class NegativeMVAUCScorerTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _        = make_blobs(
+            centers      = 1,
+            n_features   = 2,
+            random_state = 0
+        )
+        self.det         = MiniBatchKMeans(n_clusters=1, random_state=0)
+        self.sut         = metrics.NegativeMVAUCScorer(
+            data_max     = np.max(self.X, axis=0),
+            data_min     = np.min(self.X, axis=0),
+            random_state = 0
+        )
+
+        self.det.fit(self.X)
+
+    def test_mv_curve(self):
+        rnd                   = np.random.RandomState(0)
+        score_samples         = rnd.normal(size=100)
+        score_uniform_samples = rnd.normal(size=1000)
+        data_volume           = np.prod(self.sut.data_max - self.sut.data_min)
+
+        mass, volume, offsets = self.sut._mv_curve(
+            score_samples, score_uniform_samples, data_volume
+        )
+
+        np.testing.assert_allclose(
+            offsets, np.percentile(score_samples, 100. * (1. - mass))
+        )
+        np.testing.assert_allclose(
+            volume, [
+                np.mean(score_uniform_samples >= offset) * data_volume
+                for offset in offsets
+            ]
+        )
+
+    def test_call(self):
+        score = self.sut(self.det, self.X)
+
+        self.assertLessEqual(score, 0.)
+        self.assertEqual(score, self.sut(self.det, self.X))
+
+    def test_uniform_samples_cache(self):
+        data_max, data_min = self.sut._get_hypercube(self.X)
+        size               = (self.sut.n_uniform_samples, 2)
+        U                  = metrics._draw_uniform_samples(
+            self.sut.internal_state, data_max, data_min, size
+        )
+        scorer             = metrics.EMAUCScorer(
+            data_max       = self.sut.data_max,
+            data_min       = self.sut.data_min,
+            random_state   = 0
+        )
+
+        self.assertIs(
+            U, metrics._draw_uniform_samples(
+                scorer.internal_state, data_max, data_min, size
+            )
+        )
+
+    def test_uniform_samples_cache_bytes(self):
+        data_max, data_min = self.sut._get_hypercube(self.X)
+        n_uniform_samples  = metrics.MAX_CACHED_UNIFORM_SAMPLES_BYTES // 32
+
+        for n_features in [2, 3]:
+            metrics._draw_uniform_samples(
+                self.sut.internal_state,
+                np.repeat(data_max[0], n_features),
+                np.repeat(data_min[0], n_features),
+                (n_uniform_samples, n_features)
+            )
+
+        self.assertLessEqual(
+            sum(U.nbytes for U in metrics._uniform_samples_cache.values()),
+            metrics.MAX_CACHED_UNIFORM_SAMPLES_BYTES
+        )
+
+    def test_call_zero_volume(self):
+        X       = self.X.copy()
+        X[:, 1] = 0.
+        sut     = metrics.NegativeMVAUCScorer(random_state=0)
+
+        self.det.fit(X)
+
+        with self.assertRaises(ValueError):
+            sut(self.det, X)
+
+
+class EMAUCScorerTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _        = make_blobs(
+            centers      = 1,
+            n_features   = 2,
+            random_state = 0
+        )
+        self.det         = MiniBatchKMeans(n_clusters=1, random_state=0)
+        self.sut         = metrics.EMAUCScorer(random_state=0)
+
+        self.det.fit(self.X)
+
+    def test_em_curve(self):
+        rnd                   = np.random.RandomState(0)
+        score_samples         = rnd.normal(size=100)
+        score_uniform_samples = rnd.normal(size=1000)
+        data_volume           = 10.
+
+        thresholds, em        = self.sut._em_curve(
+            score_samples, score_uniform_samples, data_volume
+        )
+
+        self.assertEqual(em[0], 1.)
+        self.assertTrue(np.all(np.diff(em) <= 0.))
+        self.assertEqual(thresholds.shape, em.shape)
+
+    def test_call(self):
+        score = self.sut(self.det, self.X)
+
+        self.assertGreater(score, 0.)
+        self.assertEqual(score, self.sut(self.det, self.X))
+
+    def test_call_zero_volume(self):
+        X       = self.X.copy()
+        X[:, 1] = 0.
+
+        self.det.fit(X)
+
+        with self.assertRaises(ValueError):
+            self.sut(self.det, X)
@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+from kenchi import normalization
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import MiniBatchKMeans
+from kenchi.sketch import KLLSketch
+from scipy.stats import gamma, norm
+
+
+class NormalizerTest(unittest.TestCase):
+    def setUp(self):
+        rnd                = np.random.RandomState(0)
+        self.anomaly_score = rnd.gamma(2., size=1000)
+
+    def test_gaussian(self):
+        sut = normalization.GaussianNormalizer().fit(self.anomaly_score)
+        rv  = norm(*norm.fit(self.anomaly_score))
+
+        np.testing.assert_allclose(
+            sut.cdf(self.anomaly_score), rv.cdf(self.anomaly_score)
+        )
+
+    def test_gamma(self):
+        sut  = normalization.GammaNormalizer().fit(self.anomaly_score)
+        loc  = np.min(self.anomaly_score)
+        mean = np.mean(self.anomaly_score) - loc
+        var  = np.var(self.anomaly_score)
+        rv   = gamma(mean ** 2 / var, loc=loc, scale=var / mean)
+
+        np.testing.assert_allclose(
+            sut.cdf(self.anomaly_score), rv.cdf(self.anomaly_score)
+        )
+
+    def test_gamma_constant(self):
+        sut = normalization.GammaNormalizer()
+
+        self.assertRaises(ValueError, sut.fit, np.ones(10))
+        self.assertRaises(
+            ValueError, sut.fit_sketch, KLLSketch().update(np.ones(10))
+        )
+
+    def test_rank(self):
+        sut = normalization.RankNormalizer().fit(self.anomaly_score)
+        cdf = sut.cdf(self.anomaly_score)
+
+        self.assertEqual(np.min(cdf), 0.)
+        self.assertEqual(np.max(cdf), 1.)
+        self.assertLess(np.abs(np.mean(cdf) - 0.5), 0.01)
+
+    def test_fit_sketch(self):
+        sketch = KLLSketch().update(self.anomaly_score)
+
+        for name, normalizer in normalization.NORMALIZERS.items():
+            np.testing.assert_allclose(
+                normalizer().fit_sketch(sketch).cdf(self.anomaly_score),
+                normalizer().fit(self.anomaly_score).cdf(self.anomaly_score),
+                atol=1e-02
+            )
+
+    def test_normalize_float32(self):
+        anomaly_score = self.anomaly_score.astype(np.float32)
+        sut           = normalization.GaussianNormalizer().fit(anomaly_score)
+        normalized    = sut.normalize(anomaly_score)
+
+        self.assertEqual(normalized.dtype, np.float32)
+        self.assertGreaterEqual(np.min(normalized), 0.)
+        self.assertLessEqual(np.max(normalized), 1.)
+
+
+class PredictProbaTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = make_blobs(
+            centers = 1, n_features=2, n_samples=100, random_state=0
+        )
+        self.sut  = MiniBatchKMeans(random_state=0).fit(self.X)
+
+    def test_predict_proba(self):
+        for name in normalization.NORMALIZERS:
+            y_score = self.sut.predict_proba(self.X, normalize=name)
+
+            np.testing.assert_allclose(np.sum(y_score, axis=1), 1.)
+            np.testing.assert_allclose(
+                y_score[:, 0], self.sut.anomaly_score(self.X, normalize=name)
+            )
+            np.testing.assert_allclose(
+                self.sut.score_batch(self.X, normalize=name).predict_proba,
+                y_score
+            )
+
+    def test_normalizers_read_only(self):
+        self.assertEqual(list(self.sut.normalizers_), ['gaussian'])
+
+        self.sut.predict_proba(self.X, normalize='rank')
+
+        self.assertEqual(list(self.sut.normalizers_), ['gaussian'])
+
+    def test_random_variable(self):
+        normalizer = self.sut.normalizers_['gaussian']
+
+        self.assertEqual(self.sut.random_variable_.mean(), normalizer.loc_)
+        self.assertEqual(self.sut.random_variable_.std(), normalizer.scale_)
+
+    def test_predict_proba_invalid(self):
+        self.assertRaises(
+            ValueError, self.sut.predict_proba, self.X, normalize='beta'
+        )
@@ -0,0 +1,65 @@
+import doctest
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from kenchi import persistence
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import KNN, HBOS
+from kenchi.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(persistence))
+
+    return tests
+
+
+class PersistenceTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _   = make_blobs(
+            centers = 1, n_features=2, n_samples=500, random_state=0
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_to_directory(self):
+        det       = KNN(novelty=True).fit(self.X)
+        filenames = det.to_directory(self.tmpdir.name)
+        loaded    = persistence.load(self.tmpdir.name)
+
+        self.assertTrue(all(os.path.exists(f) for f in filenames))
+        self.assertIsInstance(loaded.X_, np.memmap)
+        self.assertFalse(loaded.X_.flags.writeable)
+        self.assertIs(loaded.X_, loaded.estimator_._fit_X)
+        np.testing.assert_array_equal(loaded.X_, det.X_)
+        np.testing.assert_allclose(loaded.anomaly_score(), det.anomaly_score())
+        np.testing.assert_allclose(
+            loaded.anomaly_score(self.X[:10]), det.anomaly_score(self.X[:10])
+        )
+
+    def test_to_directory_pipeline(self):
+        pipeline = make_pipeline(StandardScaler(), HBOS(novelty=True))
+
+        pipeline.fit(self.X).to_directory(self.tmpdir.name)
+
+        loaded   = persistence.load(self.tmpdir.name, mmap_mode=None)
+
+        np.testing.assert_array_equal(
+            loaded.predict(self.X), pipeline.predict(self.X)
+        )
+
+    def test_dump_min_nbytes(self):
+        det       = KNN(novelty=True).fit(self.X)
+        filenames = persistence.dump(
+            det, self.tmpdir.name, min_nbytes=self.X.nbytes + 1
+        )
+
+        self.assertEqual(len(filenames), 1)
+        self.assertNotIsInstance(
+            persistence.load(self.tmpdir.name).X_, np.memmap
+        )
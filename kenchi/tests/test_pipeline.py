@@ -1,6 +1,9 @@
 import doctest
+import pickle
 import unittest
 
+import numpy as np
+
 from kenchi import pipeline
 from kenchi.outlier_detection import SparseStructureLearning
 from kenchi.tests.common_tests import OutlierDetectorTestMixin
@@ -32,6 +35,63 @@ class PipelineTest(unittest.TestCase, OutlierDetectorTestMixin):
 
         self.assertEqual(anomaly_score.shape, self.X_test.shape)
 
+    def test_featurewise_anomaly_score_top_features(self):
+        self.sut.fit(self.X_train)
+
+        n_samples, _ = self.X_test.shape
+        top          = self.sut.featurewise_anomaly_score(
+            self.X_test, n_top_features=1
+        )
+
+        self.assertEqual(top.feature_ind.shape, (n_samples, 1))
+
+    def test_score_all(self):
+        self.sut.fit(self.X_train)
+
+        result = self.sut.score_all(self.X_test)
+
+        self.assertEqual(
+            sorted(result),
+            ['anomaly_score', 'decision_function', 'predict', 'predict_proba']
+        )
+
+    def test_transform_cache(self):
+        self.sut.set_params(transform_cache_size=2 ** 20)
+        self.sut.fit(self.X_train)
+
+        anomaly_score = self.sut.anomaly_score(self.X_test)
+
+        self.sut.predict(self.X_test)
+        self.sut.predict_proba(self.X_test)
+
+        self.assertEqual(len(self.sut._transform_cache), 1)
+
+        np.testing.assert_allclose(
+            self.sut.anomaly_score(self.X_test.copy()), anomaly_score
+        )
+
+        self.sut.fit(self.X_train)
+
+        self.assertIsNone(self.sut._transform_cache)
+
+        self.sut.anomaly_score(self.X_test)
+
+        sut = pickle.loads(pickle.dumps(self.sut))
+
+        self.assertFalse(hasattr(sut, '_transform_cache'))
+
+    def test_transform_cache_eviction(self):
+        self.sut.set_params(transform_cache_size=self.X_test.nbytes)
+        self.sut.fit(self.X_train)
+
+        self.sut.anomaly_score(self.X_test)
+        self.sut.anomaly_score(self.X_test[::-1])
+
+        self.assertEqual(len(self.sut._transform_cache), 1)
+        self.assertLessEqual(
+            self.sut._transform_cache.n_bytes, self.X_test.nbytes
+        )
+
     @if_matplotlib
     def test_plot_graphical_model(self):
         import matplotlib.pyplot as plt
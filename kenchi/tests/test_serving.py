@@ -0,0 +1,170 @@
+import asyncio
+import doctest
+import json
+import unittest
+
+import numpy as np
+from kenchi import serving
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import MiniBatchKMeans
+from kenchi.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(serving))
+
+    return tests
+
+
+class MicroBatchScorerTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _   = make_blobs(
+            centers = 1, n_features=2, n_samples=100, random_state=0
+        )
+        self.det    = MiniBatchKMeans(random_state=0).fit(self.X)
+        self.loop   = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_submit(self):
+        sut = serving.MicroBatchScorer(self.det, max_batch_size=32)
+
+        async def score():
+            await sut.start()
+
+            results = await asyncio.gather(*[sut.submit(x) for x in self.X])
+
+            await sut.stop()
+
+            return results
+
+        results   = self.loop.run_until_complete(score())
+        n_samples = len(self.X)
+
+        np.testing.assert_allclose(
+            [result.anomaly_score for result in results],
+            self.det.anomaly_score(self.X)
+        )
+        np.testing.assert_array_equal(
+            [result.predict for result in results], self.det.predict(self.X)
+        )
+
+        self.assertEqual(sut.n_records_, n_samples)
+        self.assertLess(sut.n_batches_, n_samples)
+        self.assertLessEqual(sut.max_observed_batch_size_, 32)
+        self.assertEqual(sut.metrics()['queue_depth'], 0)
+
+    def submit_all(self, sut, records):
+        async def score():
+            await sut.start()
+
+            results = await asyncio.gather(
+                *[sut.submit(x) for x in records], return_exceptions=True
+            )
+
+            await sut.stop()
+
+            return results
+
+        return self.loop.run_until_complete(score())
+
+    def test_submit_invalid_n_features(self):
+        sut     = serving.MicroBatchScorer(self.det)
+        records = [self.X[0], self.X[1, :1], self.X[2]]
+        results = self.submit_all(sut, records)
+
+        self.assertIsInstance(results[1], ValueError)
+        np.testing.assert_array_equal(
+            [results[0].predict, results[2].predict],
+            self.det.predict(self.X[[0, 2]])
+        )
+
+    def test_submit_invalid_n_features_pipeline(self):
+        det     = make_pipeline(
+            StandardScaler(), MiniBatchKMeans(random_state=0)
+        ).fit(self.X)
+        sut     = serving.MicroBatchScorer(det)
+        records = [self.X[0], self.X[1, :1], self.X[2]]
+        results = self.submit_all(sut, records)
+
+        self.assertIsInstance(results[1], ValueError)
+        np.testing.assert_array_equal(
+            [results[0].predict, results[2].predict],
+            det.predict(self.X[[0, 2]])
+        )
+
+    def test_submit_not_started(self):
+        sut = serving.MicroBatchScorer(self.det)
+
+        self.assertRaises(
+            RuntimeError, self.loop.run_until_complete, sut.submit(self.X[0])
+        )
+
+    def test_start_invalid_max_batch_size(self):
+        sut = serving.MicroBatchScorer(self.det, max_batch_size=0)
+
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete, sut.start()
+        )
+
+    def test_http_server(self):
+        sut = serving.MicroBatchScorer(self.det)
+
+        async def request(port, payload, content_length=None):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            body           = json.dumps(payload).encode()
+
+            if content_length is None:
+                content_length = len(body)
+
+            head           = (
+                f'POST /score HTTP/1.1\r\n'
+                f'Content-Length: {content_length}\r\n\r\n'
+            )
+
+            writer.write(head.encode() + body)
+
+            response       = await reader.read()
+
+            writer.close()
+
+            head, _, body  = response.partition(b'\r\n\r\n')
+
+            return head.split(b'\r\n')[0], json.loads(body.decode())
+
+        async def run():
+            await sut.start()
+
+            server         = await serving.start_http_server(
+                sut, port=0, max_content_length=4096
+            )
+            port           = server.sockets[0].getsockname()[1]
+
+            try:
+                ok         = await request(port, {'X': self.X[:5].tolist()})
+                bad        = [
+                    await request(port, {'x': []}),
+                    await request(port, {'X': self.X[0].tolist()}),
+                    await request(port, {'X': 1}),
+                    await request(port, {'X': []}, content_length=8192),
+                    await request(port, {'X': []}, content_length=-1)
+                ]
+            finally:
+                server.close()
+
+                await server.wait_closed()
+                await sut.stop()
+
+            return ok, bad
+
+        (status, body), bad = self.loop.run_until_complete(run())
+
+        self.assertEqual(status, b'HTTP/1.1 200 OK')
+        np.testing.assert_array_equal(
+            body['predict'], self.det.predict(self.X[:5])
+        )
+
+        for status_bad, _ in bad:
+            self.assertEqual(status_bad, b'HTTP/1.1 400 Bad Request')
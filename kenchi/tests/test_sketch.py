@@ -0,0 +1,108 @@
+import doctest
+import unittest
+
+import numpy as np
+from kenchi import sketch
+from kenchi.datasets import make_blobs
+from kenchi.outlier_detection import HBOS, OCSVM, SparseStructureLearning
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(sketch))
+
+    return tests
+
+
+class KLLSketchTest(unittest.TestCase):
+    def setUp(self):
+        self.rnd = np.random.RandomState(0)
+        self.sut = sketch.KLLSketch(random_state=0)
+
+    def test_quantile_exact(self):
+        values = self.rnd.normal(size=100)
+        q      = np.linspace(0., 1., 11)
+
+        self.sut.update(values)
+
+        np.testing.assert_array_equal(
+            self.sut.quantile(q),
+            np.percentile(values, 100. * q, interpolation='lower')
+        )
+
+    def test_quantile_compacted(self):
+        values = self.rnd.normal(size=100000)
+        q      = np.linspace(0.01, 0.99, 99)
+
+        for chunk in np.array_split(values, 100):
+            self.sut.update(chunk)
+
+        rank   = np.searchsorted(np.sort(values), self.sut.quantile(q))
+
+        self.assertLess(self.sut.n_retained_, 4 * self.sut.k)
+        self.assertLess(np.max(np.abs(rank / values.size - q)), 0.02)
+
+    def test_moments(self):
+        values = self.rnd.normal(size=1000)
+
+        for chunk in np.array_split(values, 7):
+            self.sut.update(chunk)
+
+        self.assertEqual(self.sut.n_samples_, values.size)
+        self.assertAlmostEqual(self.sut.mean_, np.mean(values))
+        self.assertAlmostEqual(self.sut.std_, np.std(values))
+        self.assertEqual(self.sut.min_, np.min(values))
+        self.assertEqual(self.sut.max_, np.max(values))
+
+    def test_merge(self):
+        values = self.rnd.normal(size=20000)
+        other  = sketch.KLLSketch(random_state=1).update(values[10000:])
+
+        self.sut.update(values[:10000]).merge(other)
+
+        self.assertEqual(self.sut.n_samples_, values.size)
+        self.assertAlmostEqual(self.sut.mean_, np.mean(values))
+        self.assertLess(
+            abs(self.sut.cdf(np.median(values)) - 0.5), 0.02
+        )
+
+    def test_quantile_empty(self):
+        self.assertRaises(ValueError, self.sut.quantile, 0.5)
+
+
+class FitSketchTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = make_blobs(
+            centers = 1, n_features=2, n_samples=100, random_state=0
+        )
+
+    def test_fit(self):
+        for det in [HBOS(novelty=True), OCSVM()]:
+            det.fit(self.X)
+
+            threshold_, contamination_ = det.threshold_, det.contamination_
+
+            det.fit(self.X, sketch=sketch.KLLSketch())
+
+            self.assertFalse(hasattr(det, 'anomaly_score_'))
+            self.assertEqual(det.threshold_, threshold_)
+            self.assertAlmostEqual(det.contamination_, contamination_)
+            self.assertRaises(ValueError, det.anomaly_score)
+
+            det.fit(self.X)
+
+            self.assertFalse(hasattr(det, 'score_sketch_'))
+
+    def test_fit_chunks(self):
+        det = SparseStructureLearning().fit(self.X)
+
+        det.fit_chunks(
+            [self.X[:50], self.X[50:]], sketch=sketch.KLLSketch()
+        )
+
+        self.assertFalse(hasattr(det, 'anomaly_score_'))
+        self.assertEqual(det.score_sketch_.n_samples_, 100)
+        np.testing.assert_array_equal(
+            det.predict(self.X), np.where(
+                det.anomaly_score(self.X) > det.threshold_, -1, 1
+            )
+        )
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+import unittest
+
+import kenchi
+from kenchi import outlier_detection
+from kenchi.utils import lazy_load
+
+
+class LazyLoadTest(unittest.TestCase):
+    def run_script(self, script):
+        return subprocess.check_output(
+            [sys.executable, '-c', script], stderr=subprocess.DEVNULL
+        ).decode().split()
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires PEP 562')
+    def test_import_kenchi(self):
+        modules = self.run_script(
+            'import sys, kenchi; '
+            'print(*[name for name in sys.modules if name.startswith('
+            '("kenchi.", "scipy.stats", "sklearn"))])'
+        )
+
+        self.assertEqual(modules, ['kenchi.utils'])
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires PEP 562')
+    def test_import_detector(self):
+        modules = self.run_script(
+            'import sys; from kenchi.outlier_detection import HBOS; '
+            'print(*[name for name in sys.modules if name.startswith('
+            '("kenchi.outlier_detection.", "sklearn.datasets"))])'
+        )
+
+        self.assertEqual(
+            sorted(modules),
+            ['kenchi.outlier_detection.base',
+             'kenchi.outlier_detection.statistical']
+        )
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires PEP 562')
+    def test_fit_detector(self):
+        modules = self.run_script(
+            'import sys; from kenchi.outlier_detection import HBOS; '
+            'HBOS().fit([[0.], [1.]]); '
+            'print(*[name for name in sys.modules if name in ('
+            '"scipy.stats", "sklearn.covariance", "sklearn.metrics", '
+            '"sklearn.svm")])'
+        )
+
+        self.assertEqual(modules, [])
+
+    def test_attributes(self):
+        self.assertIn('outlier_detection', dir(kenchi))
+        self.assertIn('HBOS', dir(outlier_detection))
+        self.assertIs(
+            outlier_detection.HBOS,
+            outlier_detection.statistical.HBOS
+        )
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            outlier_detection.NonExistentDetector
+
+    def test_lazy_load(self):
+        namespace = {'__name__': 'kenchi'}
+
+        lazy_load(namespace, submodules=['metrics'])
+
+        if sys.version_info >= (3, 7):
+            self.assertNotIn('metrics', namespace)
+            self.assertIs(
+                namespace['__getattr__']('metrics'), kenchi.metrics
+            )
+
+        self.assertIs(namespace['metrics'], kenchi.metrics)
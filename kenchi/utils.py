@@ -1,3 +1,7 @@
+import sys
+from importlib import import_module
+
+
 def check_contamination(contamination, low=0., high=0.5):
     """Raise ValueError if the contamination is not valid."""
 
@@ -21,3 +25,54 @@ def check_novelty(novelty, method):
             f'{method} is not available when novelty=False, use '
             f'novelty=True if you want to predict on new unseen data'
         )
+
+
+def lazy_load(namespace, submodules=(), attributes=None):
+    """Make the submodules and the attributes of a package loaded on first
+    access by a module-level ``__getattr__`` (PEP 562), so that importing the
+    package does not import its dependencies. On Python 3.6, which does not
+    support module-level ``__getattr__``, everything is loaded eagerly.
+
+    Parameters
+    ----------
+    namespace : dict
+        Global namespace of the package, i.e., ``globals()``.
+
+    submodules : iterable of str, default ()
+        Names of the submodules to be loaded lazily.
+
+    attributes : dict, default None
+        Mapping from the names of the attributes to be loaded lazily to the
+        names of the submodules which define them.
+    """
+
+    package    = namespace['__name__']
+    submodules = frozenset(submodules)
+
+    if attributes is None:
+        attributes = {}
+
+    def __getattr__(name):
+        if name in submodules:
+            value  = import_module(f'{package}.{name}')
+        elif name in attributes:
+            module = import_module(f'{package}.{attributes[name]}')
+            value  = getattr(module, name)
+        else:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}'
+            )
+
+        namespace[name] = value
+
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | submodules | set(attributes))
+
+    if sys.version_info < (3, 7):
+        for name in sorted(submodules | set(attributes)):
+            __getattr__(name)
+    else:
+        namespace['__getattr__'] = __getattr__
+        namespace['__dir__']     = __dir__